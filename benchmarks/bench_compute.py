@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# 生成应用的后台计算基准测试：把模板中的计算层（compute-pool.js 等）渲染到临时目录，用 Node 对不同大小的
+# JSON 数据集执行 parse → filter 与 parse → aggregate，分别在当前线程直接执行和交给计算线程池执行，
+# 记录总耗时与事件循环最长被阻塞的时间。只需要 node，不需要 npm 或 Electron
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCH_DIR.parent
+RESULTS_DIR = BENCH_DIR / 'results'
+
+sys.path.insert(0, str(REPO_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+import create_electron_project as scaffold  # noqa: E402
+from bench_scaffold import git_revision  # noqa: E402
+
+COMPUTE_FILES = ('compute-pool.js', 'compute-worker.js', 'static/js/compute-jobs.js')
+
+# 在生成的计算层上运行的测量脚本；命令行参数为各数据集的大小（MB），结果以一行 JSON 输出
+DRIVER = r'''
+const { createComputePool } = require('./compute-pool');
+const { execute } = require('./static/js/compute-jobs');
+
+const JOBS = {
+  filter: [{ op: 'parse' }, { op: 'filter', query: 'needle', fields: ['title'] }],
+  aggregate: [{ op: 'parse' }, { op: 'aggregate', groupBy: 'userId', sum: 'id' }]
+};
+
+function dataset(megabytes) {
+  const posts = [];
+  let length = 2;
+  for (let id = 0; length < megabytes * 1024 * 1024; id++) {
+    const post = { userId: id % 100, id, title: id % 97 === 0 ? `needle ${id}` : `title ${id}`, body: 'lorem ipsum dolor sit amet '.repeat(8) };
+    length += JSON.stringify(post).length + 1;
+    posts.push(post);
+  }
+  return JSON.stringify(posts);
+}
+
+// 每毫秒检查一次计时器，两次之间的最大间隔即事件循环被阻塞的最长时间
+async function measure(fn) {
+  let last = performance.now();
+  let maxGap = 0;
+  const timer = setInterval(() => {
+    const now = performance.now();
+    maxGap = Math.max(maxGap, now - last);
+    last = now;
+  }, 1);
+  const started = performance.now();
+  const records = await fn();
+  const ms = performance.now() - started;
+  await new Promise((resolve) => setTimeout(resolve, 5));
+  clearInterval(timer);
+  return { ms, maxBlockedMs: maxGap, records };
+}
+
+(async () => {
+  const pool = createComputePool();
+  const results = [];
+  for (const megabytes of process.argv.slice(2).map(Number)) {
+    const input = dataset(megabytes);
+    for (const [name, steps] of Object.entries(JOBS)) {
+      const inline = await measure(async () => {
+        let count = 0;
+        await execute({ input, steps }, (message) => {
+          if (message.chunk) count += message.chunk.length;
+          if (message.error) throw new Error(message.error);
+        });
+        return count;
+      });
+      const pooled = await measure(async () => {
+        let count = 0;
+        await pool.run({ input, steps }, { onChunk: (chunk) => { count += chunk.length; } });
+        return count;
+      });
+      results.push({ megabytes, job: name, inline, pool: pooled });
+    }
+  }
+  pool.destroy();
+  console.log(JSON.stringify({ poolSize: pool.size, results }));
+})();
+'''
+
+
+def render_compute_layer(target):
+    rendered = scaffold.render_project(icon_cache=None)
+    for rel_path in COMPUTE_FILES:
+        path = target / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rendered[rel_path], encoding='utf-8')
+    (target / 'driver.js').write_text(DRIVER, encoding='utf-8')
+
+
+def print_results(results):
+    cell = scaffold._cell
+    widths = [8, 10, 14, 16, 14, 16]
+    headers = ["数据(MB)", "任务", "直接执行(ms)", "最长阻塞(ms)", "线程池(ms)", "最长阻塞(ms)"]
+    print(cell(headers[0], widths[0], left=True) + ''.join(cell(h, w) for h, w in zip(headers[1:], widths[1:])))
+    for row in results['results']:
+        values = [row['job'], f"{row['inline']['ms']:.0f}", f"{row['inline']['maxBlockedMs']:.0f}",
+                  f"{row['pool']['ms']:.0f}", f"{row['pool']['maxBlockedMs']:.0f}"]
+        print(cell(str(row['megabytes']), widths[0], left=True) + ''.join(cell(v, w) for v, w in zip(values, widths[1:])))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="生成应用的计算线程池对事件循环阻塞时间的影响")
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1, 8, 32], help="数据集大小（MB）")
+    parser.add_argument('--node', default=shutil.which('node'), help="node 可执行文件（默认取 PATH 中的 node）")
+    parser.add_argument('--output', type=Path, help="结果 JSON 路径（默认 benchmarks/results/compute-<git 版本>.json）")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    if not options.node:
+        sys.exit("找不到 node，请用 --node 指定")
+    with tempfile.TemporaryDirectory(prefix='bench-compute-') as tmp:
+        render_compute_layer(Path(tmp))
+        result = subprocess.run([options.node, 'driver.js', *(f"{size:g}" for size in options.sizes)], cwd=tmp,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    report = json.loads(result.stdout.decode('utf-8').strip().splitlines()[-1])
+
+    revision = git_revision()
+    results = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "revision": revision,
+        "platform": f"{sys.platform}-{platform.machine()}",
+        "node": subprocess.run([options.node, '--version'], stdout=subprocess.PIPE, text=True).stdout.strip(),
+        "pool_size": report['poolSize'],
+        "results": report['results']
+    }
+    print_results(results)
+    output = options.output or RESULTS_DIR / f"compute-{revision or datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"\n结果已写入: {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# 生成应用的 IPC 基准测试：用 --ipc-bench 生成一个项目，设置 IPC_BENCH 用真实的 Electron 启动，
+# 页面对不同负载大小测量 invoke 往返延迟与每秒消息数（分别不合并与合并发送），完成后应用自行退出。
+# 需要可用的 node/npm 与图形环境（Linux 无显示器时可用 xvfb-run 运行本脚本）
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = BENCH_DIR / 'results'
+
+sys.path.insert(0, str(BENCH_DIR))
+from bench_scaffold import git_revision  # noqa: E402
+from bench_startup import create_variant, electron_binary, scaffold  # noqa: E402
+
+# 生成的 ipc-bench.js 在测量完成后输出这一行
+RESULT_PREFIX = 'IPC_BENCH_RESULT '
+
+
+def run_bench(project, timeout):
+    env = dict(os.environ, IPC_BENCH='1')
+    result = subprocess.run([str(electron_binary(project)), '.'], cwd=project, env=env, timeout=timeout,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    output = result.stdout.decode('utf-8', errors='replace')
+    for line in output.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            report = json.loads(line[len(RESULT_PREFIX):])
+            if report.get('error'):
+                raise RuntimeError(f"IPC 基准测试失败: {report['error']}")
+            return report
+    raise RuntimeError(f"输出中没有 IPC 基准测试结果（退出码 {result.returncode}）:\n{output}")
+
+
+def format_size(size):
+    return f"{size // 1024} KB" if size >= 1024 else f"{size} B"
+
+
+def print_results(results):
+    cell = scaffold._cell
+    widths = [10, 20, 14, 12, 14, 12, 14]
+    headers = ["负载", "延迟 p50/p95(ms)", "合并 p50(ms)", "invoke/s", "合并 invoke/s", "send/s", "合并 send/s"]
+    print(cell(headers[0], widths[0], left=True) + ''.join(cell(h, w) for h, w in zip(headers[1:], widths[1:])))
+    for row in results['results']:
+        per_second = row['perSecond']
+        values = [
+            f"{row['latency']['p50']:.3f} / {row['latency']['p95']:.3f}",
+            f"{row['latencyBatched']['p50']:.3f}",
+            *(f"{per_second[key]:.0f}" for key in ('invoke', 'invokeBatched', 'send', 'sendBatched'))
+        ]
+        print(cell(format_size(row['size']), widths[0], left=True) + ''.join(cell(v, w) for v, w in zip(values, widths[1:])))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="生成应用的 IPC 往返延迟与吞吐量测试")
+    parser.add_argument('--timeout', type=float, default=300, help="整个测试的超时时间（秒）")
+    parser.add_argument('--projects', type=Path,
+                        help="生成项目的目录；其中已有安装好依赖的项目时直接沿用（默认使用临时目录并在结束后删除）")
+    parser.add_argument('--output', type=Path, help="结果 JSON 路径（默认 benchmarks/results/ipc-<git 版本>.json）")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix='bench-ipc-') as tmp:
+        projects_dir = options.projects or Path(tmp)
+        projects_dir.mkdir(parents=True, exist_ok=True)
+        project = create_variant(projects_dir, 'ipc-bench', ['--ipc-bench'])
+        print("运行 IPC 基准测试 ...", file=sys.stderr)
+        report = run_bench(project, options.timeout)
+
+    revision = git_revision()
+    results = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "revision": revision,
+        "platform": f"{sys.platform}-{platform.machine()}",
+        "results": report['results'],
+        "stats": report['stats']
+    }
+    print_results(results)
+    output = options.output or RESULTS_DIR / f"ipc-{revision or datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"\n结果已写入: {output}")
+
+
+if __name__ == '__main__':
+    main()
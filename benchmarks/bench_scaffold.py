@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# 脚手架基准测试：在假的 node/npm 工具链下端到端运行 main()，测量脚手架自身的开销
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCH_DIR.parent
+FAKE_TOOLCHAIN = BENCH_DIR / 'fake_toolchain'
+RESULTS_DIR = BENCH_DIR / 'results'
+
+sys.path.insert(0, str(REPO_DIR))
+import create_electron_project as scaffold  # noqa: E402
+
+
+def run_main(argv, workdir):
+    # 每次运行都在独立目录中进行，输出全部丢弃；返回 (耗时, npm 安装次数)
+    # 工具链、lockfile 与图标缓存放在场景目录中，不读写用户自己的 ~/.electron-scaffold
+    argv = list(argv) + ['--toolchain-cache', str(workdir / 'toolchain.json'), '--lock-cache', str(workdir / 'locks'),
+                         '--icon-cache', str(workdir / 'icons')]
+    npm_log = workdir / 'npm-calls.log'
+    npm_log.unlink(missing_ok=True)
+    os.environ['FAKE_NPM_LOG'] = str(npm_log)
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            scaffold.main(argv)
+        except SystemExit as e:
+            if e.code:
+                raise RuntimeError(f"main({' '.join(argv)}) 退出码 {e.code}")
+    elapsed = time.perf_counter() - start
+    installs = len(npm_log.read_text(encoding='utf-8').splitlines()) if npm_log.exists() else 0
+    return elapsed, installs
+
+
+def scenario_single_cold(workdir, i, options):
+    return run_main(['--output-dir', str(workdir / 'out'), '--name', f"cold-{i}", '--no-snapshot'], workdir)
+
+
+def scenario_single_warm(workdir, i, options):
+    snapshots = workdir / 'snapshots'
+    if i == 0:
+        # 预热：第一次运行写入快照，不计入结果
+        run_main(['--output-dir', str(workdir / 'out'), '--name', 'warmup', '--snapshots', str(snapshots)], workdir)
+    return run_main(['--output-dir', str(workdir / 'out'), '--name', f"warm-{i}", '--snapshots', str(snapshots)], workdir)
+
+
+def scenario_batch(workdir, i, options):
+    specs = workdir / f"specs-{i}.json"
+    with open(specs, 'w', encoding='utf-8') as f:
+        json.dump([f"batch-{i}-{n}" for n in range(options.batch_size)], f)
+    snapshots = workdir / f"snapshots-{i}"
+    return run_main(['--output-dir', str(workdir / 'out'), '--batch', str(specs), '--jobs', str(options.jobs),
+                     '--snapshots', str(snapshots)], workdir)
+
+
+def scenario_regenerate(workdir, i, options):
+    # 重新生成同一个项目：先删除再创建，依赖从快照获得
+    snapshots = workdir / 'snapshots'
+    target = workdir / 'out' / 'regen'
+    if i == 0:
+        run_main(['--output-dir', str(workdir / 'out'), '--name', 'regen', '--snapshots', str(snapshots)], workdir)
+    scaffold.shutil.rmtree(target, ignore_errors=True)
+    return run_main(['--output-dir', str(workdir / 'out'), '--name', 'regen', '--snapshots', str(snapshots)], workdir)
+
+
+def scenario_update(workdir, i, options):
+    # 对已有项目做增量更新：模板与依赖均未变化，不应触发任何写入或 npm
+    target = workdir / 'out' / 'update'
+    if i == 0:
+        run_main(['--output-dir', str(workdir / 'out'), '--name', 'update', '--no-snapshot'], workdir)
+    return run_main(['--update', str(target)], workdir)
+
+
+SCENARIOS = {
+    'single-cold': scenario_single_cold,
+    'single-warm': scenario_single_warm,
+    'batch': scenario_batch,
+    'regenerate': scenario_regenerate,
+    'update': scenario_update,
+}
+
+
+def git_revision():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+        return result.stdout.decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_scenario(name, options):
+    samples = []
+    overheads = []
+    with tempfile.TemporaryDirectory(prefix=f"bench-{name}-") as tmp:
+        workdir = Path(tmp)
+        for i in range(options.repeat):
+            elapsed, installs = SCENARIOS[name](workdir, i, options)
+            samples.append(elapsed)
+            # 扣除假 npm 的模拟延迟，剩下的就是脚手架自身的开销
+            overheads.append(max(0.0, elapsed - installs * options.latency))
+    return {
+        "repeat": options.repeat,
+        "samples": samples,
+        "median_seconds": statistics.median(samples),
+        "min_seconds": min(samples),
+        "max_seconds": max(samples),
+        "overhead_median_seconds": statistics.median(overheads)
+    }
+
+
+def print_results(results, baseline=None):
+    cell = scaffold._cell
+    widths = [14, 12, 12, 14, 10]
+    headers = ["场景", "中位数(秒)", "最小(秒)", "自身开销(秒)", "对比基线"]
+    print(cell(headers[0], widths[0], left=True) + ''.join(cell(h, w) for h, w in zip(headers[1:], widths[1:])))
+    for name, result in results['scenarios'].items():
+        values = [f"{result['median_seconds']:.3f}", f"{result['min_seconds']:.3f}",
+                  f"{result['overhead_median_seconds']:.3f}"]
+        base = (baseline or {}).get('scenarios', {}).get(name)
+        if base and base['median_seconds'] > 0:
+            change = (result['median_seconds'] - base['median_seconds']) / base['median_seconds'] * 100
+            values.append(f"{change:+.1f}%")
+        print(cell(name, widths[0], left=True) + ''.join(cell(v, w) for v, w in zip(values, widths[1:])))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="脚手架基准测试（使用假的 node/npm，不访问网络）")
+    parser.add_argument('scenarios', nargs='*', metavar='SCENARIO',
+                        help=f"要运行的场景（{', '.join(SCENARIOS)}），默认全部运行")
+    parser.add_argument('--repeat', type=int, default=5, help="每个场景重复次数")
+    parser.add_argument('--latency', type=float, default=0.2, help="假 npm 每次安装的模拟延迟（秒）")
+    parser.add_argument('--packages', type=int, default=50, help="假 npm 生成的合成依赖包数量")
+    parser.add_argument('--file-size', type=int, default=2048, help="每个合成包 index.js 的大小（字节）")
+    parser.add_argument('--batch-size', type=int, default=8, help="batch 场景中的项目数")
+    parser.add_argument('--jobs', type=int, default=4, help="batch 场景的并行进程数")
+    parser.add_argument('--output', type=Path, help="结果 JSON 路径（默认 benchmarks/results/<git 版本>.json）")
+    parser.add_argument('--baseline', type=Path, help="与之前保存的结果 JSON 对比")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    names = options.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        print(f"未知场景: {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(2)
+
+    os.environ['PATH'] = str(FAKE_TOOLCHAIN) + os.pathsep + os.environ.get('PATH', '')
+    os.environ['FAKE_NPM_LATENCY'] = str(options.latency)
+    os.environ['FAKE_NPM_PACKAGES'] = str(options.packages)
+    os.environ['FAKE_NPM_FILE_SIZE'] = str(options.file_size)
+
+    revision = git_revision()
+    results = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "revision": revision,
+        "python": sys.version.split()[0],
+        "platform": f"{sys.platform}-{platform.machine()}",
+        "settings": {
+            "latency": options.latency,
+            "packages": options.packages,
+            "file_size": options.file_size,
+            "batch_size": options.batch_size,
+            "jobs": options.jobs
+        },
+        "scenarios": {}
+    }
+    for name in names:
+        print(f"运行场景 {name} ...", file=sys.stderr)
+        results['scenarios'][name] = run_scenario(name, options)
+
+    baseline = None
+    if options.baseline:
+        with open(options.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    output = options.output or RESULTS_DIR / f"{revision or datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"\n结果已写入: {output}")
+
+
+if __name__ == '__main__':
+    main()
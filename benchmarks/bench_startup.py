@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# 生成应用的启动基准测试：分别生成启动优化模式与 --no-fast-startup 的项目，用真实的 Electron 反复冷启动，
+# 测量主进程创建到首个窗口完成首次绘制（ready-to-show）的耗时。需要可用的 node/npm 与图形环境
+# （Linux 无显示器时可用 xvfb-run 运行本脚本）
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCH_DIR.parent
+RESULTS_DIR = BENCH_DIR / 'results'
+
+sys.path.insert(0, str(REPO_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+import create_electron_project as scaffold  # noqa: E402
+from bench_scaffold import git_revision  # noqa: E402
+
+# 生成的 main.js 在首个窗口可显示时输出这一行；设置 EXIT_AFTER_FIRST_PAINT 后随即退出
+STARTUP_LINE = re.compile(r'冷启动到窗口可显示: (\d+) ms')
+
+VARIANTS = {
+    'baseline': ['--no-fast-startup'],
+    'fast-startup': [],
+}
+
+
+def create_variant(projects_dir, name, args=None):
+    project = projects_dir / name
+    if (project / 'node_modules').is_dir():
+        print(f"沿用已有项目: {project}", file=sys.stderr)
+        return project
+    print(f"生成项目: {project}", file=sys.stderr)
+    try:
+        scaffold.main(['--output-dir', str(projects_dir), '--name', name] + (VARIANTS[name] if args is None else args))
+    except SystemExit as e:
+        if e.code:
+            raise RuntimeError(f"生成项目 {name} 失败，退出码 {e.code}")
+    return project
+
+
+def electron_binary(project):
+    name = 'electron.cmd' if os.name == 'nt' else 'electron'
+    return project / 'node_modules' / '.bin' / name
+
+
+def launch_once(project, timeout):
+    # 返回本次启动的首次绘制耗时（毫秒）
+    env = dict(os.environ, EXIT_AFTER_FIRST_PAINT='1')
+    result = subprocess.run([str(electron_binary(project)), '.'], cwd=project, env=env, timeout=timeout,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    output = result.stdout.decode('utf-8', errors='replace')
+    match = STARTUP_LINE.search(output)
+    if not match:
+        raise RuntimeError(f"{project.name} 启动输出中没有首次绘制耗时（退出码 {result.returncode}）:\n{output}")
+    return int(match.group(1))
+
+
+def run_variant(project, options):
+    # 第一次启动还没有代码缓存，单独记录，不计入中位数
+    first = launch_once(project, options.timeout)
+    samples = [launch_once(project, options.timeout) for _ in range(options.runs)]
+    return {
+        "first_run_ms": first,
+        "samples_ms": samples,
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples)
+    }
+
+
+def print_results(results):
+    cell = scaffold._cell
+    widths = [14, 14, 12, 10, 10]
+    headers = ["模式", "首次启动(ms)", "中位数(ms)", "最小(ms)", "对比基线"]
+    print(cell(headers[0], widths[0], left=True) + ''.join(cell(h, w) for h, w in zip(headers[1:], widths[1:])))
+    base = results['variants'].get('baseline')
+    for name, result in results['variants'].items():
+        values = [str(result['first_run_ms']), f"{result['median_ms']:.0f}", str(result['min_ms'])]
+        if base and name != 'baseline' and base['median_ms'] > 0:
+            values.append(f"{(result['median_ms'] - base['median_ms']) / base['median_ms'] * 100:+.1f}%")
+        print(cell(name, widths[0], left=True) + ''.join(cell(v, w) for v, w in zip(values, widths[1:])))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="生成应用的启动耗时对比（启动优化模式 vs --no-fast-startup）")
+    parser.add_argument('--runs', type=int, default=10, help="每种模式计入统计的启动次数（另有一次预热启动）")
+    parser.add_argument('--timeout', type=float, default=60, help="单次启动的超时时间（秒）")
+    parser.add_argument('--projects', type=Path,
+                        help="生成项目的目录；其中已有安装好依赖的项目时直接沿用（默认使用临时目录并在结束后删除）")
+    parser.add_argument('--output', type=Path, help="结果 JSON 路径（默认 benchmarks/results/startup-<git 版本>.json）")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix='bench-startup-') as tmp:
+        projects_dir = options.projects or Path(tmp)
+        projects_dir.mkdir(parents=True, exist_ok=True)
+        revision = git_revision()
+        results = {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "revision": revision,
+            "platform": f"{sys.platform}-{platform.machine()}",
+            "settings": {"runs": options.runs},
+            "variants": {}
+        }
+        for name in VARIANTS:
+            project = create_variant(projects_dir, name)
+            print(f"启动 {name} ...", file=sys.stderr)
+            results['variants'][name] = run_variant(project, options)
+
+    print_results(results)
+    output = options.output or RESULTS_DIR / f"startup-{revision or datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"\n结果已写入: {output}")
+
+
+if __name__ == '__main__':
+    main()
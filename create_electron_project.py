@@ -2,38 +2,362 @@ import os
 import subprocess
 import sys
 import json
+import shutil
+import stat
+import argparse
+import tempfile
+import base64
+import hashlib
+import urllib.request
+import platform
+import contextlib
+import contextvars
+import functools
+import re
+import html
+import math
+import struct
+import zlib
+import xml.etree.ElementTree as ET
+import unicodedata
+import asyncio
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from pathlib import Path
 import time
 
-def check_command(command, name):
-    try:
-        result = subprocess.run([command, '--version'], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-        version = result.stdout.decode().strip()
-        print(f"{name} 已安装，版本: {version}")
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
-        print(f"{name} 未安装或无法识别。")
-        print(f"错误信息: {e}")
-        print("请确保 Node.js 和 npm 已正确安装并添加到系统 PATH 中。")
-        print(f"当前 PATH: {os.environ.get('PATH')}")
-        sys.exit(1)
+# 依赖计划：生产依赖与开发依赖均固定版本，写入 package.json 后由一次 npm install 完成解析
+# 生成的应用只用 Node 内置模块发起网络请求，运行时没有第三方依赖
+DEPENDENCY_PLAN = {
+    "dependencies": {},
+    "devDependencies": {
+        "electron": "33.2.1",
+        "electron-builder": "25.1.8"
+    }
+}
+# 模板不再使用、--update 时会从 package.json 中移除的依赖（项目中仍有用法时保留）
+RETIRED_DEPENDENCIES = ('@electron/remote', 'axios')
+
+# 兼容性检查：渲染进程改为 contextIsolation + preload 后，项目中不应再出现这些用法
+REMOTE_USAGE_PATTERNS = [
+    ("@electron/remote", re.compile(r'''require\(\s*['"]@electron/remote(?:/main|/renderer)?['"]\s*\)|from\s+['"]@electron/remote''')),
+    ("electron.remote", re.compile(r'''require\(\s*['"]electron['"]\s*\)\.remote\b|\{[^}]*\bremote\b[^}]*\}\s*=\s*require\(\s*['"]electron['"]\s*\)''')),
+    ("enableRemote", re.compile(r'\benableRemote(?:Module)?\s*:\s*true')),
+    ("nodeIntegration: true", re.compile(r'\bnodeIntegration\s*:\s*true')),
+    ("contextIsolation: false", re.compile(r'\bcontextIsolation\s*:\s*false')),
+]
+COMPAT_SCAN_SUFFIXES = ('.js', '.cjs', '.mjs', '.ts', '.html')
+
+# 本地离线包仓库，按 name@version + integrity 存放 tarball
+DEFAULT_STORE_PATH = Path(os.environ.get('ELECTRON_SCAFFOLD_STORE', Path.home() / '.electron-scaffold' / 'store'))
+
+# Electron 二进制的下载地址，与 @electron/get 一致：<镜像>v<版本>/electron-v<版本>-<平台>-<架构>.zip
+ELECTRON_MIRROR = os.environ.get('ELECTRON_MIRROR', 'https://github.com/electron/electron/releases/download/')
+ELECTRON_ARCHES = {'x86_64': 'x64', 'amd64': 'x64', 'aarch64': 'arm64', 'arm64': 'arm64',
+                   'armv7l': 'armv7l', 'i386': 'ia32', 'i686': 'ia32', 'x86': 'ia32'}
+
+# 依赖计划对应的规范 lockfile：随脚本提交在 locks/ 中，或由首次安装生成到用户缓存目录
+SHIPPED_LOCK_DIR = Path(__file__).resolve().parent / 'locks'
+DEFAULT_LOCK_CACHE = Path.home() / '.electron-scaffold' / 'locks'
+
+# 按依赖集合哈希保存的已安装 node_modules 快照
+DEFAULT_SNAPSHOT_PATH = Path(os.environ.get('ELECTRON_SCAFFOLD_SNAPSHOTS', Path.home() / '.electron-scaffold' / 'snapshots'))
+SNAPSHOT_MAX_BYTES = 5 * 1024 ** 3
+SNAPSHOT_MAX_AGE_DAYS = 30
+
+# 生成文件的模板目录，以及模板变量的默认值（功能开关为布尔值）
+TEMPLATE_DIR = Path(__file__).resolve().parent / 'templates'
+DEFAULT_TEMPLATE_CONTEXT = {
+    "app_title": "我的 Electron 应用",
+    "product_name": "CheshireDemo",
+    "app_id": "com.luoxiaoshan.cheshire",
+    "posts_demo": True,
+    "app_menu": True,
+    "fast_startup": True,
+    "startup_trace": True,
+    "compute_pool": True,
+    "ipc_bench": False
+}
+
+# 由 SVG 光栅化得到的 ICO/PNG/ICNS，按 SVG 内容哈希与尺寸集合缓存
+DEFAULT_ICON_CACHE = Path.home() / '.electron-scaffold' / 'icons'
+
+# 工具链最低版本（README 要求 Node.js v14+，对应 npm 6+），以及版本探测结果的缓存文件
+TOOLCHAIN_REQUIREMENTS = {
+    "node": ("Node.js", (14, 0, 0)),
+    "npm": ("npm", (6, 0, 0))
+}
+DEFAULT_TOOLCHAIN_CACHE = Path.home() / '.electron-scaffold' / 'toolchain.json'
+
+# 项目中记录生成文件哈希的清单，用于增量更新
+MANIFEST_NAME = '.scaffold-manifest.json'
+
+# 入口文件依赖的生成文件（含间接加载的 Worker 与任务实现）。入口文件被用户修改而保持旧版本时，
+# 这些文件也保持旧版本，不随功能开关或模板变化单独重写或删除
+ENTRY_DEPENDENCIES = {
+    'main.js': ('ipc-router.js', 'ipc-channels.js', 'startup-trace.js', 'code-cache.js', 'compute-pool.js',
+                'compute-worker.js', 'static/js/compute-jobs.js', 'http-client.js', 'record-store.js', 'ipc-bench.js'),
+    'preload.js': ('ipc-router.js', 'ipc-channels.js')
+}
+
+# Linux FICLONE ioctl，用于在 btrfs/xfs 等文件系统上做写时复制克隆
+FICLONE = 0x40049409
+
+class ScaffoldError(Exception):
+    # 脚手架运行失败；消息即面向用户的错误说明，由 main() 统一输出并退出
+    pass
+
+# 分阶段性能记录；未开启 --profile 时为 None，各阶段只多一次判断
+_PROFILE = None
+# 当前活动阶段栈；流水线中并发的任务和线程各自继承一份，互不干扰
+_PROFILE_STACK = contextvars.ContextVar('profile_stack', default=())
+
+def start_profile():
+    global _PROFILE
+    _PROFILE = {"started": time.perf_counter(), "phases": {}}
+
+def stop_profile():
+    global _PROFILE
+    profile, _PROFILE = _PROFILE, None
+    if profile is None:
+        return None
+    return {
+        "total_seconds": time.perf_counter() - profile['started'],
+        "phases": profile['phases']
+    }
 
-def run_command(command, cwd=None):
+def _in_event_loop():
     try:
-        subprocess.run(command, check=True, shell=True, cwd=cwd)
-    except subprocess.CalledProcessError as e:
-        print(f"运行命令时出错: {' '.join(command)}")
-        print(e)
-        sys.exit(1)
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+@contextlib.contextmanager
+def profile_phase(name):
+    # 流水线中的阶段并发执行，进程级的 os.times() 无法区分各阶段；CPU 按执行该阶段的线程统计，
+    # 不含交给其他线程的工作。协程中的阶段与事件循环上的其他任务交替执行，不统计 CPU（cpu_calls 不增加）
+    if _PROFILE is None:
+        yield
+        return
+    phase = _PROFILE['phases'].setdefault(name, {
+        "calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0, "cpu_calls": 0,
+        "child_cpu_seconds": 0.0, "bytes_written": 0, "files_written": 0
+    })
+    token = _PROFILE_STACK.set(_PROFILE_STACK.get() + (phase,))
+    measure_cpu = not _in_event_loop()
+    cpu_start = time.thread_time()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phase['calls'] += 1
+        phase['wall_seconds'] += time.perf_counter() - start
+        if measure_cpu:
+            phase['cpu_seconds'] += time.thread_time() - cpu_start
+            phase['cpu_calls'] += 1
+        _PROFILE_STACK.reset(token)
+
+@contextlib.contextmanager
+def child_cpu():
+    # 子进程的 CPU 时间计入当前所有活动阶段（外层阶段包含子阶段）。os.times() 的 children_* 是进程级的，
+    # 只在子进程被 wait 之后计入，Windows 上恒为 0；同一时间只运行一个 npm，差值即这一个子进程的用量
+    if _PROFILE is None:
+        yield
+        return
+    t = os.times()
+    start = t.children_user + t.children_system
+    try:
+        yield
+    finally:
+        t = os.times()
+        for phase in _PROFILE_STACK.get():
+            phase['child_cpu_seconds'] += t.children_user + t.children_system - start
+
+def profiled(name):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def record_write(path):
+    # 写入的字节数计入当前所有活动阶段（外层阶段包含子阶段）
+    if _PROFILE is None:
+        return
+    size = os.path.getsize(path)
+    for phase in _PROFILE_STACK.get():
+        phase['bytes_written'] += size
+        phase['files_written'] += 1
+
+def merge_profiles(reports):
+    # 合并批量模式下各子进程返回的报告
+    merged = {"total_seconds": 0.0, "phases": {}}
+    for report in reports:
+        merged['total_seconds'] = max(merged['total_seconds'], report['total_seconds'])
+        for name, phase in report['phases'].items():
+            target = merged['phases'].setdefault(name, dict.fromkeys(phase, 0))
+            for field, value in phase.items():
+                target[field] += value
+    return merged
+
+def write_profile_report(report, path):
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": f"{sys.platform}-{platform.machine()}",
+        "dependency_plan": dependency_plan_hash(),
+        **report
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n性能报告已写入: {path}")
+
+def _display_width(text):
+    return sum(2 if unicodedata.east_asian_width(ch) in 'WF' else 1 for ch in text)
 
-def create_file(path, content):
+def _cell(text, width, left=False):
+    padding = ' ' * max(0, width - _display_width(text))
+    return text + padding if left else padding + text
+
+def print_profile_summary(report):
+    print("\n阶段耗时（包含子阶段）")
+    print("============================")
+    rows = sorted(report['phases'].items(), key=lambda item: item[1]['wall_seconds'], reverse=True)
+    width = max([len(name) for name, _ in rows] + [4])
+    headers = ["次数", "耗时(秒)", "线程CPU(秒)", "子进程CPU(秒)", "写入字节", "文件数"]
+    widths = [6, 10, 12, 14, 12, 8]
+    print(_cell("阶段", width, left=True) + ''.join(_cell(h, w) for h, w in zip(headers, widths)))
+    for name, phase in rows:
+        values = [
+            str(phase['calls']),
+            f"{phase['wall_seconds']:.3f}",
+            f"{phase['cpu_seconds']:.3f}" if phase.get('cpu_calls') else "-",
+            f"{phase['child_cpu_seconds']:.3f}",
+            str(phase['bytes_written']),
+            str(phase['files_written'])
+        ]
+        print(_cell(name, width, left=True) + ''.join(_cell(v, w) for v, w in zip(values, widths)))
+    print(f"总耗时: {report['total_seconds']:.3f} 秒")
+
+def parse_version(text):
+    match = re.search(r'(\d+)\.(\d+)\.(\d+)', text)
+    return tuple(int(part) for part in match.groups()) if match else None
+
+def probe_command(command):
+    # 不经过 shell，直接运行 PATH 中解析出的可执行文件（Windows 下为 node.exe / npm.cmd）
+    executable = shutil.which(command)
+    if executable is None:
+        raise FileNotFoundError(f"在 PATH 中找不到 {command}")
+    result = subprocess.run([executable, '--version'], check=True, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, stdin=subprocess.DEVNULL, timeout=60)
+    return result.stdout.decode().strip()
+
+def toolchain_cache_key(commands):
+    # PATH 或任何一个可执行文件发生变化（升级、切换版本）都会使缓存失效
+    parts = [os.environ.get('PATH', '')]
+    for command in commands:
+        executable = shutil.which(command)
+        if executable is None:
+            return None
+        parts.append(f"{command}={executable}:{os.stat(executable).st_mtime_ns}")
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+def load_toolchain_cache(path, key):
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"创建文件: {path}")
-    except Exception as e:
-        print(f"创建文件 {path} 时出错: {e}")
-        sys.exit(1)
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cache.get('versions') if cache.get('key') == key else None
 
+def save_toolchain_cache(path, key, versions):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix='toolchain-', suffix='.tmp', dir=path.parent)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"key": key, "versions": versions, "checked_at": time.time()}, f, indent=2)
+        os.replace(tmp_name, path)
+    except OSError:
+        # 缓存只是优化，写入失败不影响创建项目
+        pass
+
+@profiled('check_toolchain')
+def check_toolchain(commands=('node', 'npm'), cache_path=None):
+    # 并发探测各工具版本；结果按 PATH 与可执行文件 mtime 缓存到磁盘，并检查最低版本
+    key = toolchain_cache_key(commands) if cache_path else None
+    versions = load_toolchain_cache(cache_path, key) if key else None
+    cached = versions is not None and all(command in versions for command in commands)
+    if not cached:
+        versions = {}
+        with child_cpu(), ThreadPoolExecutor(max_workers=len(commands)) as pool:
+            futures = {command: pool.submit(probe_command, command) for command in commands}
+        for command, future in futures.items():
+            name = TOOLCHAIN_REQUIREMENTS[command][0]
+            try:
+                versions[command] = future.result()
+            except (subprocess.SubprocessError, OSError) as e:
+                raise ScaffoldError(
+                    f"{name} 未安装或无法识别。\n"
+                    f"错误信息: {e}\n"
+                    "请确保 Node.js 和 npm 已正确安装并添加到系统 PATH 中。\n"
+                    f"当前 PATH: {os.environ.get('PATH')}"
+                ) from e
+
+    for command in commands:
+        name, minimum = TOOLCHAIN_REQUIREMENTS[command]
+        version = parse_version(versions[command])
+        if version is None or version < minimum:
+            raise ScaffoldError(
+                f"{name} 版本过低或无法识别: {versions[command] or '(空)'}\n"
+                f"需要 {name} {'.'.join(map(str, minimum))} 或更高版本。"
+            )
+        print(f"{name} 已安装，版本: {versions[command]}{'（缓存）' if cached else ''}")
+
+    if key and not cached:
+        save_toolchain_cache(cache_path, key, versions)
+    return versions
+
+def run_command(command, cwd=None, env=None):
+    # 通过 PATH 解析可执行文件（Windows 下为 npm.cmd），避免列表参数在 POSIX shell 中被丢弃
+    executable = shutil.which(command[0]) or command[0]
+    if env is not None:
+        env = {**os.environ, **env}
+    try:
+        with profile_phase(f"run_command {' '.join(command[:2])}"), child_cpu():
+            subprocess.run([executable] + list(command[1:]), check=True, cwd=cwd, env=env)
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        raise ScaffoldError(f"运行命令时出错: {' '.join(command)}\n{e}") from e
+
+async def run_command_async(command, cwd=None, env=None, prefix=None):
+    # 子进程输出逐行转发并加上前缀，与同时进行的文件生成输出区分开
+    executable = shutil.which(command[0]) or command[0]
+    if env is not None:
+        env = {**os.environ, **env}
+    prefix = prefix or f"[{command[0]}]"
+    with profile_phase(f"run_command {' '.join(command[:2])}"), child_cpu():
+        try:
+            process = await asyncio.create_subprocess_exec(
+                executable, *command[1:], cwd=cwd, env=env,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+        except FileNotFoundError as e:
+            raise ScaffoldError(f"运行命令时出错: {' '.join(command)}\n{e}") from e
+        try:
+            async for line in process.stdout:
+                print(f"{prefix} {line.decode('utf-8', errors='replace').rstrip()}", flush=True)
+            returncode = await process.wait()
+        except asyncio.CancelledError:
+            # 流水线中其他阶段失败时终止 npm，避免它继续写入即将删除的临时目录
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+    if returncode != 0:
+        raise ScaffoldError(f"运行命令时出错: {' '.join(command)}\n退出码 {returncode}")
+
+@profiled('ensure_config')
 def ensure_config(path):
     config_path = path / 'config.json'
     if not config_path.exists():
@@ -43,10 +367,1061 @@ def ensure_config(path):
         }
         with open(config_path, 'w', encoding='utf-8') as f:
             json.dump(default_config, f, indent=2, ensure_ascii=False)
+        record_write(config_path)
         print(f"创建默认配置文件: {config_path}")
     return config_path
 
-def update_package_json(path):
+@profiled('write_package_json')
+def write_package_json(path, name):
+    # 直接在进程内生成与 npm init -y 等价的 package.json，并写入依赖计划
+    package = {
+        "name": name,
+        "version": "1.0.0",
+        "description": "",
+        "main": "index.js",
+        "scripts": {
+            "test": "echo \"Error: no test specified\" && exit 1"
+        },
+        "keywords": [],
+        "author": "",
+        "license": "ISC",
+        "dependencies": dict(DEPENDENCY_PLAN['dependencies']),
+        "devDependencies": dict(DEPENDENCY_PLAN['devDependencies'])
+    }
+    package_json = path / 'package.json'
+    try:
+        with open(package_json, 'w', encoding='utf-8') as f:
+            json.dump(package, f, indent=2, ensure_ascii=False)
+        record_write(package_json)
+        print("创建文件: package.json")
+    except Exception as e:
+        raise ScaffoldError(f"创建 package.json 时出错: {e}") from e
+
+def prepare_install(path, name, require_lock=False, lock_cache=DEFAULT_LOCK_CACHE):
+    # 有可用的规范 lockfile 时走 npm ci：跳过解析，按 lockfile 中的 integrity 校验每个 tarball
+    # 返回要执行的 npm 命令，以及是否需要在安装后把生成的 lockfile 存入缓存
+    lock_path, lock = find_canonical_lock(lock_cache)
+    problems = lock_problems(lock) if lock else ["没有找到当前依赖计划的规范 lockfile"]
+    if not problems:
+        print(f"使用规范 lockfile: {lock_path}")
+        write_project_lock(path, lock, name)
+        return ['npm', 'ci', '--no-audit', '--no-fund'], False
+
+    print("规范 lockfile 不可用:" if lock is None else f"规范 lockfile 已过期: {lock_path}")
+    for problem in problems:
+        print(f"  - {problem}")
+    if require_lock:
+        raise ScaffoldError("已指定 --require-lock，请先运行 --refresh-lock 生成规范 lockfile。")
+
+    # 所有依赖已写入 package.json，一次解析、一次写入 lockfile
+    return ['npm', 'install', '--no-audit', '--no-fund'], True
+
+def install_dependencies(path, name, require_lock=False, lock_cache=DEFAULT_LOCK_CACHE):
+    command, save_lock = prepare_install(path, name, require_lock, lock_cache)
+    run_command(command, cwd=path)
+    if save_lock:
+        save_lock_cache(path / 'package-lock.json', lock_cache)
+
+def install_dependencies_serial(path):
+    # 旧的安装流程：npm init 后逐个安装，每次都会重新解析整个依赖树
+    run_command(['npm', 'init', '-y'], cwd=path)
+    run_command(['npm', 'install', 'electron', '--save-dev'], cwd=path)
+    run_command(['npm', 'install', 'electron-builder', '--save-dev'], cwd=path)
+
+def compare_install_paths():
+    # 在临时目录中分别执行旧流程与依赖计划流程，比较耗时
+    with tempfile.TemporaryDirectory(prefix='electron-install-') as tmp:
+        serial_path = Path(tmp) / 'serial-app'
+        planned_path = Path(tmp) / 'planned-app'
+        serial_path.mkdir()
+        planned_path.mkdir()
+
+        print("\n[旧流程] npm init + 2 次 npm install...")
+        start = time.perf_counter()
+        install_dependencies_serial(serial_path)
+        update_package_json(serial_path)
+        serial_seconds = time.perf_counter() - start
+
+        print("\n[依赖计划] 写入 package.json + 1 次 npm install...")
+        start = time.perf_counter()
+        write_package_json(planned_path, 'planned-app')
+        update_package_json(planned_path)
+        install_dependencies(planned_path, 'planned-app', lock_cache=None)
+        planned_seconds = time.perf_counter() - start
+
+    print("\n安装耗时对比")
+    print("============================")
+    print(f"旧流程:   {serial_seconds:8.2f} 秒")
+    print(f"依赖计划: {planned_seconds:8.2f} 秒")
+    if planned_seconds > 0:
+        print(f"加速比:   {serial_seconds / planned_seconds:8.2f}x")
+    return serial_seconds, planned_seconds
+
+def dependency_plan_hash(plan=DEPENDENCY_PLAN):
+    # 依赖集合的稳定哈希，用于定位仓库中对应的 lockfile
+    canonical = json.dumps(plan, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def file_digest(path, algorithm):
+    digest = hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+def compute_integrity(path, algorithm='sha512'):
+    return f"{algorithm}-{base64.b64encode(file_digest(path, algorithm)).decode('ascii')}"
+
+def store_tarball_path(store, integrity):
+    # 内容寻址：tarballs/<算法>/<hex 前两位>/<hex>.tgz
+    algorithm, _, encoded = integrity.partition('-')
+    hex_digest = base64.b64decode(encoded).hex()
+    return store / 'tarballs' / algorithm / hex_digest[:2] / f"{hex_digest}.tgz"
+
+def load_store_index(store):
+    index_path = store / 'index.json'
+    if not index_path.exists():
+        return {}
+    with open(index_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_store_index(store, index):
+    index_path = store / 'index.json'
+    tmp_path = index_path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp_path, index_path)
+
+def store_lock_path(store, plan=DEPENDENCY_PLAN):
+    return store / 'locks' / f"{dependency_plan_hash(plan)}.json"
+
+def lockfile_packages(lock):
+    # 从 package-lock.json (v2/v3) 中列出需要 tarball 的包
+    for key, entry in lock.get('packages', {}).items():
+        if not key or entry.get('link') or 'resolved' not in entry or 'integrity' not in entry:
+            continue
+        name = entry.get('name') or key.rsplit('node_modules/', 1)[-1]
+        yield key, name, entry
+
+def add_tarball_to_store(store, name, version, integrity, source):
+    # 校验 tarball 后按 integrity 放入仓库；source 为已下载的临时文件
+    algorithm = integrity.partition('-')[0]
+    actual = compute_integrity(source, algorithm)
+    if actual != integrity:
+        raise ValueError(f"{name}@{version} 校验失败: 期望 {integrity}，实际 {actual}")
+    target = store_tarball_path(store, integrity)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(source, target)
+    return target
+
+def download_to_store(store, name, version, url, integrity):
+    target = store_tarball_path(store, integrity)
+    if target.exists():
+        return target
+    (store / 'tmp').mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=store / 'tmp', suffix='.tgz')
+    try:
+        with os.fdopen(fd, 'wb') as f, urllib.request.urlopen(url, timeout=60) as response:
+            shutil.copyfileobj(response, f, 1024 * 1024)
+        return add_tarball_to_store(store, name, version, integrity, Path(tmp_name))
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+def electron_zip_name(version):
+    arch = platform.machine().lower()
+    return f"electron-v{version}-{sys.platform}-{ELECTRON_ARCHES.get(arch, arch)}.zip"
+
+def electron_cache_dir(store, version, mirror=None):
+    # 与 @electron/get 的缓存布局一致：<缓存根目录>/<去掉文件名后的下载地址的 sha256>/<文件名>
+    base = f"{mirror or ELECTRON_MIRROR}v{version}"
+    return store / 'electron' / hashlib.sha256(base.encode('utf-8')).hexdigest(), base
+
+def fill_electron_cache(store, version):
+    # Electron 的 postinstall 通过 @electron/get 下载二进制 zip；按 SHASUMS256.txt 校验后放入仓库，
+    # 离线安装时 electron_config_cache 指向这里即可命中缓存
+    cache_dir, base = electron_cache_dir(store, version)
+    zip_name = electron_zip_name(version)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with urllib.request.urlopen(f"{base}/SHASUMS256.txt", timeout=60) as response:
+        shasums = response.read()
+    expected = None
+    for line in shasums.decode('utf-8').splitlines():
+        digest, _, filename = line.strip().partition(' ')
+        if filename.lstrip('*') == zip_name:
+            expected = digest
+    if expected is None:
+        raise ValueError(f"SHASUMS256.txt 中没有 {zip_name}")
+
+    target = cache_dir / zip_name
+    if not target.exists() or file_digest(target, 'sha256').hex() != expected:
+        print(f"下载 Electron 二进制: {zip_name}")
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix='.zip')
+        try:
+            with os.fdopen(fd, 'wb') as f, urllib.request.urlopen(f"{base}/{zip_name}", timeout=600) as response:
+                shutil.copyfileobj(response, f, 1024 * 1024)
+            actual = file_digest(tmp_name, 'sha256').hex()
+            if actual != expected:
+                raise ValueError(f"{zip_name} 校验失败: 期望 {expected}，实际 {actual}")
+            os.replace(tmp_name, target)
+        finally:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+    with open(cache_dir / 'SHASUMS256.txt', 'wb') as f:
+        f.write(shasums)
+    return target
+
+def fill_package_store(store, plan=DEPENDENCY_PLAN):
+    # 联网解析一次依赖树，下载全部 tarball 进入仓库，之后即可离线创建项目
+    store.mkdir(parents=True, exist_ok=True)
+    lock_path, lock = find_canonical_lock(plan=plan)
+    if lock is None or lock_problems(lock, plan):
+        lock = resolve_lock(plan)
+    else:
+        print(f"使用规范 lockfile: {lock_path}")
+
+    index = load_store_index(store)
+    packages = list(lockfile_packages(lock))
+    print(f"下载 {len(packages)} 个 tarball 到离线仓库: {store}")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [
+            pool.submit(download_to_store, store, name, entry['version'], entry['resolved'], entry['integrity'])
+            for _, name, entry in packages
+        ]
+        for future in futures:
+            future.result()
+    for _, name, entry in packages:
+        # 下载时已按 lockfile 中的 integrity 校验，同一版本的旧记录与之不同时以新的为准
+        key = f"{name}@{entry['version']}"
+        if index.get(key, entry['integrity']) != entry['integrity']:
+            print(f"更新离线仓库中 {key} 的 integrity: {index[key]} → {entry['integrity']}")
+        index[key] = entry['integrity']
+    save_store_index(store, index)
+
+    electron = plan['devDependencies'].get('electron')
+    if electron:
+        fill_electron_cache(store, electron)
+
+    lock_path = store_lock_path(store, plan)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, 'w', encoding='utf-8') as f:
+        json.dump(lock, f, indent=2, ensure_ascii=False)
+    print(f"离线仓库已就绪，依赖计划: {dependency_plan_hash(plan)[:12]}")
+
+def resolve_from_store(store, name, plan=DEPENDENCY_PLAN):
+    # 仅从仓库解析：生成 resolved 指向本地 tarball 的 lockfile，缺失任何包都直接报错
+    lock_path = store_lock_path(store, plan)
+    if not lock_path.exists():
+        raise FileNotFoundError(f"离线仓库中没有当前依赖计划的 lockfile: {lock_path}")
+    with open(lock_path, 'r', encoding='utf-8') as f:
+        lock = json.load(f)
+
+    index = load_store_index(store)
+    missing = []
+    for key, pkg_name, entry in lockfile_packages(lock):
+        stored_integrity = index.get(f"{pkg_name}@{entry['version']}")
+        tarball = store_tarball_path(store, entry['integrity'])
+        if stored_integrity != entry['integrity'] or not tarball.exists():
+            missing.append(f"{pkg_name}@{entry['version']}")
+            continue
+        entry['resolved'] = 'file:' + tarball.resolve().as_posix()
+    electron = plan['devDependencies'].get('electron')
+    if electron and not (electron_cache_dir(store, electron)[0] / electron_zip_name(electron)).exists():
+        missing.append(electron_zip_name(electron))
+    if missing:
+        raise FileNotFoundError(f"离线仓库缺少 {len(missing)} 个包: {', '.join(missing[:5])}")
+
+    lock['name'] = name
+    lock.setdefault('packages', {}).setdefault('', {})['name'] = name
+    return lock
+
+def prepare_store_install(path, store, name, plan=DEPENDENCY_PLAN):
+    try:
+        lock = resolve_from_store(store, name, plan)
+    except (FileNotFoundError, ValueError) as e:
+        raise ScaffoldError(
+            f"无法从离线仓库安装: {e}\n"
+            "请先在联网环境运行: python create_electron_project.py --fill-store"
+        ) from e
+    with open(path / 'package-lock.json', 'w', encoding='utf-8') as f:
+        json.dump(lock, f, indent=2, ensure_ascii=False)
+    # Electron 二进制由 @electron/get 下载，fill_electron_cache 已把它放进仓库中的缓存目录
+    env = {'electron_config_cache': str(store / 'electron'), 'ELECTRON_MIRROR': ELECTRON_MIRROR}
+    return ['npm', 'ci', '--offline', '--no-audit', '--no-fund'], env
+
+def canonical_lock_candidates(lock_cache=DEFAULT_LOCK_CACHE, plan=DEPENDENCY_PLAN):
+    filename = f"{dependency_plan_hash(plan)}.json"
+    candidates = [SHIPPED_LOCK_DIR / filename]
+    if lock_cache:
+        candidates.append(lock_cache / filename)
+    return candidates
+
+def find_canonical_lock(lock_cache=DEFAULT_LOCK_CACHE, plan=DEPENDENCY_PLAN):
+    # 优先使用随脚本提交的 lockfile，其次是首次安装时生成的缓存
+    for lock_path in canonical_lock_candidates(lock_cache, plan):
+        if lock_path.exists():
+            with open(lock_path, 'r', encoding='utf-8') as f:
+                return lock_path, json.load(f)
+    return None, None
+
+def is_strong_integrity(integrity):
+    # SRI 中可能包含多个哈希，至少要有一个格式正确的 sha512
+    for token in (integrity or '').split():
+        algorithm, _, encoded = token.partition('-')
+        if algorithm != 'sha512':
+            continue
+        try:
+            if len(base64.b64decode(encoded, validate=True)) == 64:
+                return True
+        except ValueError:
+            pass
+    return False
+
+def lock_problems(lock, plan=DEPENDENCY_PLAN):
+    # 返回 lockfile 相对依赖计划过期或不可信的原因，空列表表示可以直接 npm ci
+    problems = []
+    if lock.get('lockfileVersion', 1) < 2:
+        problems.append(f"lockfileVersion {lock.get('lockfileVersion', 1)} 过旧，需要 npm 7 以上生成")
+    packages = lock.get('packages', {})
+    root = packages.get('', {})
+    for section, deps in plan.items():
+        if root.get(section, {}) != deps:
+            problems.append(f"{section} 与依赖计划不一致")
+        for dep, version in deps.items():
+            locked = packages.get(f"node_modules/{dep}", {}).get('version')
+            if locked != version:
+                problems.append(f"{dep} 锁定为 {locked}，依赖计划为 {version}")
+    for key, entry in packages.items():
+        if key and not entry.get('link') and 'resolved' in entry and not is_strong_integrity(entry.get('integrity')):
+            problems.append(f"{key} 缺少有效的 sha512 integrity")
+    return problems
+
+def write_project_lock(path, lock, name):
+    lock = dict(lock, name=name)
+    lock['packages'] = dict(lock.get('packages', {}))
+    lock['packages'][''] = dict(lock['packages'].get('', {}), name=name)
+    with open(path / 'package-lock.json', 'w', encoding='utf-8') as f:
+        json.dump(lock, f, indent=2, ensure_ascii=False)
+    record_write(path / 'package-lock.json')
+
+def save_lock_cache(lock_file, lock_cache, plan=DEPENDENCY_PLAN):
+    # 首次安装后把 npm 生成的 lockfile 保存为规范 lockfile，之后的项目直接 npm ci
+    if not lock_cache or not lock_file.exists():
+        return
+    with open(lock_file, 'r', encoding='utf-8') as f:
+        lock = json.load(f)
+    if lock_problems(lock, plan):
+        return
+    target = lock_cache / f"{dependency_plan_hash(plan)}.json"
+    try:
+        lock_cache.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix='lock-', suffix='.tmp', dir=lock_cache)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(lock, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_name, target)
+        print(f"保存规范 lockfile: {target}")
+    except OSError:
+        pass
+
+def resolve_lock(plan=DEPENDENCY_PLAN):
+    # 只解析依赖树、生成 lockfile，不下载 tarball
+    with tempfile.TemporaryDirectory(prefix='electron-lock-') as tmp:
+        tmp_path = Path(tmp)
+        write_package_json(tmp_path, 'electron-lock-plan')
+        print("\n解析依赖树（仅生成 lockfile）...")
+        run_command(['npm', 'install', '--package-lock-only', '--no-audit', '--no-fund'], cwd=tmp_path)
+        with open(tmp_path / 'package-lock.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+def refresh_canonical_lock(plan=DEPENDENCY_PLAN):
+    # 重新生成随脚本提交的规范 lockfile
+    lock = resolve_lock(plan)
+    problems = lock_problems(lock, plan)
+    if problems:
+        raise ScaffoldError("生成的 lockfile 未通过校验:\n" + '\n'.join(f"  - {p}" for p in problems))
+    SHIPPED_LOCK_DIR.mkdir(parents=True, exist_ok=True)
+    target = SHIPPED_LOCK_DIR / f"{dependency_plan_hash(plan)}.json"
+    with open(target, 'w', encoding='utf-8') as f:
+        json.dump(lock, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    print(f"规范 lockfile 已写入: {target}")
+    print("请将其提交到仓库，之后创建的项目都会通过 npm ci 安装。")
+
+def snapshot_key(plan=DEPENDENCY_PLAN):
+    # Electron 二进制与平台相关，快照按依赖计划 + 平台 + 架构区分
+    raw = f"{dependency_plan_hash(plan)}:{sys.platform}:{platform.machine()}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+def tree_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+def reflink_file(src, dst):
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        if sys.platform.startswith('linux'):
+            import fcntl
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        else:
+            raise OSError("当前平台不支持 FICLONE")
+    shutil.copystat(src, dst)
+
+def detect_clone_mode(src, dst_dir):
+    # 用一个探测文件尝试 reflink，不支持时退回普通复制。hardlink 与快照共享 inode，只在显式指定时使用
+    probe = next((Path(root) / name for root, _, files in os.walk(src) for name in files
+                  if not os.path.islink(os.path.join(root, name))), None)
+    if probe is None:
+        return 'copy'
+    target = dst_dir / '.clone-probe'
+    try:
+        reflink_file(probe, target)
+        return 'reflink'
+    except OSError:
+        return 'copy'
+    finally:
+        if target.exists():
+            target.unlink()
+
+def writable_copy(copy_function):
+    # 快照中的文件是只读的，复制出的文件要恢复所有者的写权限
+    def copy(src, dst):
+        copy_function(src, dst)
+        os.chmod(dst, stat.S_IMODE(os.lstat(dst).st_mode) | stat.S_IWUSR)
+    return copy
+
+def set_tree_writable(root, writable):
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            path = os.path.join(dirpath, name)
+            if os.path.islink(path):
+                continue
+            mode = stat.S_IMODE(os.lstat(path).st_mode)
+            write_bits = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+            os.chmod(path, mode | stat.S_IWUSR if writable else mode & ~write_bits)
+
+def tree_digest(root, content=True):
+    # 按相对路径排序，对每个文件的内容（符号链接取其目标）求 sha256，得到整棵目录树的哈希。
+    # content 为 False 时只取大小与修改时间，不读取文件，用作快速检查的标记
+    digest = hashlib.sha256()
+    for dirpath, dirnames, files in os.walk(root):
+        dirnames.sort()
+        for name in sorted(dirnames + files):
+            path = os.path.join(dirpath, name)
+            if os.path.islink(path):
+                value = os.readlink(path).encode('utf-8')
+            elif not os.path.isfile(path):
+                continue
+            elif content:
+                value = file_digest(path, 'sha256')
+            else:
+                info = os.lstat(path)
+                value = f"{info.st_size}:{info.st_mtime_ns}".encode('ascii')
+            digest.update(os.path.relpath(path, root).encode('utf-8') + b'\0' + value + b'\0')
+    return digest.hexdigest()
+
+def clone_tree(src, dst, mode='auto'):
+    if mode == 'auto':
+        mode = detect_clone_mode(src, dst.parent)
+    if mode == 'reflink' and sys.platform == 'darwin':
+        # macOS 的 cp -c 使用 clonefile(2)
+        subprocess.run(['cp', '-c', '-R', str(src), str(dst)], check=True)
+        set_tree_writable(dst, True)
+        return mode
+    if mode == 'hardlink':
+        copy_function = os.link
+    else:
+        copy_function = writable_copy(reflink_file if mode == 'reflink' else shutil.copy2)
+    shutil.copytree(src, dst, symlinks=True, copy_function=copy_function)
+    return mode
+
+def load_snapshot_meta(snapshot):
+    with open(snapshot / 'meta.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_snapshot_meta(snapshot, meta):
+    # 批量模式下多个进程会同时更新 last_used，临时文件名必须唯一
+    fd, tmp_name = tempfile.mkstemp(prefix='meta-', suffix='.tmp', dir=snapshot)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp_name, snapshot / 'meta.json')
+
+def find_snapshot(root, key):
+    snapshot = root / key
+    if (snapshot / 'meta.json').exists() and (snapshot / 'node_modules').is_dir():
+        return snapshot
+    return None
+
+def capture_snapshot(root, key, project_path):
+    # 先复制到临时目录，再整体重命名，避免并发创建时出现半成品快照
+    if find_snapshot(root, key):
+        return
+    root.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f"{key[:12]}-", dir=root))
+    try:
+        # 快照本身不与项目共享 inode，否则项目中的修改会污染快照；快照中的文件设为只读，
+        # 并记录内容哈希，--clone-mode hardlink 恢复前据此确认快照未被修改
+        mode = clone_tree(project_path / 'node_modules', staging / 'node_modules')
+        set_tree_writable(staging / 'node_modules', False)
+        lock_file = project_path / 'package-lock.json'
+        if lock_file.exists():
+            shutil.copy2(lock_file, staging / 'package-lock.json')
+        now = time.time()
+        save_snapshot_meta(staging, {
+            "key": key,
+            "plan": DEPENDENCY_PLAN,
+            "created": now,
+            "last_used": now,
+            "size": tree_size(staging / 'node_modules'),
+            "tree_hash": tree_digest(staging / 'node_modules'),
+            "stat_hash": tree_digest(staging / 'node_modules', content=False)
+        })
+        try:
+            os.rename(staging, root / key)
+            print(f"保存 node_modules 快照 ({mode}): {root / key}")
+        except OSError:
+            # 其他进程已经写入了同一个快照
+            pass
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging, ignore_errors=True)
+
+def restore_snapshot(snapshot, project_path, name, mode='auto'):
+    # 返回 False 表示快照已损坏并被删除，需要重新安装
+    meta = load_snapshot_meta(snapshot)
+    if mode == 'hardlink':
+        # 硬链接与快照共享 inode，项目中对文件的原地修改会直接改写快照
+        if 'tree_hash' not in meta:
+            print("快照没有记录内容哈希，改用 copy 方式克隆")
+            mode = 'copy'
+        elif tree_digest(snapshot / 'node_modules', content=False) != meta.get('stat_hash'):
+            # 大小或修改时间有变化时才对全部内容求哈希，内容未变则更新标记
+            if tree_digest(snapshot / 'node_modules') != meta['tree_hash']:
+                print(f"快照内容与记录的哈希不一致，已删除: {snapshot}")
+                shutil.rmtree(snapshot, ignore_errors=True)
+                return False
+            meta['stat_hash'] = tree_digest(snapshot / 'node_modules', content=False)
+    if (project_path / 'node_modules').exists():
+        # 更新已有项目时先移除旧的 node_modules
+        shutil.rmtree(project_path / 'node_modules')
+    used_mode = clone_tree(snapshot / 'node_modules', project_path / 'node_modules', mode)
+    lock_file = snapshot / 'package-lock.json'
+    if lock_file.exists():
+        with open(lock_file, 'r', encoding='utf-8') as f:
+            lock = json.load(f)
+        lock['name'] = name
+        lock.setdefault('packages', {}).setdefault('', {})['name'] = name
+        with open(project_path / 'package-lock.json', 'w', encoding='utf-8') as f:
+            json.dump(lock, f, indent=2, ensure_ascii=False)
+    meta['last_used'] = time.time()
+    save_snapshot_meta(snapshot, meta)
+    print(f"从快照克隆 node_modules ({used_mode}): {snapshot}")
+    return True
+
+def evict_snapshots(root, max_bytes=SNAPSHOT_MAX_BYTES, max_age_days=SNAPSHOT_MAX_AGE_DAYS):
+    # 先删除超过期限未使用的快照，再按最近使用时间淘汰到总大小不超过上限
+    if not root.exists():
+        return []
+    snapshots = []
+    for snapshot in root.iterdir():
+        if not (snapshot / 'meta.json').exists():
+            continue
+        try:
+            snapshots.append((snapshot, load_snapshot_meta(snapshot)))
+        except (OSError, ValueError):
+            continue
+
+    evicted = []
+    cutoff = time.time() - max_age_days * 86400
+    for snapshot, meta in list(snapshots):
+        if meta.get('last_used', 0) < cutoff:
+            evicted.append(snapshot)
+            snapshots.remove((snapshot, meta))
+
+    snapshots.sort(key=lambda item: item[1].get('last_used', 0))
+    total = sum(meta.get('size', 0) for _, meta in snapshots)
+    while snapshots and total > max_bytes:
+        snapshot, meta = snapshots.pop(0)
+        total -= meta.get('size', 0)
+        evicted.append(snapshot)
+
+    for snapshot in evicted:
+        shutil.rmtree(snapshot, ignore_errors=True)
+        print(f"清理 node_modules 快照: {snapshot.name}")
+    return evicted
+
+# 模板语法：{{ 变量 }}、{{ 变量|html }}、{{ 变量|js }}，以及独占一行的 {% if [not] 开关 %} / {% else %} / {% endif %}
+_TEMPLATE_TOKEN = re.compile(r'^[ \t]*\{%(.*?)%\}[ \t]*\n|\{\{\s*(\w+)(?:\|(\w+))?\s*\}\}', re.M)
+_TEMPLATE_FILTERS = {'str': str, 'html': html.escape, 'js': lambda value: json.dumps(value, ensure_ascii=False)}
+
+def compile_template(source, name='<template>'):
+    # 把模板编译成一个 Python 函数：字面量作为常量，变量与条件块直接生成代码
+    constants = []
+    code = ['def render(ctx):', '    out = []', '    a = out.append']
+    depth = 1
+
+    def emit(line):
+        code.append('    ' * depth + line)
+
+    pos = 0
+    for m in _TEMPLATE_TOKEN.finditer(source):
+        if m.start() > pos:
+            constants.append(source[pos:m.start()])
+            emit(f"a(_c[{len(constants) - 1}])")
+        pos = m.end()
+        if m.group(1) is not None:
+            parts = m.group(1).split()
+            if parts[:1] == ['if'] and len(parts) in (2, 3) and (len(parts) == 2 or parts[1] == 'not'):
+                emit(f"if {'not ' if len(parts) == 3 else ''}ctx[{parts[-1]!r}]:")
+                depth += 1
+                emit('pass')
+            elif parts == ['else'] and depth > 1:
+                depth -= 1
+                emit('else:')
+                depth += 1
+                emit('pass')
+            elif parts == ['endif'] and depth > 1:
+                depth -= 1
+            else:
+                raise ValueError(f"模板 {name} 中无法识别的标签: {m.group(0).strip()}")
+        else:
+            flt = m.group(3) or 'str'
+            if flt not in _TEMPLATE_FILTERS:
+                raise ValueError(f"模板 {name} 中未知的过滤器: {flt}")
+            emit(f"a(_f[{flt!r}](ctx[{m.group(2)!r}]))")
+    if pos < len(source):
+        constants.append(source[pos:])
+        emit(f"a(_c[{len(constants) - 1}])")
+    if depth != 1:
+        raise ValueError(f"模板 {name} 中的 if 没有对应的 endif")
+    code.append("    return ''.join(out)")
+
+    namespace = {'_c': constants, '_f': _TEMPLATE_FILTERS}
+    exec(compile('\n'.join(code), f"<template {name}>", 'exec'), namespace)
+    return namespace['render']
+
+@functools.lru_cache(maxsize=None)
+def load_templates(template_dir=TEMPLATE_DIR):
+    # 每个进程只读取、编译一次；批量模式在 fork 前预先编译
+    templates = {}
+    for path in sorted(template_dir.rglob('*')):
+        if path.is_file():
+            rel_path = path.relative_to(template_dir).as_posix()
+            templates[rel_path] = compile_template(path.read_text(encoding='utf-8'), rel_path)
+    return templates
+
+def template_context(overrides=None):
+    context = dict(DEFAULT_TEMPLATE_CONTEXT)
+    for key, value in (overrides or {}).items():
+        if key not in context:
+            raise ValueError(f"未知的模板变量: {key}")
+        context[key] = value
+    return context
+
+# 图标输出：ICO 供 Windows 安装包使用，PNG 供 Linux，ICNS 供 macOS；每种尺寸单独光栅化，小尺寸同样清晰
+ICON_OUTPUTS = {
+    'static/icon.ico': (16, 24, 32, 48, 64, 128, 256),
+    'static/icon.png': (512,),
+    'static/icon.icns': (16, 32, 64, 128, 256, 512),
+}
+# package.json 的 build 中各平台使用的图标
+BUILD_ICONS = {'win': 'static/icon.ico', 'mac': 'static/icon.icns', 'linux': 'static/icon.png'}
+# ICNS 中以 PNG 数据存放的图标类型
+ICNS_TYPES = {16: b'icp4', 32: b'icp5', 64: b'icp6', 128: b'ic07', 256: b'ic08', 512: b'ic09'}
+# 光栅化算法变化时递增，使旧缓存失效
+ICON_RASTER_VERSION = 1
+ICON_SUPERSAMPLE = 4
+
+_SVG_NS = '{http://www.w3.org/2000/svg}'
+_PATH_TOKEN = re.compile(r'[MmLlHhVvCcSsQqTtAaZz]|[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?')
+_NAMED_COLORS = {
+    'black': (0, 0, 0), 'white': (255, 255, 255), 'red': (255, 0, 0), 'green': (0, 128, 0),
+    'blue': (0, 0, 255), 'gray': (128, 128, 128), 'grey': (128, 128, 128),
+}
+
+def _svg_numbers(text):
+    return [float(n) for n in re.findall(r'[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?', text or '')]
+
+def _matmul(m, n):
+    a, b, c, d, e, f = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (a * a2 + c * b2, b * a2 + d * b2, a * c2 + c * d2, b * c2 + d * d2,
+            a * e2 + c * f2 + e, b * e2 + d * f2 + f)
+
+def _parse_transform(text):
+    # 支持 matrix/translate/scale/rotate，按书写顺序右乘
+    m = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+    for name, params in re.findall(r'(\w+)\s*\(([^)]*)\)', text or ''):
+        v = _svg_numbers(params)
+        if name == 'matrix' and len(v) == 6:
+            t = tuple(v)
+        elif name == 'translate' and v:
+            t = (1.0, 0.0, 0.0, 1.0, v[0], v[1] if len(v) > 1 else 0.0)
+        elif name == 'scale' and v:
+            t = (v[0], 0.0, 0.0, v[1] if len(v) > 1 else v[0], 0.0, 0.0)
+        elif name == 'rotate' and v:
+            r = math.radians(v[0])
+            cos, sin = math.cos(r), math.sin(r)
+            cx, cy = (v[1], v[2]) if len(v) == 3 else (0.0, 0.0)
+            t = (cos, sin, -sin, cos, cx - cos * cx + sin * cy, cy - sin * cx - cos * cy)
+        else:
+            raise ScaffoldError(f"图标 SVG 中不支持的变换: {name}({params})")
+        m = _matmul(m, t)
+    return m
+
+def _parse_color(text):
+    # 返回 (r, g, b, a)，a 取 0~1；none 返回 None
+    text = (text or '').strip().lower()
+    if text in ('', 'none', 'transparent'):
+        return None
+    if text.startswith('#'):
+        hex_digits = text[1:]
+        if len(hex_digits) in (3, 4):
+            hex_digits = ''.join(ch * 2 for ch in hex_digits)
+        if len(hex_digits) in (6, 8):
+            channels = [int(hex_digits[i:i + 2], 16) for i in range(0, len(hex_digits), 2)]
+            return (*channels[:3], channels[3] / 255 if len(channels) == 4 else 1.0)
+    elif text.startswith('rgb'):
+        v = _svg_numbers(text)
+        if len(v) in (3, 4):
+            return (int(v[0]), int(v[1]), int(v[2]), v[3] if len(v) == 4 else 1.0)
+    elif text in _NAMED_COLORS:
+        return (*_NAMED_COLORS[text], 1.0)
+    raise ScaffoldError(f"图标 SVG 中不支持的颜色: {text}")
+
+def _flatten_curve(points, start, controls, tolerance):
+    # 按控制多边形长度估算分段数，把二次/三次贝塞尔曲线折线化
+    pts = [start] + controls
+    length = sum(math.dist(pts[i], pts[i + 1]) for i in range(len(pts) - 1))
+    steps = max(1, min(64, math.ceil(math.sqrt(length / tolerance))))
+    for i in range(1, steps + 1):
+        t = i / steps
+        level = pts
+        while len(level) > 1:
+            level = [(p[0] + (q[0] - p[0]) * t, p[1] + (q[1] - p[1]) * t) for p, q in zip(level, level[1:])]
+        points.append(level[0])
+
+def _path_polygons(d, tolerance):
+    tokens = _PATH_TOKEN.findall(d or '')
+    polygons, current = [], []
+    x = y = start_x = start_y = 0.0
+    last_control, last_command = None, None
+    i, command = 0, None
+
+    def take(n):
+        nonlocal i
+        values = tokens[i:i + n]
+        if len(values) < n or any(v.isalpha() for v in values):
+            raise ScaffoldError(f"图标 SVG 路径参数不足: {d}")
+        i += n
+        return [float(v) for v in values]
+
+    while i < len(tokens):
+        if tokens[i].isalpha():
+            command = tokens[i]
+            i += 1
+        elif command is None:
+            raise ScaffoldError(f"图标 SVG 路径缺少命令: {d}")
+        cmd = command.upper()
+        rel = command.islower()
+        ox, oy = (x, y) if rel else (0.0, 0.0)
+        control = None
+        if cmd == 'M':
+            if len(current) > 1:
+                polygons.append(current)
+            x, y = take(2)
+            x, y = x + ox, y + oy
+            start_x, start_y = x, y
+            current = [(x, y)]
+            # M 后续的坐标对按 L 处理
+            command = 'l' if rel else 'L'
+        elif cmd == 'L':
+            px, py = take(2)
+            x, y = px + ox, py + oy
+            current.append((x, y))
+        elif cmd == 'H':
+            x = take(1)[0] + ox
+            current.append((x, y))
+        elif cmd == 'V':
+            y = take(1)[0] + oy
+            current.append((x, y))
+        elif cmd in ('C', 'S', 'Q', 'T'):
+            if cmd == 'C':
+                v = take(6)
+                c1, control = (v[0] + ox, v[1] + oy), (v[2] + ox, v[3] + oy)
+                controls = [c1, control]
+            elif cmd == 'S':
+                v = take(4)
+                c1 = (2 * x - last_control[0], 2 * y - last_control[1]) if last_command in 'CS' else (x, y)
+                control = (v[0] + ox, v[1] + oy)
+                controls = [c1, control]
+            elif cmd == 'Q':
+                v = take(4)
+                control = (v[0] + ox, v[1] + oy)
+                controls = [control]
+            else:
+                v = take(2)
+                control = (2 * x - last_control[0], 2 * y - last_control[1]) if last_command in 'QT' else (x, y)
+                controls = [control]
+            end = (v[-2] + ox, v[-1] + oy)
+            _flatten_curve(current, (x, y), controls + [end], tolerance)
+            x, y = end
+        elif cmd == 'Z':
+            if len(current) > 1:
+                polygons.append(current)
+            x, y = start_x, start_y
+            current = [(x, y)]
+        else:
+            raise ScaffoldError(f"图标 SVG 中不支持的路径命令: {command}")
+        last_control, last_command = control, cmd
+    if len(current) > 1:
+        polygons.append(current)
+    return polygons
+
+def _ellipse_polygon(cx, cy, rx, ry, tolerance, start=0.0, end=2 * math.pi, points=None):
+    # 分段数保证弦高不超过容差
+    r = max(rx, ry)
+    step = 2 * math.acos(max(-1.0, 1 - tolerance / r)) if r > tolerance else math.pi / 2
+    steps = max(2, math.ceil((end - start) / max(step, 1e-3)))
+    points = [] if points is None else points
+    for i in range(steps + 1):
+        a = start + (end - start) * i / steps
+        points.append((cx + rx * math.cos(a), cy + ry * math.sin(a)))
+    return points
+
+def _rect_polygon(x, y, w, h, rx, ry, tolerance):
+    if rx <= 0 or ry <= 0:
+        return [(x, y), (x + w, y), (x + w, y + h), (x, y + h)]
+    rx, ry = min(rx, w / 2), min(ry, h / 2)
+    points = []
+    for cx, cy, start in ((x + w - rx, y + ry, -math.pi / 2), (x + w - rx, y + h - ry, 0.0),
+                          (x + rx, y + h - ry, math.pi / 2), (x + rx, y + ry, math.pi)):
+        _ellipse_polygon(cx, cy, rx, ry, tolerance, start, start + math.pi / 2, points)
+    return points
+
+def _shape_polygons(element, tag, tolerance):
+    a = element.attrib
+    num = lambda key, default=0.0: float(a[key]) if key in a else default
+    if tag == 'rect':
+        rx, ry = a.get('rx'), a.get('ry')
+        rx = float(rx if rx is not None else ry or 0)
+        ry = float(ry if ry is not None else rx)
+        return [_rect_polygon(num('x'), num('y'), num('width'), num('height'), rx, ry, tolerance)]
+    if tag == 'circle':
+        return [_ellipse_polygon(num('cx'), num('cy'), num('r'), num('r'), tolerance)]
+    if tag == 'ellipse':
+        return [_ellipse_polygon(num('cx'), num('cy'), num('rx'), num('ry'), tolerance)]
+    if tag in ('polygon', 'polyline'):
+        v = _svg_numbers(a.get('points'))
+        return [list(zip(v[0::2], v[1::2]))]
+    if tag == 'path':
+        return _path_polygons(a.get('d'), tolerance)
+    raise ScaffoldError(f"图标 SVG 中不支持的元素: <{tag}>")
+
+def parse_icon_svg(svg_text):
+    # 解析出 (viewBox, [(多边形列表, 变换, 颜色, 不透明度)])；只支持图标常用的纯色填充子集
+    try:
+        root = ET.fromstring(svg_text)
+    except ET.ParseError as e:
+        raise ScaffoldError(f"解析图标 SVG 时出错: {e}") from e
+    view_box = _svg_numbers(root.get('viewBox'))
+    if len(view_box) != 4:
+        view_box = [0.0, 0.0, float(root.get('width', 0)), float(root.get('height', 0))]
+    if view_box[2] <= 0 or view_box[3] <= 0:
+        raise ScaffoldError("图标 SVG 缺少有效的 viewBox 或宽高")
+
+    shapes = []
+
+    def walk(element, matrix, fill, opacity):
+        for child in element:
+            tag = child.tag.replace(_SVG_NS, '')
+            if tag in ('title', 'desc', 'metadata'):
+                continue
+            child_matrix = _matmul(matrix, _parse_transform(child.get('transform')))
+            child_fill = child.get('fill', fill)
+            child_opacity = opacity * float(child.get('opacity', 1))
+            if tag == 'g':
+                walk(child, child_matrix, child_fill, child_opacity)
+                continue
+            color = _parse_color(child_fill)
+            if color is None:
+                continue
+            alpha = color[3] * child_opacity * float(child.get('fill-opacity', 1))
+            shapes.append((child, tag, child_matrix, color[:3], alpha))
+
+    walk(root, (1.0, 0.0, 0.0, 1.0, 0.0, 0.0), root.get('fill', 'black'), 1.0)
+    return view_box, shapes
+
+def _coverage_rows(polygons, size):
+    # 非零环绕规则扫描线填充：每行 ICON_SUPERSAMPLE 条子扫描线，水平方向按跨度精确计算覆盖比例
+    edges = []
+    for polygon in polygons:
+        for (x0, y0), (x1, y1) in zip(polygon, polygon[1:] + polygon[:1]):
+            if y0 == y1:
+                continue
+            direction = 1 if y1 > y0 else -1
+            if y0 > y1:
+                x0, y0, x1, y1 = x1, y1, x0, y0
+            edges.append((y0, y1, x0, (x1 - x0) / (y1 - y0), direction))
+    if not edges:
+        return {}
+    top = max(0, int(min(e[0] for e in edges)))
+    bottom = min(size, math.ceil(max(e[1] for e in edges)))
+    weight = 1 / ICON_SUPERSAMPLE
+    rows = {}
+    for row in range(top, bottom):
+        active = [e for e in edges if e[0] < row + 1 and e[1] > row]
+        if not active:
+            continue
+        direct = [0.0] * (size + 1)
+        run = [0.0] * (size + 2)
+        lo, hi = size, 0
+        for sub in range(ICON_SUPERSAMPLE):
+            y = row + (sub + 0.5) * weight
+            crossings = sorted((x0 + (y - y0) * slope, d) for y0, y1, x0, slope, d in active if y0 <= y < y1)
+            winding = 0
+            for (xa, da), (xb, _) in zip(crossings, crossings[1:]):
+                winding += da
+                if winding == 0:
+                    continue
+                a, b = max(0.0, xa), min(float(size), xb)
+                if b <= a:
+                    continue
+                ia, ib = int(a), int(b)
+                lo, hi = min(lo, ia), max(hi, ib + 1)
+                if ia == ib:
+                    direct[ia] += (b - a) * weight
+                else:
+                    direct[ia] += (ia + 1 - a) * weight
+                    direct[ib] += (b - ib) * weight
+                    run[ia + 1] += weight
+                    run[ib] -= weight
+        if lo >= hi:
+            continue
+        hi = min(hi, size)
+        coverage, level = [], 0.0
+        for x in range(lo):
+            level += run[x]
+        for x in range(lo, hi):
+            level += run[x]
+            coverage.append(min(1.0, direct[x] + level))
+        rows[row] = (lo, coverage)
+    return rows
+
+def rasterize_svg(svg_text, size):
+    # 返回 size x size 的 RGBA 字节（非预乘），按元素顺序做 source-over 合成
+    view_box, shapes = parse_icon_svg(svg_text)
+    scale = min(size / view_box[2], size / view_box[3])
+    base = (scale, 0.0, 0.0, scale, -view_box[0] * scale, -view_box[1] * scale)
+    # 预乘颜色缓冲区，取值 0~1
+    pixels = [0.0] * (size * size * 4)
+    for element, tag, matrix, rgb, alpha in shapes:
+        m = _matmul(base, matrix)
+        unit_scale = math.sqrt(abs(m[0] * m[3] - m[1] * m[2])) or 1.0
+        polygons = _shape_polygons(element, tag, 0.2 / unit_scale)
+        polygons = [[(m[0] * x + m[2] * y + m[4], m[1] * x + m[3] * y + m[5]) for x, y in p] for p in polygons]
+        r, g, b = (c / 255 for c in rgb)
+        for row, (lo, coverage) in _coverage_rows(polygons, size).items():
+            offset = (row * size + lo) * 4
+            for cov in coverage:
+                src = cov * alpha
+                if src > 0:
+                    keep = 1 - src
+                    pixels[offset] = r * src + pixels[offset] * keep
+                    pixels[offset + 1] = g * src + pixels[offset + 1] * keep
+                    pixels[offset + 2] = b * src + pixels[offset + 2] * keep
+                    pixels[offset + 3] = src + pixels[offset + 3] * keep
+                offset += 4
+    out = bytearray(size * size * 4)
+    for i in range(0, len(pixels), 4):
+        a = pixels[i + 3]
+        if a > 0:
+            out[i] = min(255, round(pixels[i] / a * 255))
+            out[i + 1] = min(255, round(pixels[i + 1] / a * 255))
+            out[i + 2] = min(255, round(pixels[i + 2] / a * 255))
+            out[i + 3] = min(255, round(a * 255))
+    return bytes(out)
+
+def encode_png(rgba, size):
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+    stride = size * 4
+    raw = b''.join(b'\x00' + rgba[y * stride:(y + 1) * stride] for y in range(size))
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', size, size, 8, 6, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(raw, 9))
+            + chunk(b'IEND', b''))
+
+def encode_ico(pngs):
+    # ICO 目录项后直接存放 PNG 数据（Windows Vista 起支持），256 在目录项中记为 0
+    header = struct.pack('<HHH', 0, 1, len(pngs))
+    entries, offset = [], 6 + 16 * len(pngs)
+    for size, data in pngs:
+        entries.append(struct.pack('<BBBBHHII', size % 256, size % 256, 0, 0, 1, 32, len(data), offset))
+        offset += len(data)
+    return header + b''.join(entries) + b''.join(data for _, data in pngs)
+
+def encode_icns(pngs):
+    body = b''.join(ICNS_TYPES[size] + struct.pack('>I', len(data) + 8) + data for size, data in pngs)
+    return b'icns' + struct.pack('>I', len(body) + 8) + body
+
+def icon_cache_key(svg_text, outputs=ICON_OUTPUTS):
+    payload = json.dumps({"svg": svg_text, "outputs": outputs, "version": ICON_RASTER_VERSION}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+@functools.lru_cache(maxsize=None)
+@profiled('render_icons')
+def render_icons(svg_text, icon_cache=DEFAULT_ICON_CACHE):
+    # 同一份 SVG 与尺寸集合只光栅化一次：进程内缓存，加上按内容哈希存放的磁盘缓存
+    key = icon_cache_key(svg_text)
+    cached = icon_cache / key if icon_cache else None
+    if cached and all((cached / Path(rel_path).name).is_file() for rel_path in ICON_OUTPUTS):
+        return {rel_path: (cached / Path(rel_path).name).read_bytes() for rel_path in ICON_OUTPUTS}
+
+    print("光栅化图标: " + ', '.join(Path(rel_path).name for rel_path in ICON_OUTPUTS))
+    pngs = {}
+    for size in sorted({size for sizes in ICON_OUTPUTS.values() for size in sizes}):
+        pngs[size] = encode_png(rasterize_svg(svg_text, size), size)
+    encoders = {'.ico': encode_ico, '.icns': encode_icns, '.png': lambda images: images[-1][1]}
+    assets = {rel_path: encoders[Path(rel_path).suffix]([(size, pngs[size]) for size in sizes])
+              for rel_path, sizes in ICON_OUTPUTS.items()}
+
+    if cached:
+        # 先写入临时目录再整体重命名，批量模式下多个进程可以安全地同时写入
+        try:
+            icon_cache.mkdir(parents=True, exist_ok=True)
+            staging = Path(tempfile.mkdtemp(prefix=f"{key[:12]}-", dir=icon_cache))
+            for rel_path, data in assets.items():
+                (staging / Path(rel_path).name).write_bytes(data)
+            try:
+                os.rename(staging, cached)
+            except OSError:
+                shutil.rmtree(staging, ignore_errors=True)
+        except OSError:
+            pass
+    return assets
+
+@profiled('render_project')
+def render_project(context=None, template_dir=TEMPLATE_DIR, icon_cache=DEFAULT_ICON_CACHE):
+    # 文本文件来自模板；二进制图标由渲染后的 static/icon.svg 光栅化得到（bytes）。
+    # 整个文件包在关闭的功能开关中、渲染结果为空的模板不生成文件
+    context = template_context(context)
+    rendered = {}
+    for rel_path, render in load_templates(template_dir).items():
+        content = render(context)
+        if content.strip():
+            rendered[rel_path] = content
+    if 'static/icon.svg' in rendered:
+        rendered.update(render_icons(rendered['static/icon.svg'], icon_cache))
+    return rendered
+
+@profiled('update_package_json')
+def update_package_json(path, context=None):
+    context = template_context(context)
     package_json = path / 'package.json'
     try:
         with open(package_json, 'r', encoding='utf-8') as f:
@@ -59,8 +1434,8 @@ def update_package_json(path):
         # 添加打包相关配置
         package['scripts']['build'] = 'electron-builder'
         package['build'] = {
-            "appId": "com.luoxiaoshan.cheshire",
-            "productName": "CheshireDemo",
+            "appId": context['app_id'],
+            "productName": context['product_name'],
             "directories": {
                 "output": "dist"
             },
@@ -68,997 +1443,773 @@ def update_package_json(path):
                 "target": [
                     "nsis"
                 ],
-                "icon": "static/icon.ico"
+                "icon": BUILD_ICONS['win']
+            },
+            "mac": {
+                "icon": BUILD_ICONS['mac']
+            },
+            "linux": {
+                "icon": BUILD_ICONS['linux']
             },
             "nsis": {
                 "oneClick": False,
                 "allowToChangeInstallationDirectory": True,
                 "createDesktopShortcut": True,
                 "createStartMenuShortcut": True,
-                "shortcutName": "CheshireDemo"
+                "shortcutName": context['product_name']
             }
         }
         
         with open(package_json, 'w', encoding='utf-8') as f:
             json.dump(package, f, indent=2, ensure_ascii=False)
+        record_write(package_json)
         print("更新 package.json 文件。")
     except Exception as e:
-        print(f"更新 package.json 时出错: {e}")
-        sys.exit(1)
+        raise ScaffoldError(f"更新 package.json 时出错: {e}") from e
 
-def create_static_files(project_path):
-    # 创建 static 目录
-    static_path = project_path / 'static'
-    static_path.mkdir()
-
-    # 创建 css 目录并添加 styles.css 文件
-    css_path = static_path / 'css'
-    css_path.mkdir()
-    styles_css_content = """/* styles.css */
-body {
-    font-family: Arial, sans-serif;
-    margin: 0;
-    background: #f7f7f7;
-    overflow-y: scroll;
-    padding-top: 32px;
-}
-
-.title-bar {
-    background: #333;
-    height: 32px;
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    padding: 0 8px;
-    color: #fff;
-    position: fixed;
-    top: 0;
-    left: 0;
-    right: 0;
-    z-index: 1000;
-}
+@profiled('merge_build_icons')
+def merge_build_icons(path):
+    # 为 build 中缺少图标的平台补上图标，保留用户对打包配置的其他修改；没有变化时不写文件
+    package_json = path / 'package.json'
+    try:
+        with open(package_json, 'r', encoding='utf-8') as f:
+            package = json.load(f)
+        build = package.setdefault('build', {})
+        missing = [key for key in BUILD_ICONS if 'icon' not in build.get(key, {})]
+        if not missing:
+            return
+        for key in missing:
+            build.setdefault(key, {})['icon'] = BUILD_ICONS[key]
+        with open(package_json, 'w', encoding='utf-8') as f:
+            json.dump(package, f, indent=2, ensure_ascii=False)
+        record_write(package_json)
+        print(f"package.json 补充图标配置: {', '.join(missing)}")
+    except Exception as e:
+        raise ScaffoldError(f"更新 package.json 时出错: {e}") from e
+
+def reserve_project_dir(base, name=None):
+    # mkdir 本身是原子的，先占住最终目录名；未指定名称时自动追加序号，避免同一秒内两次运行撞名
+    base.mkdir(parents=True, exist_ok=True)
+    if name:
+        project_path = base / name
+        try:
+            project_path.mkdir()
+        except FileExistsError:
+            raise ScaffoldError(f"目录 '{name}' 已存在。请删除或选择其他项目名称。")
+        return project_path
+
+    stamp = int(time.time())
+    suffix = 0
+    while True:
+        candidate = f"my-electron-app-{stamp}" + (f"-{suffix}" if suffix else "")
+        try:
+            (base / candidate).mkdir()
+            return base / candidate
+        except FileExistsError:
+            suffix += 1
+
+def plan_project_install(project_path, name, args):
+    # 能从快照恢复时直接克隆并返回 None；否则准备好 lockfile，返回 (命令, 环境变量, 是否缓存 lockfile)
+    snapshot = None if args.no_snapshot else find_snapshot(args.snapshots, snapshot_key())
+    if snapshot and restore_snapshot(snapshot, project_path, name, args.clone_mode):
+        return None
+    if args.offline or store_lock_path(args.store).exists():
+        print(f"从离线仓库安装: {args.store}")
+        command, env = prepare_store_install(project_path, args.store, name)
+        return command, env, False
+    command, save_lock = prepare_install(project_path, name, args.require_lock, args.lock_cache)
+    return command, None, save_lock
+
+def finish_project_install(project_path, args, save_lock):
+    if save_lock:
+        save_lock_cache(project_path / 'package-lock.json', args.lock_cache)
+    if not args.no_snapshot and (project_path / 'node_modules').is_dir():
+        capture_snapshot(args.snapshots, snapshot_key(), project_path)
+
+@profiled('install_project_dependencies')
+def install_project_dependencies(project_path, name, args):
+    plan = plan_project_install(project_path, name, args)
+    if plan is None:
+        return
+    command, env, save_lock = plan
+    run_command(command, cwd=project_path, env=env)
+    finish_project_install(project_path, args, save_lock)
+
+async def install_project_dependencies_async(project_path, name, args):
+    # 与 install_project_dependencies 相同，但 npm 作为异步子进程运行，其余文件操作放到线程中
+    with profile_phase('install_project_dependencies'):
+        plan = await asyncio.to_thread(plan_project_install, project_path, name, args)
+        if plan is None:
+            return
+        command, env, save_lock = plan
+        await run_command_async(command, cwd=project_path, env=env, prefix='[npm]')
+        await asyncio.to_thread(finish_project_install, project_path, args, save_lock)
+
+@profiled('write_files')
+def write_files(root, files, max_workers=8):
+    # 先创建全部目录，再并发写入；网络文件系统上每个文件的往返延迟可以相互重叠
+    for directory in sorted({(root / rel_path).parent for rel_path in files}):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    def write(item):
+        rel_path, content = item
+        target = root / rel_path
+        if isinstance(content, bytes):
+            target.write_bytes(content)
+            return target
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return target
 
-/* 其他样式... */
-"""
-    create_file(css_path / 'styles.css', styles_css_content)
-
-    # 创建 js 目录并添加 renderer.js 文件
-    js_path = static_path / 'js'
-    js_path.mkdir()
-    renderer_js_content = """// renderer.js
-const { ipcRenderer } = require('electron');
-const { dialog } = require('@electron/remote');
-const axios = require('axios');
-
-let currentConfig = {};
-
-// 创建一个 API 服务模块
-const apiService = {
-    async fetchPosts() {
-        try {
-            const response = await axios.get('https://jsonplaceholder.typicode.com/posts');
-            return response.data;
-        } catch (error) {
-            console.error('获取数据时出错:', error);
-            throw error;
-        }
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            paths = list(pool.map(write, files.items()))
+    except OSError as e:
+        raise ScaffoldError(f"写入文件时出错: {e}") from e
+    # 新项目先生成在临时目录中，这里只输出相对项目根目录的路径
+    for rel_path, path in zip(files, paths):
+        record_write(path)
+        print(f"创建文件: {rel_path}")
+    return paths
+
+def fsync_dir(path):
+    # Windows 不支持对目录执行 fsync
+    if os.name == 'nt':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+@profiled('flush_tree')
+def flush_tree(root, exclude=('node_modules',)):
+    # 批量持久化：并发 fsync 生成的全部文件与目录，node_modules 由 npm 负责
+    files, dirs = [], [root]
+    for current, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in exclude]
+        dirs.extend(Path(current) / d for d in dirnames)
+        files.extend(Path(current) / f for f in filenames)
+
+    def sync_file(path):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(sync_file, files))
+        list(pool.map(fsync_dir, dirs))
+
+def publish_project(staging, project_path):
+    # POSIX 上 rename 可以原子地替换预留的空目录；Windows 需要先删除预留目录
+    if os.name == 'nt':
+        project_path.rmdir()
+    try:
+        os.rename(staging, project_path)
+    except OSError as e:
+        raise ScaffoldError(f"发布项目目录 {project_path} 时出错: {e}") from e
+
+def content_hash(content):
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return 'sha256:' + hashlib.sha256(content).hexdigest()
+
+def file_hash(path, binary=False):
+    # 文本文件以文本方式读取，使 Windows 下写入的 CRLF 与模板输出得到相同的哈希
+    if binary:
+        with open(path, 'rb') as f:
+            return content_hash(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return content_hash(f.read())
+
+def load_manifest(project_path):
+    manifest_path = project_path / MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_manifest(project_path, context, files):
+    manifest = {
+        "version": 1,
+        "dependency_plan": dependency_plan_hash(),
+        "context": context,
+        "files": dict(sorted(files.items()))
     }
-};
-
-// 初始化时获取配置并根据配置更新页面
-async function loadConfig() {
-    currentConfig = await ipcRenderer.invoke('get-config');
-    updateUIFromConfig();
-}
-
-function updateUIFromConfig() {
-    const body = document.body;
-    const titleBar = document.querySelector('.title-bar');
-    
-    // 控制自定义标题栏显示
-    if (currentConfig.menuBarVisible) {
-        titleBar.style.display = 'none';  // 系统标题栏显示时，隐藏自定义标题栏
-        body.style.paddingTop = '0';
-        document.getElementById('btn-toggle-menu-bar').textContent = '显示自定义标题栏';
-    } else {
-        titleBar.style.display = 'flex';  // 系统标题栏隐藏时，显示自定义标题栏
-        body.style.paddingTop = '32px';
-        document.getElementById('btn-toggle-menu-bar').textContent = '显示系统标题栏';
+    manifest_path = project_path / MANIFEST_NAME
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    record_write(manifest_path)
+
+@profiled('create_project_files')
+def create_project_files(project_path, context=None, icon_cache=DEFAULT_ICON_CACHE):
+    # 模板渲染在内存中完成，然后逐个写入项目目录，最后写入清单
+    context = template_context(context)
+    rendered = render_project(context, icon_cache=icon_cache)
+    write_files(project_path, rendered)
+    ensure_config(project_path)
+    write_manifest(project_path, context, {rel: content_hash(content) for rel, content in rendered.items()})
+
+def context_for_update(args, manifest):
+    # 沿用清单中记录的模板变量，命令行显式给出的值优先
+    overrides = {key: value for key, value in (manifest or {}).get('context', {}).items()
+                 if key in DEFAULT_TEMPLATE_CONTEXT}
+    for key in ('app_title', 'product_name', 'app_id'):
+        if getattr(args, key) is not None:
+            overrides[key] = getattr(args, key)
+    if args.no_posts_demo:
+        overrides['posts_demo'] = False
+    if args.no_app_menu:
+        overrides['app_menu'] = False
+    if args.no_fast_startup:
+        overrides['fast_startup'] = False
+    if args.no_startup_trace:
+        overrides['startup_trace'] = False
+    if args.no_compute_pool:
+        overrides['compute_pool'] = False
+    if args.ipc_bench:
+        overrides['ipc_bench'] = True
+    return template_context(overrides)
+
+def sync_package_dependencies(project_path, drop=()):
+    # 只改写依赖计划中的包版本并移除 drop 中的依赖，保留用户自行添加的依赖与其他字段；
+    # 返回依赖计划之外仍留在 package.json 中的依赖
+    package_json = project_path / 'package.json'
+    with open(package_json, 'r', encoding='utf-8') as f:
+        package = json.load(f)
+    for name in drop:
+        for section in ('dependencies', 'devDependencies'):
+            if package.get(section, {}).pop(name, None) is not None:
+                print(f"移除不再使用的依赖: {name}")
+    for section, deps in DEPENDENCY_PLAN.items():
+        other = 'devDependencies' if section == 'dependencies' else 'dependencies'
+        for name, version in deps.items():
+            package.get(other, {}).pop(name, None)
+            package.setdefault(section, {})[name] = version
+    with open(package_json, 'w', encoding='utf-8') as f:
+        json.dump(package, f, indent=2, ensure_ascii=False)
+    record_write(package_json)
+    return sorted(name for section in ('dependencies', 'devDependencies') for name in package.get(section, {})
+                  if name not in DEPENDENCY_PLAN['dependencies'] and name not in DEPENDENCY_PLAN['devDependencies'])
+
+def iter_project_sources(project_path):
+    # 逐个返回 (相对路径, 文本)，跳过 node_modules、打包输出与隐藏目录
+    for current, dirnames, filenames in os.walk(project_path):
+        dirnames[:] = sorted(d for d in dirnames if d not in ('node_modules', 'dist') and not d.startswith('.'))
+        for filename in sorted(filenames):
+            if not filename.endswith(COMPAT_SCAN_SUFFIXES):
+                continue
+            path = Path(current) / filename
+            try:
+                text = path.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                continue
+            yield path.relative_to(project_path).as_posix(), text
+
+def find_remote_usage(project_path):
+    # 返回 [(相对路径, 行号, 用法)]
+    findings = []
+    for rel_path, text in iter_project_sources(project_path):
+        for lineno, line in enumerate(text.splitlines(), 1):
+            for label, pattern in REMOTE_USAGE_PATTERNS:
+                if pattern.search(line):
+                    findings.append((rel_path, lineno, label))
+    return findings
+
+def required_packages(project_path, names):
+    # 返回 names 中仍被项目源码 require/import 的包
+    patterns = {name: re.compile(r'''(?:require\(\s*|from\s+|import\s+)['"]''' + re.escape(name) + r'''(?:/[^'"]*)?['"]''')
+                for name in names}
+    found = set()
+    for _, text in iter_project_sources(project_path):
+        found.update(name for name, pattern in patterns.items() if name not in found and pattern.search(text))
+    return found
+
+def report_remote_usage(project_path, findings):
+    if not findings:
+        print(f"兼容性检查通过: {project_path} 中没有 @electron/remote 或 nodeIntegration 用法。")
+        return
+    print(f"\n兼容性检查: {project_path} 中仍有 {len(findings)} 处需要迁移到 preload.js 暴露的 window.electronAPI:")
+    for rel_path, lineno, label in findings:
+        print(f"  {rel_path}:{lineno}: {label}")
+
+def check_compat(project_paths):
+    # 只检查不修改；有任何发现时以失败退出，便于在 CI 中使用
+    total = 0
+    for project_path in project_paths:
+        if not project_path.is_dir():
+            raise ScaffoldError(f"'{project_path}' 不是一个目录。")
+        findings = find_remote_usage(project_path)
+        report_remote_usage(project_path, findings)
+        total += len(findings)
+    if total:
+        raise ScaffoldError(f"兼容性检查发现 {total} 处需要迁移的用法。")
+
+@profiled('update_project')
+def update_project(project_path, args):
+    # 只重写模板输出发生变化、且用户未修改过的文件；依赖集合未变化时跳过 npm
+    manifest = load_manifest(project_path)
+    old_files = (manifest or {}).get('files', {})
+    context = context_for_update(args, manifest)
+    rendered = render_project(context, icon_cache=args.icon_cache)
+
+    files = {}
+    changes = {}
+    conflicts, removed = [], []
+    for rel_path, content in rendered.items():
+        new_hash = content_hash(content)
+        old_hash = old_files.get(rel_path)
+        files[rel_path] = new_hash
+        if manifest and old_hash == new_hash:
+            continue
+        target = project_path / rel_path
+        disk_hash = file_hash(target, isinstance(content, bytes)) if target.exists() else None
+        if disk_hash == new_hash:
+            continue
+        if disk_hash is None or disk_hash == old_hash:
+            changes[rel_path] = content
+        else:
+            # 用户修改过的文件保持原样；保留旧哈希，下次更新仍会报告冲突
+            conflicts.append(rel_path)
+            if old_hash:
+                files[rel_path] = old_hash
+            else:
+                files.pop(rel_path)
+
+    # 保持旧版本的入口文件仍然加载旧版本的依赖文件，这些文件同样保持不变并报告为冲突
+    held = {}
+    for entry, deps in ENTRY_DEPENDENCIES.items():
+        if entry in conflicts:
+            held.update((dep, entry) for dep in deps if dep in old_files and dep not in held)
+    for rel_path in sorted(held.keys() & changes.keys()):
+        del changes[rel_path]
+        conflicts.append(rel_path)
+        files[rel_path] = old_files[rel_path]
+
+    for rel_path in sorted(old_files.keys() - rendered.keys()):
+        target = project_path / rel_path
+        if not target.exists():
+            continue
+        if rel_path in held:
+            conflicts.append(rel_path)
+            files[rel_path] = old_files[rel_path]
+        elif file_hash(target, rel_path in ICON_OUTPUTS) == old_files[rel_path]:
+            target.unlink()
+            removed.append(rel_path)
+        else:
+            conflicts.append(rel_path)
+            files[rel_path] = old_files[rel_path]
+
+    write_files(project_path, changes)
+    written = sorted(changes)
+
+    old_context = (manifest or {}).get('context', {})
+    if any(old_context.get(key) != context[key] for key in ('product_name', 'app_id')):
+        update_package_json(project_path, context)
+    else:
+        merge_build_icons(project_path)
+
+    deps_changed = (manifest or {}).get('dependency_plan') != dependency_plan_hash()
+    if deps_changed or not (project_path / 'node_modules').is_dir():
+        print("\n依赖集合已变化，重新安装依赖...")
+        check_toolchain(cache_path=None if args.no_toolchain_cache else args.toolchain_cache)
+        # 仍有文件引用的旧依赖（例如修改过的 renderer.js 中的 @electron/remote）予以保留，避免更新后应用无法启动
+        still_required = required_packages(project_path, RETIRED_DEPENDENCIES)
+        kept = [name for name in RETIRED_DEPENDENCIES if name in still_required]
+        extra = sync_package_dependencies(project_path, [name for name in RETIRED_DEPENDENCIES if name not in kept])
+        if kept:
+            print(f"保留仍在使用的依赖: {', '.join(kept)}")
+        if extra:
+            # 依赖计划之外的依赖（用户自行添加的，或仍在使用的旧依赖）不在快照与规范 lockfile 中，只能按 package.json 重新解析
+            print(f"package.json 中有依赖计划之外的依赖，按 package.json 安装: {', '.join(extra)}")
+            run_command(['npm', 'install', '--no-audit', '--no-fund'], cwd=project_path)
+        else:
+            install_project_dependencies(project_path, project_path.name, args)
+    else:
+        print("依赖集合未变化，跳过 npm。")
+
+    ensure_config(project_path)
+    write_manifest(project_path, context, files)
+
+    findings = find_remote_usage(project_path)
+    if findings:
+        report_remote_usage(project_path, findings)
+
+    print(f"\n更新完成: {project_path}")
+    print(f"重写 {len(written)} 个文件，删除 {len(removed)} 个文件，冲突 {len(conflicts)} 个。")
+    for rel_path in conflicts:
+        if rel_path in held:
+            print(f"  冲突（{held[rel_path]} 已被修改，保持与之匹配的旧版本）: {rel_path}")
+        else:
+            print(f"  冲突（已被修改，保持不变）: {rel_path}")
+    return {"written": written, "removed": removed, "conflicts": conflicts, "installed": deps_changed}
+
+def pipeline_order(steps):
+    # 按依赖关系做拓扑排序；同一层内保持声明顺序，顺序模式下即按此执行
+    order, visiting, done = [], set(), set()
+
+    def visit(name):
+        if name in done:
+            return
+        if name in visiting:
+            raise ScaffoldError(f"流水线阶段存在循环依赖: {name}")
+        if name not in steps:
+            raise ScaffoldError(f"流水线阶段依赖了不存在的阶段: {name}")
+        visiting.add(name)
+        for dep in steps[name][0]:
+            visit(dep)
+        visiting.discard(name)
+        done.add(name)
+        order.append(name)
+
+    for name in steps:
+        visit(name)
+    return order
+
+async def run_pipeline(steps, concurrent=True):
+    # steps: {阶段名: (依赖的阶段名列表, 无参协程函数)}；每个阶段在依赖全部完成后立即开始
+    timings = {}
+
+    async def run_step(name, deps):
+        if deps:
+            await asyncio.gather(*(tasks[dep] for dep in deps))
+        start = time.perf_counter()
+        await steps[name][1]()
+        timings[name] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tasks = {}
+    with profile_phase('pipeline'):
+        if not concurrent:
+            for name in pipeline_order(steps):
+                await run_step(name, ())
+        else:
+            for name in pipeline_order(steps):
+                tasks[name] = asyncio.create_task(run_step(name, steps[name][0]))
+            try:
+                await asyncio.gather(*tasks.values())
+            except BaseException:
+                # 任一阶段失败即取消其余阶段；线程中的阶段由 asyncio.run 退出前等待结束
+                for task in tasks.values():
+                    task.cancel()
+                await asyncio.gather(*tasks.values(), return_exceptions=True)
+                raise
+    total = time.perf_counter() - start
+    slowest = max(timings, key=timings.get)
+    print(f"\n流水线耗时 {total:.2f} 秒，最慢阶段 {slowest} {timings[slowest]:.2f} 秒")
+    return timings
+
+def project_pipeline(staging, name, args, context=None):
+    # 依赖图：package.json → npm 安装 → 补充打包配置；模板文件与安装互不依赖，同时生成
+    async def package_step():
+        print("\n生成 package.json 依赖计划...")
+        await asyncio.to_thread(write_package_json, staging, name)
+
+    async def install_step():
+        print("\n安装依赖（electron、electron-builder）...")
+        await install_project_dependencies_async(staging, name, args)
+
+    async def build_config_step():
+        await asyncio.to_thread(update_package_json, staging, context)
+
+    async def files_step():
+        await asyncio.to_thread(create_project_files, staging, context, args.icon_cache)
+
+    async def fsync_step():
+        await asyncio.to_thread(flush_tree, staging)
+
+    steps = {
+        'package.json': ([], package_step),
+        'install': (['package.json'], install_step),
+        'build-config': (['install'], build_config_step),
+        'files': ([], files_step),
     }
+    if args.fsync:
+        steps['fsync'] = (['build-config', 'files'], fsync_step)
+    return steps
+
+def create_project(project_path, name, args, context=None):
+    # 所有内容先生成到同一目录下的临时目录，完成后一次 rename 发布；失败时不留下半成品
+    staging = Path(tempfile.mkdtemp(prefix=f".{name}.staging-", dir=project_path.parent))
+    # mkdtemp 创建的目录权限为 0700，发布前改成与预留目录一致（遵循 umask）
+    shutil.copymode(project_path, staging)
+    print(f"生成项目: {project_path}（先写入临时目录 {staging.name}，完成后整体发布）")
+    try:
+        steps = project_pipeline(staging, name, args, context)
+        asyncio.run(run_pipeline(steps, concurrent=not args.no_pipeline))
+        publish_project(staging, project_path)
+        if args.fsync:
+            fsync_dir(project_path.parent)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        if project_path.is_dir() and not any(project_path.iterdir()):
+            project_path.rmdir()
+        raise
+    print(f"创建项目目录: {project_path}")
 
-    // hideScrollBar
-    if (currentConfig.hideScrollBar) {
-        body.classList.add('no-scrollbar');
-        document.getElementById('btn-toggle-scrollbar').textContent = '显示滚动条';
-    } else {
-        body.classList.remove('no-scrollbar');
-        document.getElementById('btn-toggle-scrollbar').textContent = '隐藏滚动条';
+def context_from_args(args, spec=None):
+    # 命令行参数给出默认值，批量规格中同名的键可以逐个项目覆盖
+    overrides = {
+        "posts_demo": not args.no_posts_demo,
+        "app_menu": not args.no_app_menu,
+        "fast_startup": not args.no_fast_startup,
+        "startup_trace": not args.no_startup_trace,
+        "compute_pool": not args.no_compute_pool,
+        "ipc_bench": args.ipc_bench
     }
-}
+    for key in ('app_title', 'product_name', 'app_id'):
+        if getattr(args, key) is not None:
+            overrides[key] = getattr(args, key)
+    for key, value in (spec or {}).items():
+        if key not in ('name', 'dir'):
+            overrides[key] = value
+    return template_context(overrides)
+
+def load_batch_specs(specs_path):
+    # 批量规格文件为 JSON 数组，元素可以是项目名，也可以是 {"name": ..., "dir": ...}
+    with open(specs_path, 'r', encoding='utf-8') as f:
+        raw_specs = json.load(f)
+    specs = []
+    for raw in raw_specs:
+        spec = {"name": raw} if isinstance(raw, str) else dict(raw)
+        if not spec.get('name'):
+            raise ValueError(f"批量规格缺少 name: {raw}")
+        specs.append(spec)
+    names = [str(Path(spec.get('dir', '.')) / spec['name']) for spec in specs]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"批量规格中存在重复的项目: {', '.join(duplicates)}")
+    return specs
+
+def prepare_shared_dependencies(args):
+    # 共享阶段：只安装一次依赖并写入快照，之后每个项目都从快照克隆
+    if args.no_snapshot:
+        return
+    key = snapshot_key()
+    if find_snapshot(args.snapshots, key):
+        return
+    print("\n为批量任务准备共享依赖快照...")
+    with tempfile.TemporaryDirectory(prefix='electron-seed-') as tmp:
+        seed_path = Path(tmp)
+        write_package_json(seed_path, 'electron-seed')
+        update_package_json(seed_path)
+        install_project_dependencies(seed_path, 'electron-seed', args)
+
+@contextlib.contextmanager
+def redirect_output(path):
+    # 把 Python 的输出和子进程（npm）继承的 stdout/stderr 都写入日志文件；只在批量模式的工作进程中使用
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = [os.dup(1), os.dup(2)]
+    try:
+        with open(path, 'w', encoding='utf-8', buffering=1) as log:
+            os.dup2(log.fileno(), 1)
+            os.dup2(log.fileno(), 2)
+            with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+                yield
+    finally:
+        os.dup2(saved[0], 1)
+        os.dup2(saved[1], 2)
+        for fd in saved:
+            os.close(fd)
+
+def build_project_worker(spec, args):
+    # 在子进程中创建单个项目，完整输出写入项目目录旁的 <名称>.log；ScaffoldError 与其他异常都转成失败结果返回
+    start = time.perf_counter()
+    base = args.output_dir / spec.get('dir', '.')
+    result = {"name": spec['name'], "path": None, "ok": False, "seconds": 0.0, "error": None,
+              "log": str(base / f"{spec['name']}.log"), "profile": None}
+    if args.profile:
+        start_profile()
+    try:
+        base.mkdir(parents=True, exist_ok=True)
+        with redirect_output(result['log']):
+            project_path = reserve_project_dir(base, spec['name'])
+            result['path'] = str(project_path)
+            create_project(project_path, spec['name'], args, context_from_args(args, spec))
+        result['ok'] = True
+    except ScaffoldError as e:
+        result['error'] = str(e)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = time.perf_counter() - start
+    result['profile'] = stop_profile()
+    return result
 
-// 事件监听
-document.getElementById('btn-minimize').addEventListener('click', () => {
-    ipcRenderer.send('window-action', 'minimize');
-});
-document.getElementById('btn-maximize').addEventListener('click', () => {
-    ipcRenderer.send('window-action', 'maximize');
-});
-document.getElementById('btn-close').addEventListener('click', () => {
-    ipcRenderer.send('window-action', 'close');
-});
-
-// 切换 menuBarVisible 设置
-document.getElementById('btn-toggle-menu-bar').addEventListener('click', () => {
-    currentConfig.menuBarVisible = !currentConfig.menuBarVisible;
-    requestConfigUpdate();
-});
-
-// 切换 hideScrollBar 设置
-document.getElementById('btn-toggle-scrollbar').addEventListener('click', () => {
-    currentConfig.hideScrollBar = !currentConfig.hideScrollBar;
-    requestConfigUpdate();
-});
-
-function requestConfigUpdate() {
-    // 更新配置文件
-    ipcRenderer.send('update-config', currentConfig);
-}
+def print_batch_results(results):
+    print("\n批量创建结果")
+    print("============================")
+    width = max([len(r['name']) for r in results] + [4])
+    for r in results:
+        status = "成功" if r['ok'] else "失败"
+        print(f"{r['name']:<{width}}  {status}  {r['seconds']:7.2f} 秒  日志: {r['log']}")
+        if r['error']:
+            for line in r['error'].splitlines():
+                print(f"    {line}")
+    failed = sum(1 for r in results if not r['ok'])
+    print(f"\n共 {len(results)} 个项目，成功 {len(results) - failed} 个，失败 {failed} 个。")
+
+def run_batch(args):
+    try:
+        specs = load_batch_specs(args.batch)
+        for spec in specs:
+            context_from_args(args, spec)
+    except (OSError, ValueError) as e:
+        raise ScaffoldError(f"读取批量规格 {args.batch} 时出错: {e}") from e
+
+    prepare_shared_dependencies(args)
+    # 预先编译模板并光栅化图标，子进程 fork 后直接复用
+    render_project(icon_cache=args.icon_cache)
+
+    print(f"\n并行创建 {len(specs)} 个项目（{args.jobs} 个进程）...")
+    results = [None] * len(specs)
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = {pool.submit(build_project_worker, spec, args): i for i, spec in enumerate(specs)}
+        for future in as_completed(futures):
+            result = future.result()
+            print(f"{'✓' if result['ok'] else '✗'} {result['name']}")
+            results[futures[future]] = result
+    print_batch_results(results)
+    return results
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Electron 示例项目创建脚本")
+    parser.add_argument('--compare-install', action='store_true',
+                        help="对比旧的逐个安装流程与依赖计划流程的耗时，不创建项目")
+    parser.add_argument('--store', type=Path, default=DEFAULT_STORE_PATH,
+                        help="离线包仓库目录（默认 ~/.electron-scaffold/store，可用 ELECTRON_SCAFFOLD_STORE 覆盖）")
+    parser.add_argument('--fill-store', action='store_true',
+                        help="联网下载依赖计划中的全部 tarball 到离线仓库，不创建项目")
+    parser.add_argument('--offline', action='store_true',
+                        help="只从离线仓库安装依赖，不访问 npm registry")
+    parser.add_argument('--refresh-lock', action='store_true',
+                        help="重新解析依赖计划，把规范 lockfile 写入脚本目录下的 locks/，不创建项目")
+    parser.add_argument('--require-lock', action='store_true',
+                        help="没有可用的规范 lockfile 或 lockfile 已过期时直接失败，而不是回退到 npm install")
+    parser.add_argument('--lock-cache', type=Path, default=DEFAULT_LOCK_CACHE,
+                        help="首次安装生成的规范 lockfile 缓存目录（默认 ~/.electron-scaffold/locks）")
+    parser.add_argument('--snapshots', type=Path, default=DEFAULT_SNAPSHOT_PATH,
+                        help="node_modules 快照目录（默认 ~/.electron-scaffold/snapshots，可用 ELECTRON_SCAFFOLD_SNAPSHOTS 覆盖）")
+    parser.add_argument('--no-snapshot', action='store_true',
+                        help="不使用也不保存 node_modules 快照")
+    parser.add_argument('--clone-mode', choices=['auto', 'reflink', 'hardlink', 'copy'], default='auto',
+                        help="从快照克隆 node_modules 的方式，auto 先尝试 reflink，不支持时 copy；"
+                             "hardlink 与快照共享文件，项目中不能修改 node_modules")
+    parser.add_argument('--snapshot-max-size', type=float, default=SNAPSHOT_MAX_BYTES / 1024 ** 3,
+                        help="快照目录总大小上限（GB）")
+    parser.add_argument('--snapshot-max-age', type=float, default=SNAPSHOT_MAX_AGE_DAYS,
+                        help="快照未使用超过该天数即被清理")
+    parser.add_argument('--name', help="项目名称（默认 my-electron-app-<时间戳>）")
+    parser.add_argument('--output-dir', type=Path, default=Path.cwd(),
+                        help="项目创建在该目录下（默认当前目录）")
+    parser.add_argument('--batch', type=Path,
+                        help="批量规格 JSON 文件：项目名数组或 {\"name\", \"dir\"} 对象数组")
+    parser.add_argument('--app-title', help=f"窗口标题（默认 {DEFAULT_TEMPLATE_CONTEXT['app_title']}）")
+    parser.add_argument('--product-name', help=f"electron-builder 的 productName（默认 {DEFAULT_TEMPLATE_CONTEXT['product_name']}）")
+    parser.add_argument('--app-id', help=f"electron-builder 的 appId（默认 {DEFAULT_TEMPLATE_CONTEXT['app_id']}）")
+    parser.add_argument('--no-posts-demo', action='store_true', help="不生成帖子数据示例")
+    parser.add_argument('--no-app-menu', action='store_true', help="不生成自定义应用菜单，使用 Electron 默认菜单")
+    parser.add_argument('--no-fast-startup', action='store_true',
+                        help="不使用启动优化模板（延迟构建菜单、按需加载模块、V8 代码缓存、静态 CSS），用于对比启动耗时")
+    parser.add_argument('--no-startup-trace', action='store_true',
+                        help="不生成启动追踪（主进程与页面的启动时间点，写成 Chrome trace JSON）")
+    parser.add_argument('--no-compute-pool', action='store_true',
+                        help="不生成后台计算层（主进程的 worker_threads 线程池与页面的 Web Worker）")
+    parser.add_argument('--ipc-bench', action='store_true',
+                        help="生成 IPC 基准测试（ipc-bench.js 与测试通道，设置 IPC_BENCH=1 启动时运行），供 benchmarks/bench_ipc.py 使用")
+    parser.add_argument('--profile', nargs='?', const=Path('scaffold-profile.json'), type=Path,
+                        help="记录各阶段耗时、CPU、写入字节和文件数，输出汇总表并写入 JSON 报告（默认 scaffold-profile.json）")
+    parser.add_argument('--check-compat', type=Path, nargs='+', metavar='PROJECT',
+                        help="检查已有项目中剩余的 @electron/remote、nodeIntegration 等用法，发现时以失败退出，不修改文件")
+    parser.add_argument('--update', type=Path, nargs='+', metavar='PROJECT',
+                        help="增量更新已有项目：只重写模板输出变化且未被修改的文件，依赖未变化时跳过 npm")
+    parser.add_argument('--icon-cache', type=Path, default=DEFAULT_ICON_CACHE,
+                        help="光栅化图标的缓存目录，按 SVG 内容与尺寸集合命名（默认 ~/.electron-scaffold/icons）")
+    parser.add_argument('--no-pipeline', action='store_true',
+                        help="按顺序执行各阶段，不让模板文件生成与 npm 安装同时进行")
+    parser.add_argument('--fsync', action='store_true',
+                        help="发布项目前批量 fsync 所有生成的文件和目录，确保断电后不丢失")
+    parser.add_argument('--toolchain-cache', type=Path, default=DEFAULT_TOOLCHAIN_CACHE,
+                        help="node/npm 版本探测结果的缓存文件（默认 ~/.electron-scaffold/toolchain.json）")
+    parser.add_argument('--no-toolchain-cache', action='store_true',
+                        help="忽略缓存，重新探测 node/npm 版本")
+    parser.add_argument('--jobs', type=int, default=min(4, os.cpu_count() or 1),
+                        help="批量模式下的并行进程数")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
 
-// 当需要重启时会收到此消息
-ipcRenderer.on('need-restart', () => {
-    const restartPanel = document.getElementById('restart-panel');
-    restartPanel.style.display = 'block';
-});
-
-document.getElementById('btn-restart-now').addEventListener('click', () => {
-    ipcRenderer.send('request-restart');
-});
-
-// 使用 IPC 处理请求
-document.getElementById('btn-fetch-data').addEventListener('click', async () => {
-    try {
-        const posts = await apiService.fetchPosts();
-        console.log('获取的帖子数据:', posts);
-        
-        // 在这里更新 UI，例如显示帖子标题
-        const postsContainer = document.getElementById('posts-container');
-        postsContainer.innerHTML = ''; // 清空之前的内容
-        posts.forEach(post => {
-            const postElement = document.createElement('div');
-            postElement.classList.add('post-card'); // 添加动画效果的类
-            postElement.innerHTML = `<h3>${post.title}</h3><p>${post.body}</p>`;
-            postsContainer.appendChild(postElement);
-        });
-    } catch (error) {
-        // 处理错误
-        alert('无法获取数据，请稍后再试。');
-    }
-});
-
-// 初始化配置
-loadConfig();
-"""
-    create_file(js_path / 'renderer.js', renderer_js_content)
-
-    # 创建 SVG 文件
-    svg_content = """<svg xmlns="http://www.w3.org/2000/svg" width="400" height="400" viewBox="0 0 124 124" fill="none">
-<rect width="124" height="124" rx="24" fill="#F97316"/>
-<path d="M19.375 36.7818V100.625C19.375 102.834 21.1659 104.625 23.375 104.625H87.2181C90.7818 104.625 92.5664 100.316 90.0466 97.7966L26.2034 33.9534C23.6836 31.4336 19.375 33.2182 19.375 36.7818Z" fill="white"/>
-<circle cx="63.2109" cy="37.5391" r="18.1641" fill="black"/>
-<rect opacity="0.4" x="81.1328" y="80.7198" width="17.5687" height="17.3876" rx="4" transform="rotate(-45 81.1328 80.7198)" fill="#FDBA74"/>
-</svg>
-    """
-    create_file(static_path / 'icon.svg', svg_content)
-
-    # 将 SVG 转换为 ICO 并保存
-    ico_content = """
-    <svg xmlns="http://www.w3.org/2000/svg" width="256" height="256" viewBox="0 0 124 124" fill="none">
-        <rect width="124" height="124" rx="24" fill="#F97316"/>
-        <path d="M19.375 36.7818V100.625C19.375 102.834 21.1659 104.625 23.375 104.625H87.2181C90.7818 104.625 92.5664 100.316 90.0466 97.7966L26.2034 33.9534C23.6836 31.4336 19.375 33.2182 19.375 36.7818Z" fill="white"/>
-        <circle cx="63.2109" cy="37.5391" r="18.1641" fill="black"/>
-        <rect opacity="0.4" x="81.1328" y="80.7198" width="17.5687" height="17.3876" rx="4" transform="rotate(-45 81.1328 80.7198)" fill="#FDBA74"/>
-    </svg>
-    """
-    create_file(static_path / 'icon.ico', ico_content)
-
-def main():
     print("Electron 示例项目创建脚本")
     print("============================")
 
-    PROJECT_NAME = f"my-electron-app-{int(time.time())}"
-
-    check_command('node', 'Node.js')
-    check_command('npm', 'npm')
-
-    project_path = Path.cwd() / PROJECT_NAME
-    if project_path.exists():
-        print(f"目录 '{PROJECT_NAME}' 已存在。请删除或选择其他项目名称。")
+    try:
+        run(args)
+    except ScaffoldError as e:
+        print(e)
         sys.exit(1)
 
-    project_path.mkdir()
-    print(f"创建项目目录: {project_path}")
-
-    print("\n初始化 npm 项目...")
-    run_command(['npm', 'init', '-y'], cwd=project_path)
-
-    print("\n安装 Electron...")
-    run_command(['npm', 'install', 'electron', '--save-dev'], cwd=project_path)
-
-    print("\n安装 @electron/remote...")
-    run_command(['npm', 'install', '@electron/remote', '--save-prod'], cwd=project_path)
-    
-    print("\n安装 axios")
-    run_command(['npm', 'install', 'axios', '--save-prod'], cwd=project_path)
-
-    print("\n安装 electron-builder...")
-    run_command(['npm', 'install', 'electron-builder', '--save-dev'], cwd=project_path)
-    
-    # 创建打包脚本
-    build_bat_content = """@echo off
-cd /d "%~dp0"
-npm run build
-"""
-    create_file(project_path / 'build_electron.bat', build_bat_content)
-
-    config_path = ensure_config(project_path)
-
-    main_js_content = r"""const { app, BrowserWindow, ipcMain, Menu } = require('electron');
-const path = require('path');
-const fs = require('fs');
-require('@electron/remote/main').initialize();
-
-let win;
-let config;
-
-function loadConfig() {
-  const configPath = path.join(__dirname, 'config.json');
-  if (!fs.existsSync(configPath)) {
-    config = { menuBarVisible: true, hideScrollBar: false };
-    fs.writeFileSync(configPath, JSON.stringify(config, null, 2), 'utf-8');
-  } else {
-    const rawData = fs.readFileSync(configPath, 'utf-8');
-    config = JSON.parse(rawData);
-  }
-}
-
-function createMenu() {
-  const template = [
-    {
-      label: '文件',
-      submenu: [
-        {
-          label: '新建窗口',
-          accelerator: 'CmdOrCtrl+N',
-          click: () => createWindow()
-        },
-        { type: 'separator' },
-        {
-          label: '保存',
-          accelerator: 'CmdOrCtrl+S',
-          click: () => { /* 添加保存逻辑 */ }
-        },
-        { type: 'separator' },
-        { 
-          label: '退出',
-          accelerator: 'CmdOrCtrl+Q',
-          click: () => app.quit()
-        }
-      ]
-    },
-    {
-      label: '编辑',
-      submenu: [
-        { role: 'undo', label: '撤销', accelerator: 'CmdOrCtrl+Z' },
-        { role: 'redo', label: '重做', accelerator: 'CmdOrCtrl+Y' },
-        { type: 'separator' },
-        { role: 'cut', label: '剪切', accelerator: 'CmdOrCtrl+X' },
-        { role: 'copy', label: '复制', accelerator: 'CmdOrCtrl+C' },
-        { role: 'paste', label: '粘贴', accelerator: 'CmdOrCtrl+V' },
-        { role: 'selectAll', label: '全选', accelerator: 'CmdOrCtrl+A' }
-      ]
-    },
-    {
-      label: '视图',
-      submenu: [
-        { role: 'reload', label: '重新加载', accelerator: 'CmdOrCtrl+R' },
-        { role: 'forceReload', label: '强制重新加载', accelerator: 'CmdOrCtrl+Shift+R' },
-        { type: 'separator' },
-        { role: 'toggleDevTools', label: '开发者工具', accelerator: 'F12' },
-        { type: 'separator' },
-        { role: 'resetZoom', label: '实际大小', accelerator: 'CmdOrCtrl+0' },
-        { role: 'zoomIn', label: '放大', accelerator: 'CmdOrCtrl+Plus' },
-        { role: 'zoomOut', label: '缩小', accelerator: 'CmdOrCtrl+-' },
-        { type: 'separator' },
-        { role: 'togglefullscreen', label: '全屏', accelerator: 'F11' }
-      ]
-    },
-    {
-      label: '窗口',
-      submenu: [
-        { role: 'minimize', label: '最小化', accelerator: 'CmdOrCtrl+M' },
-        { role: 'zoom', label: '缩放' },
-        { type: 'separator' },
-        { role: 'close', label: '关闭', accelerator: 'CmdOrCtrl+W' }
-      ]
-    },
-    {
-      label: '帮助',
-      submenu: [
-        {
-          label: '关于',
-          click: async () => {
-            const { dialog } = require('electron');
-            await dialog.showMessageBox({
-              title: '关于',
-              message: '洛小山 Cheshire Demo',
-              detail: '版本 1.0.0\n作者：洛小山\n一个优雅的 Electron 应用示例。',
-              buttons: ['确定'],
-              type: 'info'
-            });
-          }
-        },
-        {
-          label: '检查更新',
-          click: () => { /* 添加检查更新逻辑 */ }
-        },
-        { type: 'separator' },
-        {
-          label: '访问官网',
-          click: async () => {
-            const { shell } = require('electron');
-            await shell.openExternal('https://your-website.com');
-          }
-        }
-      ]
-    }
-  ];
-
-  // 针对 macOS 的特殊处理
-  if (process.platform === 'darwin') {
-    template.unshift({
-      label: app.name,
-      submenu: [
-        { role: 'about', label: '关于' },
-        { type: 'separator' },
-        { role: 'services', label: '服务' },
-        { type: 'separator' },
-        { role: 'hide', label: '隐藏' },
-        { role: 'hideOthers', label: '隐藏其他' },
-        { role: 'unhide', label: '显示全部' },
-        { type: 'separator' },
-        { role: 'quit', label: '退出' }
-      ]
-    });
-  }
-
-  const menu = Menu.buildFromTemplate(template);
-  Menu.setApplicationMenu(menu);
-}
-
-function createWindow () {
-  loadConfig();
-
-  win = new BrowserWindow({
-    width: 800,
-    height: 700,
-    frame: config.menuBarVisible,
-    resizable: true,
-    autoHideMenuBar: false,
-    webPreferences: {
-      preload: path.join(__dirname, 'preload.js'),
-      nodeIntegration: true,
-      contextIsolation: false,
-      enableRemote: true
-    }
-  });
-
-  require('@electron/remote/main').enable(win.webContents);
-
-  // 注入自定义菜单样式
-  win.webContents.on('dom-ready', () => {
-    const menuStyle = `
-      .menu-custom {
-        background: #ffffff !important;
-        border: 1px solid #e0e0e0 !important;
-        border-radius: 6px !important;
-        box-shadow: 0 2px 12px rgba(0, 0, 0, 0.1) !important;
-        padding: 5px 0 !important;
-      }
-      
-      .menuitem-custom {
-        padding: 6px 24px !important;
-        color: #333333 !important;
-        font-size: 13px !important;
-        font-family: system-ui, -apple-system, sans-serif !important;
-      }
-      
-      .menuitem-custom:hover {
-        background-color: #f5f5f5 !important;
-        color: #1a73e8 !important;
-      }
-      
-      .menuitem-custom:active {
-        background-color: #e8f0fe !important;
-      }
-      
-      .separator-custom {
-        margin: 5px 0 !important;
-        border-bottom: 1px solid #e0e0e0 !important;
-      }
-      
-      .accelerator-custom {
-        color: #666666 !important;
-        font-size: 12px !important;
-      }
-      
-      .submenu-custom {
-        background: #ffffff !important;
-        border: 1px solid #e0e0e0 !important;
-        border-radius: 6px !important;
-        box-shadow: 2px 2px 12px rgba(0, 0, 0, 0.1) !important;
-      }
-      
-      .menu-custom::-webkit-scrollbar {
-        width: 6px !important;
-        height: 6px !important;
-      }
-      
-      .menu-custom::-webkit-scrollbar-thumb {
-        background: #c1c1c1 !important;
-        border-radius: 3px !important;
-      }
-      
-      .menu-custom::-webkit-scrollbar-track {
-        background: transparent !important;
-      }
-    `;
-    
-    win.webContents.insertCSS(menuStyle);
-    
-    // 如果配置了隐藏滚动条
-    if (config.hideScrollBar) {
-      win.webContents.insertCSS('*::-webkit-scrollbar { display: none !important; }');
-    }
-  });
-
-  win.loadFile('index.html');
-  win.setMenuBarVisibility(config.menuBarVisible);
-}
-
-// IPC 事件
-
-// 窗口控制
-ipcMain.on('window-action', (event, action) => {
-  if (!win) return;
-  switch (action) {
-    case 'minimize':
-      win.minimize();
-      break;
-    case 'maximize':
-      if (win.isMaximized()) {
-        win.unmaximize();
-      } else {
-        win.maximize();
-      }
-      break;
-    case 'close':
-      win.close();
-      break;
-  }
-});
-
-// 用户请求更改配置（需重启生效）
-ipcMain.on('update-config', (event, newConfig) => {
-  const configPath = path.join(__dirname, 'config.json');
-  fs.writeFileSync(configPath, JSON.stringify(newConfig, null, 2), 'utf-8');
-  
-  // 由于标题栏的改变需要重新创建窗口，所以这里总是需要重启
-  event.reply('need-restart');
-});
-
-// 用户请求重启应用
-ipcMain.on('request-restart', () => {
-  app.relaunch();
-  app.exit(0);
-});
-
-// 当需要重启时会收到此消息
-ipcMain.on('need-restart', (event) => {
-  // 发送消息到渲染进程，通知需要重启
-  event.sender.send('need-restart');
-});
-
-// 处理重启按钮点击事件
-// 这个部分应该在 renderer.js 中处理，而不是在 main.js 中
-
-// 提供给渲染进程获取当前配置的接口
-ipcMain.handle('get-config', () => {
-  return config;
-});
-
-app.whenReady().then(() => {
-  createMenu();
-  createWindow();
-
-  app.on('activate', function () {
-    if (BrowserWindow.getAllWindows().length === 0) createWindow();
-  });
-});
-
-app.on('window-all-closed', function () {
-  if (process.platform !== 'darwin') app.quit();
-});
-"""
-
-
-    preload_js_content = """// preload.js
-window.addEventListener('DOMContentLoaded', () => {
-    // 在此可安全地暴露所需的 Node 功能
-});
-"""
-
-    renderer_js_content = r"""const { ipcRenderer } = require('electron');
-const { dialog } = require('@electron/remote');
-const axios = require('axios');
-
-let currentConfig = {};
-
-// 创建一个 API 服务模块
-const apiService = {
-    async fetchPosts() {
-        try {
-            const response = await axios.get('https://jsonplaceholder.typicode.com/posts');
-            return response.data;
-        } catch (error) {
-            console.error('获取数据时出错:', error);
-            throw error;
-        }
-    }
-};
-
-// 初始化时获取配置并根据配置更新页面
-async function loadConfig() {
-    currentConfig = await ipcRenderer.invoke('get-config');
-    updateUIFromConfig();
-}
-
-function updateUIFromConfig() {
-    const body = document.body;
-    const titleBar = document.querySelector('.title-bar');
-    
-    // 控制自定义标题栏显示
-    if (currentConfig.menuBarVisible) {
-        titleBar.style.display = 'none';  // 系统标题栏显示时，隐藏自定义标题栏
-        body.style.paddingTop = '0';
-        document.getElementById('btn-toggle-menu-bar').textContent = '显示自定义标题栏';
-    } else {
-        titleBar.style.display = 'flex';  // 系统标题栏隐藏时，显示自定义标题栏
-        body.style.paddingTop = '32px';
-        document.getElementById('btn-toggle-menu-bar').textContent = '显示系统标题栏';
-    }
-
-    // hideScrollBar
-    if (currentConfig.hideScrollBar) {
-        body.classList.add('no-scrollbar');
-        document.getElementById('btn-toggle-scrollbar').textContent = '显示滚动条';
-    } else {
-        body.classList.remove('no-scrollbar');
-        document.getElementById('btn-toggle-scrollbar').textContent = '隐藏滚动条';
-    }
-}
-
-// 事件监听
-document.getElementById('btn-minimize').addEventListener('click', () => {
-    ipcRenderer.send('window-action', 'minimize');
-});
-document.getElementById('btn-maximize').addEventListener('click', () => {
-    ipcRenderer.send('window-action', 'maximize');
-});
-document.getElementById('btn-close').addEventListener('click', () => {
-    ipcRenderer.send('window-action', 'close');
-});
-
-// 切换 menuBarVisible 设置
-document.getElementById('btn-toggle-menu-bar').addEventListener('click', () => {
-    currentConfig.menuBarVisible = !currentConfig.menuBarVisible;
-    requestConfigUpdate();
-});
-
-// 切换 hideScrollBar 设置
-document.getElementById('btn-toggle-scrollbar').addEventListener('click', () => {
-    currentConfig.hideScrollBar = !currentConfig.hideScrollBar;
-    requestConfigUpdate();
-});
-
-function requestConfigUpdate() {
-    // 更新配置文件
-    ipcRenderer.send('update-config', currentConfig);
-}
-
-// 当需要重启时会收到此消息
-ipcRenderer.on('need-restart', () => {
-    const restartPanel = document.getElementById('restart-panel');
-    restartPanel.style.display = 'block';
-});
-
-document.getElementById('btn-restart-now').addEventListener('click', () => {
-    ipcRenderer.send('request-restart');
-});
-
-document.getElementById('nav-about').addEventListener('click', async (e) => {
-    e.preventDefault();
-    await dialog.showMessageBox({
-        title: '关于',
-        message: '洛小山 Cheshire Demo',
-        detail: '版本 1.0.0\n作者：洛小山\n一个优雅的 Electron 应用示例。',
-        buttons: ['确定'],
-        type: 'info'
-    });
-});
-
-// 使用 IPC 处理请求
-document.getElementById('btn-fetch-data').addEventListener('click', async () => {
-    try {
-        const posts = await apiService.fetchPosts();
-        console.log('获取的帖子数据:', posts);
-        
-        // 在这里更新 UI，例如显示帖子标题
-        const postsContainer = document.getElementById('posts-container');
-        postsContainer.innerHTML = ''; // 清空之前的内容
-        posts.forEach(post => {
-            const postElement = document.createElement('div');
-            postElement.classList.add('post-card'); // 添加动画效果的类
-            postElement.innerHTML = `<h3>${post.title}</h3><p>${post.body}</p>`;
-            postsContainer.appendChild(postElement);
-        });
-    } catch (error) {
-        // 处理错误
-        alert('无法获取数据，请稍后再试。');
-    }
-});
-
-// 初始化配置
-loadConfig();
-"""
-
-    # index.html 增加隐藏滚动条按钮及重启提示区域
-    index_html_content = r"""<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8" />
-    <meta name="viewport" content="width=device-width, initial-scale=1.0"/>
-    <title>我的 Electron 应用 - Config Demo</title>
-    <link rel="stylesheet" href="static/css/styles.css">
-    <script src="static/js/renderer.js" defer></script>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            margin: 0;
-            background: #f7f7f7;
-            overflow-y: scroll;
-            padding-top: 32px;
-            -webkit-user-select: none;
-            -moz-user-select: none;
-            -ms-user-select: none;
-            user-select: none;
-        }
-
-        /* no-scrollbar 时隐藏滚动条 */
-        .no-scrollbar::-webkit-scrollbar {
-            display: none;
-        }
-        .no-scrollbar {
-            scrollbar-width: none; /* for Firefox */
-            -ms-overflow-style: none;  /* IE and Edge */
-        }
-
-        .fixed-header .title-bar,
-        .fixed-header .navbar {
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            z-index: 999;
-        }
-        .fixed-header .hero {
-            margin-top: 64px; /* 标题栏 + 导航栏的总高度空间 */
-        }
-        
-        .selectable {
-            -webkit-user-select: text;
-            -moz-user-select: text;
-            -ms-user-select: text;
-            user-select: text;
-        }
-        
-        .title-bar {
-            -webkit-app-region: drag;
-            background: #333;
-            height: 32px;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            padding: 0 8px;
-            color: #fff;
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            z-index: 1000;
-        }
-        .title-bar-buttons {
-            display: flex;
-            align-items: center;
-            -webkit-app-region: no-drag;
-        }
-        .title-bar-button {
-            width: 46px;
-            height: 32px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            cursor: pointer;
-        }
-        .title-bar-button:hover {
-            background: #444;
-        }
-
-        .navbar {
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            background: #222;
-            padding: 0.8rem 1.5rem;
-        }
-        .navbar .brand {
-            color: #fff;
-            font-size: 1.2rem;
-            text-decoration: none;
-        }
-        .navbar .nav-links a {
-            color: #fff;
-            text-decoration: none;
-            margin-left: 1rem;
-        }
-        .navbar .nav-links a:hover {
-            text-decoration: underline;
-        }
-
-        .hero {
-            background: linear-gradient(135deg, #ff7f50, #ff5f30);
-            color: #fff;
-            text-align: center;
-            padding: 4rem 2rem;
-            transition: margin-top 0.3s;
-        }
-        .hero h1 {
-            font-size: 2.5rem;
-            margin-bottom: 1rem;
-        }
-        .hero p {
-            font-size: 1.1rem;
-            margin-bottom: 2rem;
-        }
-
-        .btn {
-            display: inline-block;
-            padding: 0.6rem 1.2rem;
-            background: #ff7f50;
-            color: #fff;
-            text-decoration: none;
-            border-radius: 0.3rem;
-            border: 0;
-            transition: background 0.3s;
-            cursor: pointer;
-        }
-        .btn:hover {
-            background: #ff5f30;
-        }
-
-        .container {
-            max-width: 1200px;
-            margin: 2rem auto;
-            padding: 0 1rem;
-        }
-
-        .section-title {
-            text-align: center;
-            margin-bottom: 2rem;
-            color: #333;
-        }
-
-        .grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
-            gap: 1.5rem;
-        }
-        .card {
-            background: #fff;
-            border-radius: 0.3rem;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-            padding: 1rem;
-            transition: transform 0.2s;
-        }
-        .card:hover {
-            transform: translateY(-5px);
-        }
-        .card h3 {
-            margin: 0 0 0.5rem;
-            font-size: 1.2rem;
-            color: #333;
-        }
-        .card p {
-            font-size: 0.9rem;
-            color: #666;
-            line-height: 1.5;
-        }
-        .card .card-btn {
-            margin-top: 1rem;
-        }
-
-        .footer {
-            text-align: center;
-            padding: 2rem 1rem;
-            font-size: 0.9rem;
-            color: #777;
-            background: #f0f0f0;
-        }
-
-        .control-panel {
-            text-align: center;
-            margin: 2rem 0;
-        }
-        .control-panel button {
-            margin: 0.5rem;
-        }
-
-        #restart-panel {
-            display: none;
-            text-align: center;
-            background: #ffefc5;
-            padding: 1rem;
-            margin: 2rem;
-            border: 1px solid #ccc;
-            border-radius: 0.3rem;
-        }
-        #restart-panel p {
-            margin-bottom: 1rem;
-        }
-
-        /* 自定义滚动条样式 */
-        body:not(.no-scrollbar)::-webkit-scrollbar {
-            width: 8px;
-        }
-
-        body:not(.no-scrollbar)::-webkit-scrollbar-track {
-            background: #f1f1f1;
-            border-radius: 4px;
-        }
-
-        body:not(.no-scrollbar)::-webkit-scrollbar-thumb {
-            background: #888;
-            border-radius: 4px;
-        }
-
-        body:not(.no-scrollbar)::-webkit-scrollbar-thumb:hover {
-            background: #555;
-        }
-
-        /* 添加动画效果 */
-        .post-card {
-            background: #fff;
-            border-radius: 0.3rem;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-            padding: 1rem;
-            margin: 1rem 0;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }
-        .post-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 4px 10px rgba(0,0,0,0.2);
-        }
-    </style>
-</head>
-<body>
-    <div class="title-bar">
-        <div>我的 Electron 应用</div>
-        <div class="title-bar-buttons">
-            <div class="title-bar-button" id="btn-minimize">━</div>
-            <div class="title-bar-button" id="btn-maximize">□</div>
-            <div class="title-bar-button" id="btn-close">×</div>
-        </div>
-    </div>
-
-    <nav class="navbar">
-        <a href="#" class="brand">Cheshire Demo</a>
-        
-        <div class="nav-links">
-            <a href="#">首页</a>
-            <a href="#" id="nav-about">关于</a>
-            <a href="#">文档</a>
-            <a href="#">联系我们</a>
-        </div>
-    </nav>
-
-    <header class="hero">
-        <img src="static/icon.svg" alt="SVG Icon" width="100" height="100" draggable="false" />
-        <h1>欢迎使用 洛小山 Cheshire 框架演示!</h1>
-        <p>此应用加载外部 config.json 根据配置显示界面特性。更改后需重启生效。</p>
-        <a href="#" class="btn">开始体验</a>
-    </header>
-
-    <main class="container">
-        <h2 class="section-title">特色模块展示</h2>
-        <div class="grid">
-            <div class="card">
-                <h3>快速开发</h3>
-                <p>Cheshire Framework 提供简单易用的样式类，助你快速搭建精美界面。</p>
-                <div class="card-btn">
-                    <a href="#" class="btn">了解更多</a>
-                </div>
-            </div>
-            <div class="card">
-                <h3>响应式设计</h3>
-                <p>自动适配不同屏幕尺寸，无需为移动设备额外开发。</p>
-                <div class="card-btn">
-                    <a href="#" class="btn">查看示例</a>
-                </div>
-            </div>
-            <div class="card">
-                <h3>丰富组件</h3>
-                <p>包含网格布局、按钮、导航栏、表单、对话框等基础组件。</p>
-                <div class="card-btn">
-                    <a href="#" class="btn">组件文档</a>
-                </div>
-            </div>
-            <div class="card">
-                <h3>轻量与扩展</h3>
-                <p>核心样式轻量、快速，可灵活扩展，打造独特界面。</p>
-                <div class="card-btn">
-                    <a href="#" class="btn">开始使用</a>
-                </div>
-            </div>
-        </div>
-
-        <div class="card" style="margin-top: 2rem; text-align: center;">
-            <h2>操作面板（需重启生效）</h2>
-            <p>切换系统标题栏、菜单栏显示、是否隐藏滚动条。由于涉及窗口框架，所有更改都需要重启后生效。</p>
-            <div class="control-panel">
-                <button id="btn-toggle-menu-bar" class="btn">切换系统标题栏</button>
-                <button id="btn-toggle-scrollbar" class="btn">切换隐藏滚动条</button>
-            </div>
-        </div>
-        <div class="card" style="margin-top: 2rem; text-align: center;">
-            <h2>帖子展示</h2>
-            <button id="btn-fetch-data" class="btn">获取帖子数据</button>
-            <div id="posts-container" style="margin-top: 20px;"></div>
-            <div id="restart-panel">
-                <p>配置已更改，需要重启才能生效。</p>
-                <button id="btn-restart-now" class="btn">立即重启</button>
-            </div>
-        </div>
-    </main>
-    
-    <footer class="footer">
-        <p>© <script>document.write(new Date().getFullYear())</script> Cheshire Framework by 洛小山. All rights reserved.</p>
-    </footer>
-</body>
-</html>
-"""
-    create_file(project_path / 'main.js', main_js_content)
-    create_file(project_path / 'preload.js', preload_js_content)
-    create_file(project_path / 'renderer.js', renderer_js_content)
-    create_file(project_path / 'index.html', index_html_content)
-
-    update_package_json(project_path)
-
-    start_bat_content = """@echo off
-cd /d "%~dp0"
-npm start
-"""
-    create_file(project_path / 'start_electron.bat', start_bat_content)
-
-    create_static_files(project_path)  # 创建 static 目录及文件
+def run(args):
+    toolchain_cache = None if args.no_toolchain_cache else args.toolchain_cache
+    if args.compare_install:
+        check_toolchain(cache_path=toolchain_cache)
+        compare_install_paths()
+        return
+
+    if args.check_compat:
+        check_compat(args.check_compat)
+        return
+
+    if args.refresh_lock:
+        check_toolchain(('npm',), cache_path=toolchain_cache)
+        refresh_canonical_lock()
+        return
+
+    if args.fill_store:
+        check_toolchain(('npm',), cache_path=toolchain_cache)
+        fill_package_store(args.store)
+        return
+
+    if args.profile:
+        start_profile()
+
+    if args.update:
+        for project_path in args.update:
+            if not (project_path / 'package.json').exists():
+                raise ScaffoldError(f"'{project_path}' 不是一个 Electron 项目目录。")
+            update_project(project_path.resolve(), args)
+        if args.profile:
+            report = stop_profile()
+            print_profile_summary(report)
+            write_profile_report(report, args.profile)
+        return
+
+    check_toolchain(cache_path=toolchain_cache)
+
+    if args.batch:
+        results = run_batch(args)
+        if not args.no_snapshot:
+            evict_snapshots(args.snapshots, int(args.snapshot_max_size * 1024 ** 3), args.snapshot_max_age)
+        if args.profile:
+            report = merge_profiles([stop_profile()] + [r['profile'] for r in results if r['profile']])
+            print_profile_summary(report)
+            write_profile_report(report, args.profile)
+        if not all(r['ok'] for r in results):
+            sys.exit(1)
+        return
+
+    project_path = reserve_project_dir(args.output_dir, args.name)
+    PROJECT_NAME = project_path.name
+    create_project(project_path, PROJECT_NAME, args, context_from_args(args))
+    if not args.no_snapshot:
+        evict_snapshots(args.snapshots, int(args.snapshot_max_size * 1024 ** 3), args.snapshot_max_age)
+
+    if args.profile:
+        report = stop_profile()
+        print_profile_summary(report)
+        write_profile_report(report, args.profile)
 
     print("\nElectron 示例项目已创建成功！")
     print(f"项目目录: {project_path}")
@@ -1072,4 +2223,4 @@ npm start
     print("\n或者双击项目目录中的 'build_electron.bat' 文件。")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
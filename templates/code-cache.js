@@ -0,0 +1,60 @@
+{% if fast_startup %}
+// code-cache.js
+// 主进程的 V8 代码缓存：install() 之后 require 的应用模块（不含 node_modules）编译时使用上次保存的
+// 字节码缓存，省去解析与编译；缓存按 Electron 版本、文件路径和内容区分，内容变化后自动失效。
+// 页面脚本的代码缓存由 Chromium 负责，见 main.js 中的 app:// 协议
+const Module = require('module');
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const mainModule = require.main;
+
+function install(cacheDir, root = __dirname) {
+  const compile = Module.prototype._compile;
+  let ready = null;
+
+  function cacheFile(filename, content) {
+    const key = crypto.createHash('sha256')
+      .update(`${process.versions.electron}\0${filename}\0${content}`)
+      .digest('hex');
+    return path.join(cacheDir, `${key}.bin`);
+  }
+
+  // 写入失败只影响下次启动的速度，不报错
+  function save(file, script) {
+    ready = ready || fs.promises.mkdir(cacheDir, { recursive: true });
+    ready
+      .then(() => fs.promises.writeFile(file, script.createCachedData()))
+      .catch(() => {});
+  }
+
+  Module.prototype._compile = function (content, filename) {
+    if (!filename.startsWith(root + path.sep) || filename.includes(`${path.sep}node_modules${path.sep}`)) {
+      return compile.call(this, content, filename);
+    }
+    const file = cacheFile(filename, content);
+    let cachedData;
+    try {
+      cachedData = fs.readFileSync(file);
+    } catch (error) {
+      cachedData = undefined;
+    }
+    const script = new vm.Script(Module.wrap(content), { filename, cachedData });
+    const wrapper = script.runInThisContext({ displayErrors: true });
+
+    const mod = this;
+    const require = (id) => mod.require(id);
+    require.resolve = (request, options) => Module._resolveFilename(request, mod, false, options);
+    require.main = mainModule;
+    require.cache = Module._cache;
+    const result = wrapper.call(mod.exports, mod.exports, require, mod, filename, path.dirname(filename));
+    // 模块执行之后生成，缓存中包含执行期间编译过的函数
+    if (cachedData === undefined || script.cachedDataRejected) save(file, script);
+    return result;
+  };
+}
+
+module.exports = { install };
+{% endif %}
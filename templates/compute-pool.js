@@ -0,0 +1,162 @@
+{% if compute_pool %}
+// compute-pool.js
+// 主进程中的计算线程池（worker_threads）：解析、转换、过滤、聚合等耗时任务在工作线程中执行，
+// 结果分块发回，任务执行期间主进程的事件循环不被阻塞。线程在第一次使用时创建，空闲 idleTimeout 毫秒后退出；
+// 任务格式见 static/js/compute-jobs.js。只依赖 Node 内置模块，可以直接在 Node 中测试
+const os = require('os');
+const path = require('path');
+const { Worker } = require('worker_threads');
+
+// 留一个核给主进程，最多 4 个线程
+const DEFAULT_SIZE = Math.max(1, Math.min(4, (os.availableParallelism ? os.availableParallelism() : os.cpus().length) - 1));
+
+function createComputePool({ size = DEFAULT_SIZE, workerFile = path.join(__dirname, 'compute-worker.js'), idleTimeout = 30 * 1000 } = {}) {
+  const idle = [];
+  // 空闲线程 → 退出计时器
+  const idleTimers = new Map();
+  // 等待线程的任务
+  const queue = [];
+  // 执行中的任务
+  const active = new Set();
+  let running = 0;
+  let nextJobId = 1;
+  const stats = { jobs: 0, chunks: 0, workersStarted: 0, cancelled: 0 };
+
+  function takeWorker() {
+    const worker = idle.pop();
+    if (worker) {
+      clearTimeout(idleTimers.get(worker));
+      idleTimers.delete(worker);
+      return worker;
+    }
+    stats.workersStarted++;
+    return new Worker(workerFile);
+  }
+
+  function release(worker) {
+    running--;
+    idle.push(worker);
+    // 空闲线程不阻止进程退出
+    worker.unref();
+    idleTimers.set(worker, setTimeout(() => {
+      idleTimers.delete(worker);
+      idle.splice(idle.indexOf(worker), 1);
+      worker.terminate();
+    }, idleTimeout).unref());
+    drain();
+  }
+
+  function drain() {
+    while (queue.length > 0 && (idle.length > 0 || running < size)) {
+      running++;
+      start(takeWorker(), queue.shift());
+    }
+  }
+
+  function start(worker, task) {
+    const id = nextJobId++;
+    let failure = null;
+
+    const cleanup = () => {
+      worker.off('message', onMessage);
+      worker.off('error', onError);
+      worker.off('exit', onExit);
+      active.delete(task);
+      task.cancel = null;
+    };
+    const onMessage = (message) => {
+      if (message.id !== id) return;
+      if (message.chunk) {
+        stats.chunks++;
+        if (task.onChunk) {
+          task.onChunk(message.chunk);
+        } else {
+          for (const record of message.chunk) task.records.push(record);
+        }
+      } else if (message.error !== undefined) {
+        cleanup();
+        task.reject(new Error(message.error));
+        release(worker);
+      } else if (message.done) {
+        cleanup();
+        task.resolve({ total: message.total, result: message.result, records: task.records });
+        release(worker);
+      }
+    };
+    // 线程出错后会退出，在 exit 中一并处理
+    const onError = (error) => { failure = error; };
+    const onExit = (code) => {
+      cleanup();
+      running--;
+      task.reject(failure || new Error(`计算线程意外退出，退出码 ${code}`));
+      drain();
+    };
+
+    // 执行中的任务被取消时结束它所在的线程，之后的任务使用新的线程
+    task.cancel = () => {
+      cleanup();
+      worker.terminate();
+      running--;
+      drain();
+    };
+    active.add(task);
+    worker.on('message', onMessage);
+    worker.on('error', onError);
+    worker.on('exit', onExit);
+    worker.ref();
+    worker.postMessage({ id, job: task.job });
+  }
+
+  // 提交一个任务。指定 onChunk 时每批记录到达后调用一次；否则记录汇总在结果的 records 中。
+  // 返回 Promise<{ total, result, records }>；signal 取消时以 signal.reason reject
+  function run(job, { onChunk, signal } = {}) {
+    return new Promise((resolve, reject) => {
+      if (signal && signal.aborted) {
+        reject(signal.reason);
+        return;
+      }
+      const task = { job, onChunk, resolve, reject, records: onChunk ? null : [], cancel: null };
+      stats.jobs++;
+      if (signal) {
+        const onAbort = () => {
+          stats.cancelled++;
+          const queued = queue.indexOf(task);
+          if (queued >= 0) {
+            queue.splice(queued, 1);
+          } else if (task.cancel) {
+            task.cancel();
+          }
+          reject(signal.reason);
+        };
+        signal.addEventListener('abort', onAbort, { once: true });
+        const settle = (callback) => (value) => {
+          signal.removeEventListener('abort', onAbort);
+          callback(value);
+        };
+        task.resolve = settle(resolve);
+        task.reject = settle(reject);
+      }
+      queue.push(task);
+      drain();
+    });
+  }
+
+  // 结束所有线程，未完成的任务以错误结束
+  function destroy() {
+    for (const task of queue.splice(0)) task.reject(new Error('计算线程池已关闭'));
+    for (const task of [...active]) {
+      task.cancel();
+      task.reject(new Error('计算线程池已关闭'));
+    }
+    for (const worker of idle.splice(0)) {
+      clearTimeout(idleTimers.get(worker));
+      worker.terminate();
+    }
+    idleTimers.clear();
+  }
+
+  return { run, destroy, stats, get size() { return size; } };
+}
+
+module.exports = { createComputePool };
+{% endif %}
@@ -0,0 +1,10 @@
+{% if compute_pool %}
+// compute-worker.js
+// 主进程计算线程池（compute-pool.js）中的工作线程，每次执行一个任务；任务格式见 static/js/compute-jobs.js
+const { parentPort } = require('worker_threads');
+const { execute } = require('./static/js/compute-jobs');
+
+parentPort.on('message', ({ id, job }) => {
+  execute(job, (message) => parentPort.postMessage({ id, ...message }));
+});
+{% endif %}
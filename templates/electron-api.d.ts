@@ -0,0 +1,99 @@
+// preload.js 通过 contextBridge 暴露给页面的 API，页面中以 window.electronAPI 访问。
+// 方法按 ipc-channels.js 中声明的通道生成，在那里增删通道时同步修改这里的类型
+
+export interface AppConfig {
+  menuBarVisible: boolean;
+  hideScrollBar: boolean;
+}
+
+{% if posts_demo %}
+export interface Post {
+  userId: number;
+  id: number;
+  title: string;
+  body: string;
+}
+
+export interface PostsPage {
+  posts: Post[];
+  /** 到这一页为止已加载的条数 */
+  loaded: number;
+  /** 总条数；服务端未提供且尚未加载完时为 null */
+  total: number | null;
+}
+
+export interface PostsLoadResult {
+  /** 被新的加载或 cancelPosts() 取消 */
+  cancelled: boolean;
+  loaded: number;
+  total: number | null;
+}
+
+{% endif %}
+{% if compute_pool %}
+/** 后台计算任务的一步，见 static/js/compute-jobs.js */
+export type ComputeStep =
+  | { op: 'parse' }
+  | { op: 'transform'; fields?: string[]; maxLength?: number }
+  | { op: 'filter'; query: string; fields?: string[] }
+  | { op: 'aggregate'; groupBy: string; sum?: string };
+
+export interface ComputeJob {
+  /** JSON 文本或记录数组；页面的 Web Worker 还接受 File/Blob */
+  input: string | unknown[] | Blob;
+  steps: ComputeStep[];
+}
+
+export interface ComputeResult {
+  /** 被 cancelCompute() 取消 */
+  cancelled: boolean;
+  /** 结果记录的条数；aggregate 时为参与分组的记录数 */
+  total: number | null;
+  /** aggregate 的分组，或 parse 得到的非数组值；其他情况为 null */
+  result: unknown;
+}
+
+{% endif %}
+export type WindowAction = 'minimize' | 'maximize' | 'close';
+
+export interface ElectronAPI {
+{% if fast_startup %}
+  /** 创建窗口时的配置，页面加载时同步可用；之后的变化通过 onConfigChanged 通知 */
+  initialConfig: AppConfig | null;
+{% endif %}
+  getConfig(): Promise<AppConfig>;
+  /** 合并并校验后保存，返回实际保存的配置；配置不合法时 reject */
+  updateConfig(changes: Partial<AppConfig>): Promise<AppConfig>;
+  /** 任意窗口修改配置后触发；返回取消监听的函数 */
+  onConfigChanged(callback: (config: AppConfig) => void): () => void;
+  /** 只作用于当前窗口，不等待结果 */
+  windowAction(action: WindowAction): void;
+  showAbout(): Promise<void>;
+{% if startup_trace %}
+  /** 在启动追踪的时间线上记录一个页面进程中的时间点 */
+  traceMark(name: string): void;
+{% endif %}
+{% if posts_demo %}
+  /** 上次加载时保存在本地的帖子，按服务端顺序排列；不访问网络 */
+  getCachedPosts(): Promise<Post[]>;
+  /** 分页加载帖子，每收到一页调用一次 onPage；开始新的加载会取消当前窗口中进行中的加载 */
+  loadPosts(
+    onPage: (page: PostsPage) => void,
+    options?: { pageSize?: number; refresh?: boolean }
+  ): Promise<PostsLoadResult>;
+  /** 取消当前窗口中进行中的加载 */
+  cancelPosts(): Promise<void>;
+{% endif %}
+{% if compute_pool %}
+  /** 在主进程的计算线程池中执行任务，每批结果记录调用一次 onChunk；input 不能是 File/Blob */
+  compute(job: ComputeJob, onChunk?: (records: unknown[]) => void): Promise<ComputeResult>;
+  /** 取消当前窗口提交到主进程的全部计算任务 */
+  cancelCompute(): Promise<void>;
+{% endif %}
+}
+
+declare global {
+  interface Window {
+    electronAPI: ElectronAPI;
+  }
+}
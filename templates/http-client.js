@@ -0,0 +1,181 @@
+{% if posts_demo %}
+// http-client.js
+// 主进程中的 HTTP 客户端：keep-alive 连接池、按 ETag/Last-Modified 校验的响应缓存（带 TTL，最多 maxEntries 项，
+// 按最近最少使用淘汰），相同 URL 的并发请求合并，以及可用 AbortSignal 取消的分页请求。只依赖 Node 内置模块，
+// 可以直接在 Node 中针对本地 HTTP 服务测试
+const http = require('http');
+const https = require('https');
+const zlib = require('zlib');
+
+const DECODERS = {
+  gzip: zlib.createGunzip,
+  deflate: zlib.createInflate,
+  br: zlib.createBrotliDecompress
+};
+
+// parse 把 JSON 响应的文本转换为数据，可以返回 Promise，例如交给工作线程解析较大的响应
+function createHttpClient({ baseURL = '', ttl = 60 * 1000, maxSockets = 6, timeout = 15 * 1000, maxEntries = 200, parse = JSON.parse } = {}) {
+  const agentOptions = { keepAlive: true, maxSockets };
+  const agents = { 'http:': new http.Agent(agentOptions), 'https:': new https.Agent(agentOptions) };
+  // 完整 URL → { data, headers, etag, lastModified, expires }，按最近使用的顺序排列
+  const cache = new Map();
+  // 完整 URL → { promise, controller, waiters }：进行中的请求，以及可以取消它的调用方数量
+  const inflight = new Map();
+  const stats = { requests: 0, reusedConnections: 0, cacheHits: 0, revalidated: 0, deduped: 0, evicted: 0 };
+
+  function cacheGet(url) {
+    const entry = cache.get(url);
+    if (entry) {
+      cache.delete(url);
+      cache.set(url, entry);
+    }
+    return entry;
+  }
+
+  function cacheSet(url, entry) {
+    cache.delete(url);
+    cache.set(url, entry);
+    for (const oldest of cache.keys()) {
+      if (cache.size <= maxEntries) break;
+      cache.delete(oldest);
+      stats.evicted++;
+    }
+  }
+
+  function request(url, headers, signal) {
+    const target = new URL(url);
+    const transport = target.protocol === 'https:' ? https : http;
+    return new Promise((resolve, reject) => {
+      if (signal && signal.aborted) {
+        reject(signal.reason);
+        return;
+      }
+      const req = transport.get(target, {
+        agent: agents[target.protocol],
+        timeout,
+        headers: { Accept: 'application/json', 'Accept-Encoding': 'gzip, deflate, br', ...headers }
+      }, (res) => {
+        // 无论状态码如何都读完响应体，连接才会回到连接池
+        const decoder = DECODERS[res.headers['content-encoding']];
+        const stream = decoder ? res.pipe(decoder()) : res;
+        const chunks = [];
+        res.on('error', reject);
+        stream.on('data', (chunk) => chunks.push(chunk));
+        stream.on('error', reject);
+        stream.on('end', () => resolve({ status: res.statusCode, headers: res.headers, body: Buffer.concat(chunks) }));
+      });
+      if (signal) {
+        // 取消时断开这个请求的连接，Promise 立即以 signal.reason reject
+        const onAbort = () => {
+          req.destroy();
+          reject(signal.reason);
+        };
+        signal.addEventListener('abort', onAbort, { once: true });
+        req.on('close', () => signal.removeEventListener('abort', onAbort));
+      }
+      req.on('socket', () => {
+        stats.requests++;
+        if (req.reusedSocket) stats.reusedConnections++;
+      });
+      req.on('timeout', () => req.destroy(new Error(`请求超时: ${url}`)));
+      req.on('error', reject);
+    });
+  }
+
+  async function fetchAndCache(url, signal) {
+    const entry = cacheGet(url);
+    const headers = {};
+    if (entry && entry.etag) headers['If-None-Match'] = entry.etag;
+    if (entry && entry.lastModified) headers['If-Modified-Since'] = entry.lastModified;
+
+    const response = await request(url, headers, signal);
+    if (response.status === 304 && entry) {
+      // 内容未变化：沿用缓存的数据，重新计算有效期
+      stats.revalidated++;
+      entry.expires = Date.now() + ttl;
+      return entry;
+    }
+    if (response.status < 200 || response.status >= 300) {
+      throw new Error(`请求失败 (HTTP ${response.status}): ${url}`);
+    }
+
+    const text = response.body.toString('utf-8');
+    const data = /\bjson\b/.test(response.headers['content-type'] || '') ? await parse(text) : text;
+    const fresh = {
+      data,
+      headers: response.headers,
+      etag: response.headers.etag,
+      lastModified: response.headers['last-modified'],
+      expires: Date.now() + ttl
+    };
+    if (/\bno-store\b/.test(response.headers['cache-control'] || '')) {
+      cache.delete(url);
+    } else {
+      cacheSet(url, fresh);
+    }
+    return fresh;
+  }
+
+  // 返回缓存项 { data, headers, ... }。相同 URL 的并发请求共享一次网络请求；每个调用方可以用自己的 signal
+  // 单独取消（它的 Promise 立即以 signal.reason reject），所有能取消的调用方都取消后才中止网络请求
+  function load(path, { refresh = false, signal } = {}) {
+    const url = new URL(path, baseURL || undefined).toString();
+    const entry = cacheGet(url);
+    if (!refresh && entry && entry.expires > Date.now()) {
+      stats.cacheHits++;
+      return Promise.resolve(entry);
+    }
+    if (signal && signal.aborted) return Promise.reject(signal.reason);
+
+    let shared = inflight.get(url);
+    if (shared) {
+      stats.deduped++;
+    } else {
+      const controller = new AbortController();
+      shared = { controller, waiters: 0, promise: null };
+      const current = shared;
+      shared.promise = fetchAndCache(url, controller.signal).finally(() => {
+        if (inflight.get(url) === current) inflight.delete(url);
+      });
+      inflight.set(url, shared);
+    }
+    // 不带 signal 的调用方不会取消，请求一定会完成
+    shared.waiters += signal ? 1 : Infinity;
+    if (!signal) return shared.promise;
+
+    return new Promise((resolve, reject) => {
+      const onAbort = () => {
+        reject(signal.reason);
+        if (--shared.waiters === 0) {
+          if (inflight.get(url) === shared) inflight.delete(url);
+          shared.controller.abort(signal.reason);
+        }
+      };
+      signal.addEventListener('abort', onAbort, { once: true });
+      shared.promise.then(resolve, reject).finally(() => signal.removeEventListener('abort', onAbort));
+    });
+  }
+
+  // TTL 内直接返回缓存；过期后带上 ETag/Last-Modified 重新校验；refresh 为 true 时忽略 TTL
+  async function get(path, options) {
+    return (await load(path, options)).data;
+  }
+
+  // 按 json-server 约定的 _start/_limit 参数请求一页；total 取自 X-Total-Count，服务端未提供时为 null
+  async function getPage(path, { start, limit, ...options }) {
+    const separator = path.includes('?') ? '&' : '?';
+    const entry = await load(`${path}${separator}_start=${start}&_limit=${limit}`, options);
+    const total = Number.parseInt(entry.headers['x-total-count'], 10);
+    return { items: entry.data, total: Number.isNaN(total) ? null : total };
+  }
+
+  function destroy() {
+    for (const agent of Object.values(agents)) agent.destroy();
+    cache.clear();
+  }
+
+  return { get, getPage, stats, clear: () => cache.clear(), destroy };
+}
+
+module.exports = { createHttpClient };
+{% endif %}
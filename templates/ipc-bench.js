@@ -0,0 +1,49 @@
+{% if ipc_bench %}
+// ipc-bench.js
+// IPC 基准测试的主进程部分：设置 IPC_BENCH 启动应用时，main.js 注册这里的测试通道（声明见 ipc-channels.js），
+// 页面加载 static/js/ipc-bench.js 完成测量后把结果交回，这里输出表格和一行 JSON 后退出应用。
+// benchmarks/bench_ipc.py 会读取以 IPC_BENCH_RESULT 开头的这一行
+const { app } = require('electron');
+
+function formatSize(bytes) {
+  return bytes >= 1024 ? `${bytes / 1024} KB` : `${bytes} B`;
+}
+
+// 列名与宽度；每秒消息数按 invoke、合并 invoke、send、合并 send 的顺序
+const COLUMNS = [['负载', 10], ['延迟 p50/p95 (ms)', 20], ['合并 p50 (ms)', 14], ['invoke/s', 10], ['合并 invoke/s', 14], ['send/s', 10], ['合并 send/s', 12]];
+
+function printReport({ results, error }) {
+  const line = (cells) => cells.map((cell, i) => (i === 0 ? cell.padEnd(COLUMNS[i][1]) : cell.padStart(COLUMNS[i][1]))).join('');
+  console.log(line(COLUMNS.map(([name]) => name)));
+  for (const row of results) {
+    console.log(line([
+      formatSize(row.size),
+      `${row.latency.p50.toFixed(3)} / ${row.latency.p95.toFixed(3)}`,
+      row.latencyBatched.p50.toFixed(3),
+      ...Object.values(row.perSecond).map((value) => String(Math.round(value)))
+    ]));
+  }
+  if (error) console.error('IPC 基准测试失败:', error);
+}
+
+function register(ipc) {
+  let count = 0;
+  ipc.handle('benchEcho', (event, payload) => payload);
+  ipc.handle('benchEchoBatched', (event, payload) => payload);
+  ipc.handle('benchSink', () => { count++; });
+  ipc.handle('benchSinkBatched', () => { count++; });
+  // 返回上次调用以来 send 通道收到的消息数，并重新计数
+  ipc.handle('benchCount', () => {
+    const received = count;
+    count = 0;
+    return received;
+  });
+  ipc.handle('benchReport', (event, report) => {
+    printReport(report);
+    console.log(`IPC_BENCH_RESULT ${JSON.stringify({ ...report, stats: ipc.stats })}`);
+    setImmediate(() => app.quit());
+  });
+}
+
+module.exports = { register };
+{% endif %}
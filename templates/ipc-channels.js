@@ -0,0 +1,46 @@
+// ipc-channels.js
+// 声明式的 IPC 通道表，页面与主进程之间的所有消息都在这里声明。主进程按它注册处理函数并校验参数
+// （ipc-router.js），preload.js 按它生成 window.electronAPI 上的方法；preload 在沙箱中不能 require
+// 应用文件，通道表由主进程在创建窗口时通过 additionalArguments 传入。
+//
+// kind:   'invoke' 页面调用并等待结果；'send' 页面发出、不等待结果；'event' 主进程推送给页面，生成 on<Name>(callback)
+// args:   参数校验规则，每项是 typeof 的结果，或允许取值的数组
+// batch:  高频消息在一小段时间内合并为一次 IPC 发送
+// expose: 为 false 时不直接暴露给页面，由 preload.js 中手写的方法包装
+const channels = {
+  getConfig: { kind: 'invoke', args: [] },
+  updateConfig: { kind: 'invoke', args: ['object'] },
+  configChanged: { kind: 'event' },
+  windowAction: { kind: 'send', args: [['minimize', 'maximize', 'close']] },
+  showAbout: { kind: 'invoke', args: [] },
+{% if startup_trace %}
+  traceMark: { kind: 'send', args: ['object'], batch: true, expose: false },
+{% endif %}
+{% if posts_demo %}
+  getCachedPosts: { kind: 'invoke', args: [] },
+  loadPosts: { kind: 'invoke', args: ['object'], expose: false },
+  cancelPosts: { kind: 'invoke', args: [] },
+  postsPage: { kind: 'event', expose: false },
+{% endif %}
+{% if compute_pool %}
+  runCompute: { kind: 'invoke', args: ['object'], expose: false },
+  computeChunk: { kind: 'event', expose: false },
+  cancelCompute: { kind: 'invoke', args: [] },
+{% endif %}
+};
+
+{% if ipc_bench %}
+// IPC 基准测试使用的通道，只在设置了 IPC_BENCH 时声明（见 ipc-bench.js）
+if (process.env.IPC_BENCH) {
+  Object.assign(channels, {
+    benchEcho: { kind: 'invoke', args: ['string'] },
+    benchEchoBatched: { kind: 'invoke', args: ['string'], batch: true },
+    benchSink: { kind: 'send', args: ['string'] },
+    benchSinkBatched: { kind: 'send', args: ['string'], batch: true },
+    benchCount: { kind: 'invoke', args: [] },
+    benchReport: { kind: 'invoke', args: ['object'] }
+  });
+}
+{% endif %}
+
+module.exports = channels;
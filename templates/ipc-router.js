@@ -0,0 +1,113 @@
+// ipc-router.js
+// 主进程一侧的 IPC 路由：按 ipc-channels.js 的声明分发页面发来的消息，并把结果与事件发回页面。
+// 两个方向都只使用 ipc:message 一个 Electron 通道，每次发送一批消息：
+//   页面 → 主进程  { id, name, args }，send 类消息没有 id
+//   主进程 → 页面  { id, result } / { id, error } / { event, payload }
+// id 把结果与调用对应起来。发往同一页面的消息保持顺序；声明了 batch 的消息最多延迟 BATCH_DELAY 毫秒，
+// 与这段时间内的其他消息合并发送，非 batch 消息会立即带上之前排队的消息一起发出
+const { ipcMain } = require('electron');
+
+const IPC_CHANNEL = 'ipc:message';
+const CHANNELS_ARG = '--ipc-channels=';
+const BATCH_DELAY = 16;
+
+// 参数不符合声明时返回错误信息
+function checkArgs(spec, args) {
+  const rules = spec.args || [];
+  if (!Array.isArray(args) || args.length !== rules.length) {
+    return `需要 ${rules.length} 个参数`;
+  }
+  for (let i = 0; i < rules.length; i++) {
+    const rule = rules[i];
+    const valid = Array.isArray(rule) ? rule.includes(args[i]) : typeof args[i] === rule && args[i] !== null;
+    if (!valid) return `第 ${i + 1} 个参数应为 ${Array.isArray(rule) ? rule.join(' | ') : rule}`;
+  }
+  return null;
+}
+
+function createIpcRouter(channels) {
+  const handlers = new Map();
+  // webContents → { messages, timer }
+  const outboxes = new WeakMap();
+  const stats = { received: 0, sent: 0, ipcReceived: 0, ipcSent: 0 };
+
+  // 处理函数的参数为 (event, ...args)；invoke 的返回值（可以是 Promise）作为结果发回页面
+  function handle(name, handler) {
+    const spec = channels[name];
+    if (!spec || spec.kind === 'event') throw new Error(`未声明的 IPC 通道: ${name}`);
+    handlers.set(name, handler);
+  }
+
+  function flush(contents, outbox) {
+    clearTimeout(outbox.timer);
+    outbox.timer = null;
+    if (outbox.messages.length === 0 || contents.isDestroyed()) return;
+    stats.ipcSent++;
+    stats.sent += outbox.messages.length;
+    contents.send(IPC_CHANNEL, outbox.messages.splice(0));
+  }
+
+  function post(contents, message, batch) {
+    if (contents.isDestroyed()) return;
+    let outbox = outboxes.get(contents);
+    if (!outbox) {
+      outbox = { messages: [], timer: null };
+      outboxes.set(contents, outbox);
+    }
+    outbox.messages.push(message);
+    if (!batch) {
+      flush(contents, outbox);
+    } else if (!outbox.timer) {
+      outbox.timer = setTimeout(() => flush(contents, outbox), BATCH_DELAY);
+    }
+  }
+
+  // 向一个页面推送事件
+  function emit(contents, name, payload) {
+    const spec = channels[name];
+    if (!spec || spec.kind !== 'event') throw new Error(`未声明的 IPC 事件: ${name}`);
+    post(contents, { event: name, payload }, spec.batch);
+  }
+
+  async function dispatch(event, { id, name, args }) {
+    const spec = channels[name];
+    const handler = handlers.get(name);
+    let error = spec && spec.kind !== 'event' && handler ? checkArgs(spec, args) : `未声明的 IPC 通道: ${name}`;
+    let result;
+    if (error === null) {
+      try {
+        result = await handler(event, ...args);
+      } catch (e) {
+        error = e.message;
+      }
+    }
+    if (id === undefined) {
+      if (error !== null) console.error(`IPC 消息 ${name} 处理失败:`, error);
+      return;
+    }
+    post(event.sender, error === null ? { id, result } : { id, error }, spec && spec.batch);
+  }
+
+  ipcMain.on(IPC_CHANNEL, (event, messages) => {
+    if (!Array.isArray(messages)) return;
+    stats.ipcReceived++;
+    stats.received += messages.length;
+    for (const message of messages) {
+      if (message && typeof message.name === 'string') dispatch(event, message);
+    }
+  });
+
+  // 创建窗口时加入 webPreferences.additionalArguments，preload.js 据此生成方法
+  function preloadArgument() {
+    return CHANNELS_ARG + JSON.stringify(channels);
+  }
+
+  // 声明了但还没有处理函数的通道
+  function unhandled() {
+    return Object.keys(channels).filter((name) => channels[name].kind !== 'event' && !handlers.has(name));
+  }
+
+  return { handle, emit, preloadArgument, unhandled, stats };
+}
+
+module.exports = { createIpcRouter };
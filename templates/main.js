@@ -0,0 +1,854 @@
+{% if fast_startup %}
+const { app, BrowserWindow, Menu, dialog, net, protocol } = require('electron');
+{% else %}
+const { app, BrowserWindow, Menu, dialog } = require('electron');
+{% endif %}
+const path = require('path');
+const fs = require('fs');
+const { createIpcRouter } = require('./ipc-router');
+
+// 页面与主进程之间的消息都在 ipc-channels.js 中声明，处理函数在本文件末尾注册
+const ipc = createIpcRouter(require('./ipc-channels'));
+{% if startup_trace %}
+const { createStartupTrace } = require('./startup-trace');
+
+// 启动追踪：主进程与页面的启动时间点写成 Chrome trace JSON（默认为用户数据目录中的 startup-trace.json，
+// 可用 STARTUP_TRACE_FILE 指定）。首个窗口显示 TRACE_WRITE_DELAY 毫秒后写入，退出前再写入之后新增的事件
+const TRACE_WRITE_DELAY = 3000;
+const trace = createStartupTrace(process.env.STARTUP_TRACE_FILE || path.join(app.getPath('userData'), 'startup-trace.json'));
+trace.mark('process start', { time: process.getCreationTime() });
+trace.mark('main.js');
+{% endif %}
+{% if fast_startup %}
+const { pathToFileURL } = require('url');
+
+// 之后 require 的应用模块使用 V8 代码缓存，省去再次启动时的解析与编译
+require('./code-cache').install(path.join(app.getPath('userData'), 'code-cache'));
+
+// 页面通过 app:// 协议加载：Chromium 只为标准协议的页面脚本生成 V8 代码缓存，file:// 不缓存
+protocol.registerSchemesAsPrivileged([
+  { scheme: 'app', privileges: { standard: true, secure: true, supportFetchAPI: true, codeCache: true } }
+]);
+{% endif %}
+
+{% if fast_startup %}
+// 模块在第一次使用时才加载，不占用首个窗口显示之前的时间。peek() 只返回已经创建的实例，
+// 还没有创建时返回 null，退出时的清理用它避免为了销毁而加载模块
+function lazy(create) {
+  let value = null;
+  const get = () => value || (value = create());
+  get.peek = () => value;
+  return get;
+}
+{% else %}
+// 不使用启动优化时，模块在定义时立即加载
+function lazy(create) {
+  const value = create();
+  const get = () => value;
+  get.peek = () => value;
+  return get;
+}
+{% endif %}
+
+// 冷启动到首个窗口可显示（完成首次绘制）的耗时（毫秒），作为 app.relaunch() 重启代价的参照
+let coldStartMs = null;
+
+{% if not fast_startup %}
+const SCROLLBAR_CSS = '*::-webkit-scrollbar { display: none !important; }';
+// 每个 webContents 当前插入的隐藏滚动条 CSS 的 key，以及串行化的增删操作
+const scrollBarCssKeys = new Map();
+const scrollBarUpdates = new Map();
+{% endif %}
+// 每个窗口创建时使用的 frame 设置，以及首次渲染完成（ready-to-show）的 Promise；
+// 窗口替换依次进行，避免连续切换时重复创建窗口
+const windowFrames = new WeakMap();
+const windowReady = new WeakMap();
+let windowSwap = Promise.resolve();
+
+// 预热窗口池的大小，以及首个窗口显示后多久开始预热（毫秒），避免与冷启动争抢资源
+const WINDOW_POOL_SIZE = 1;
+const WINDOW_POOL_DELAY = 1000;
+
+// 配置项及其默认值；所有配置项都是布尔值
+const CONFIG_DEFAULTS = { menuBarVisible: true, hideScrollBar: false };
+// 连续修改配置时，停止修改这么久之后才写入磁盘（毫秒）
+const CONFIG_WRITE_DELAY = 300;
+
+function validateConfig(value) {
+  if (!value || typeof value !== 'object' || Array.isArray(value)) {
+    throw new TypeError('配置必须是一个对象');
+  }
+  const result = {};
+  for (const [key, fallback] of Object.entries(CONFIG_DEFAULTS)) {
+    if (value[key] === undefined) {
+      result[key] = fallback;
+    } else if (typeof value[key] !== 'boolean') {
+      throw new TypeError(`配置项 ${key} 必须是布尔值`);
+    } else {
+      result[key] = value[key];
+    }
+  }
+  return result;
+}
+
+// 配置服务：启动时只读取一次，之后都从内存返回；
+// 多次修改合并为一次延迟写入，先写临时文件再 rename，写入过程中不会留下残缺的 config.json
+const configService = {
+  path: path.join(__dirname, 'config.json'),
+  data: null,
+  timer: null,
+  writing: null,
+  pending: false,
+
+{% if fast_startup %}
+  // 启动时与 app.whenReady() 并行读取，之后的 get() 不再同步读取文件
+  async load() {
+    if (this.data) return this.data;
+{% if startup_trace %}
+    const started = trace.now();
+{% endif %}
+    try {
+      const text = await fs.promises.readFile(this.path, 'utf-8');
+      this.data = this.data || validateConfig(JSON.parse(text));
+    } catch (error) {
+      // 出错时交给 get() 按原有逻辑处理
+    }
+{% if startup_trace %}
+    trace.span('loadConfig', started);
+{% endif %}
+    return this.get();
+  },
+
+{% endif %}
+  get() {
+    if (!this.data) {
+{% if startup_trace %}
+      const started = trace.now();
+{% endif %}
+      try {
+        this.data = validateConfig(JSON.parse(fs.readFileSync(this.path, 'utf-8')));
+      } catch (error) {
+        this.data = { ...CONFIG_DEFAULTS };
+        if (error.code === 'ENOENT') {
+          this.scheduleWrite();
+        } else {
+          console.error('读取配置失败，使用默认配置:', error.message);
+          if (!error.code) this.setAside();
+        }
+      }
+{% if startup_trace %}
+      trace.span('loadConfig', started, { args: { sync: true } });
+{% endif %}
+    }
+    return this.data;
+  },
+
+  // 内容无效的配置文件移到 config.json.bad 后再写入默认配置；无法移走时不写入，以免覆盖用户的文件。
+  // 读取本身失败（例如没有权限）时同样只在内存中使用默认配置
+  setAside() {
+    try {
+      fs.renameSync(this.path, `${this.path}.bad`);
+      console.error(`原配置文件已移至 ${this.path}.bad`);
+      this.scheduleWrite();
+    } catch (error) {
+      console.error('无法移走原配置文件，不写入默认配置:', error.message);
+    }
+  },
+
+  update(changes) {
+    this.data = validateConfig({ ...this.get(), ...changes });
+    this.scheduleWrite();
+    return this.data;
+  },
+
+  isDirty() {
+    return this.timer !== null || this.writing !== null;
+  },
+
+  scheduleWrite() {
+    clearTimeout(this.timer);
+    this.timer = setTimeout(() => this.flush(), CONFIG_WRITE_DELAY);
+  },
+
+  // 立即写入尚未保存的修改；同一时间只有一个写入，写入期间的新修改在其完成后再写一次
+  flush() {
+    clearTimeout(this.timer);
+    this.timer = null;
+    if (this.writing) {
+      this.pending = true;
+    } else {
+      this.writing = this.write()
+        .catch((error) => console.error('保存配置失败:', error))
+        .finally(() => { this.writing = null; });
+    }
+    return this.writing;
+  },
+
+  async write() {
+    const tmpPath = `${this.path}.${process.pid}.tmp`;
+    do {
+      this.pending = false;
+      await fs.promises.writeFile(tmpPath, JSON.stringify(this.data, null, 2), 'utf-8');
+      await fs.promises.rename(tmpPath, this.path);
+    } while (this.pending);
+  }
+};
+
+// 窗口管理：已显示的窗口登记在 windows 中，IPC 按 event.sender 找到对应窗口；
+// pool 中是隐藏且已加载页面的备用窗口，新建窗口时直接显示
+const windowManager = {
+  windows: new Map(),
+  pool: [],
+  poolTimer: null,
+
+  fromEvent(event) {
+    const window = BrowserWindow.fromWebContents(event.sender);
+    return window && this.windows.has(window.id) ? window : null;
+  },
+
+  register(window) {
+    const id = window.id;
+    this.windows.set(id, window);
+    window.on('closed', () => {
+      this.windows.delete(id);
+      // 最后一个窗口关闭时销毁备用窗口，window-all-closed 才会触发
+      if (this.windows.size === 0) this.drainPool();
+    });
+  },
+
+  // 取出一个 frame 与当前配置一致的备用窗口，没有时返回 null
+  takeFromPool() {
+    const frame = configService.get().menuBarVisible;
+    while (this.pool.length > 0) {
+      const window = this.pool.shift();
+      if (!window.isDestroyed() && windowFrames.get(window) === frame) return window;
+      if (!window.isDestroyed()) window.destroy();
+    }
+    return null;
+  },
+
+  // 显示一个新窗口；bounds 未指定时由系统决定位置
+  open(bounds) {
+    const started = Date.now();
+    const pooled = this.takeFromPool();
+    const window = pooled || createWindow();
+    if (bounds) window.setBounds(bounds);
+    this.register(window);
+    this.schedulePoolFill();
+    return windowReady.get(window).then(() => {
+      if (window.isDestroyed()) return window;
+      window.show();
+{% if startup_trace %}
+      trace.mark('window shown', { args: { window: window.id, pooled: Boolean(pooled) } });
+{% endif %}
+      if (coldStartMs === null) {
+        coldStartMs = Date.now() - process.getCreationTime();
+        console.log(`冷启动到窗口可显示: ${coldStartMs} ms`);
+{% if startup_trace %}
+        setTimeout(() => trace.flush(), TRACE_WRITE_DELAY);
+{% endif %}
+        // 供 benchmarks/bench_startup.py 测量启动耗时
+        if (process.env.EXIT_AFTER_FIRST_PAINT) app.quit();
+      } else {
+        console.log(`新建窗口用时 ${Date.now() - started} ms（${pooled ? '预热窗口' : '新创建'}）`);
+      }
+      return window;
+    });
+  },
+
+  schedulePoolFill() {
+    clearTimeout(this.poolTimer);
+    this.poolTimer = setTimeout(() => {
+      this.poolTimer = null;
+      while (this.windows.size > 0 && this.pool.length < WINDOW_POOL_SIZE) {
+        this.pool.push(createWindow());
+      }
+    }, WINDOW_POOL_DELAY);
+  },
+
+  // 丢弃 frame 与当前配置不一致的备用窗口并重新预热
+  refreshPool() {
+    const frame = configService.get().menuBarVisible;
+    this.pool = this.pool.filter((window) => {
+      if (!window.isDestroyed() && windowFrames.get(window) === frame) return true;
+      if (!window.isDestroyed()) window.destroy();
+      return false;
+    });
+    this.schedulePoolFill();
+  },
+
+  drainPool() {
+    clearTimeout(this.poolTimer);
+    this.poolTimer = null;
+    for (const window of this.pool.splice(0)) {
+      if (!window.isDestroyed()) window.destroy();
+    }
+  }
+};
+
+{% if app_menu %}
+function createMenu() {
+  const template = [
+    {
+      label: '文件',
+      submenu: [
+        {
+          label: '新建窗口',
+          accelerator: 'CmdOrCtrl+N',
+          click: () => windowManager.open()
+        },
+        { type: 'separator' },
+        {
+          label: '保存',
+          accelerator: 'CmdOrCtrl+S',
+          click: () => { /* 添加保存逻辑 */ }
+        },
+        { type: 'separator' },
+        { 
+          label: '退出',
+          accelerator: 'CmdOrCtrl+Q',
+          click: () => app.quit()
+        }
+      ]
+    },
+    {
+      label: '编辑',
+      submenu: [
+        { role: 'undo', label: '撤销', accelerator: 'CmdOrCtrl+Z' },
+        { role: 'redo', label: '重做', accelerator: 'CmdOrCtrl+Y' },
+        { type: 'separator' },
+        { role: 'cut', label: '剪切', accelerator: 'CmdOrCtrl+X' },
+        { role: 'copy', label: '复制', accelerator: 'CmdOrCtrl+C' },
+        { role: 'paste', label: '粘贴', accelerator: 'CmdOrCtrl+V' },
+        { role: 'selectAll', label: '全选', accelerator: 'CmdOrCtrl+A' }
+      ]
+    },
+    {
+      label: '视图',
+      submenu: [
+        { role: 'reload', label: '重新加载', accelerator: 'CmdOrCtrl+R' },
+        { role: 'forceReload', label: '强制重新加载', accelerator: 'CmdOrCtrl+Shift+R' },
+        { type: 'separator' },
+        { role: 'toggleDevTools', label: '开发者工具', accelerator: 'F12' },
+        { type: 'separator' },
+        { role: 'resetZoom', label: '实际大小', accelerator: 'CmdOrCtrl+0' },
+        { role: 'zoomIn', label: '放大', accelerator: 'CmdOrCtrl+Plus' },
+        { role: 'zoomOut', label: '缩小', accelerator: 'CmdOrCtrl+-' },
+        { type: 'separator' },
+        { role: 'togglefullscreen', label: '全屏', accelerator: 'F11' }
+      ]
+    },
+    {
+      label: '窗口',
+      submenu: [
+        { role: 'minimize', label: '最小化', accelerator: 'CmdOrCtrl+M' },
+        { role: 'zoom', label: '缩放' },
+        { type: 'separator' },
+        { role: 'close', label: '关闭', accelerator: 'CmdOrCtrl+W' }
+      ]
+    },
+    {
+      label: '帮助',
+      submenu: [
+        {
+          label: '关于',
+          click: (menuItem, window) => showAboutDialog(window)
+        },
+        {
+          label: '检查更新',
+          click: () => { /* 添加检查更新逻辑 */ }
+        },
+        { type: 'separator' },
+        {
+          label: '访问官网',
+          click: async () => {
+            const { shell } = require('electron');
+            await shell.openExternal('https://your-website.com');
+          }
+        }
+      ]
+    }
+  ];
+
+  // 针对 macOS 的特殊处理
+  if (process.platform === 'darwin') {
+    template.unshift({
+      label: app.name,
+      submenu: [
+        { role: 'about', label: '关于' },
+        { type: 'separator' },
+        { role: 'services', label: '服务' },
+        { type: 'separator' },
+        { role: 'hide', label: '隐藏' },
+        { role: 'hideOthers', label: '隐藏其他' },
+        { role: 'unhide', label: '显示全部' },
+        { type: 'separator' },
+        { role: 'quit', label: '退出' }
+      ]
+    });
+  }
+
+  const menu = Menu.buildFromTemplate(template);
+  Menu.setApplicationMenu(menu);
+}
+{% endif %}
+
+// 关于对话框；菜单与页面中的“关于”链接共用
+async function showAboutDialog(window) {
+  const options = {
+    title: '关于',
+    message: {{ product_name|js }},
+    detail: `版本 ${app.getVersion()}\n作者：洛小山\n一个优雅的 Electron 应用示例。`,
+    buttons: ['确定'],
+    type: 'info'
+  };
+  await (window ? dialog.showMessageBox(window, options) : dialog.showMessageBox(options));
+}
+
+{% if not fast_startup %}
+// 按当前配置插入或移除隐藏滚动条的 CSS；操作按顺序执行，连续切换时以最后的配置为准。
+// 页面重新加载后之前插入的 CSS 已失效，此时传入 reloaded 重新插入
+function applyScrollBar(contents, reloaded = false) {
+  const id = contents.id;
+  const previous = scrollBarUpdates.get(id) || Promise.resolve();
+  const next = previous.then(async () => {
+    if (contents.isDestroyed()) return;
+    if (reloaded) scrollBarCssKeys.delete(id);
+    const hide = configService.get().hideScrollBar;
+    const key = scrollBarCssKeys.get(id);
+    if (hide && !key) {
+      scrollBarCssKeys.set(id, await contents.insertCSS(SCROLLBAR_CSS));
+    } else if (!hide && key) {
+      scrollBarCssKeys.delete(id);
+      await contents.removeInsertedCSS(key);
+    }
+  }).catch((error) => console.error('应用滚动条配置失败:', error));
+  scrollBarUpdates.set(id, next);
+  return next;
+}
+{% endif %}
+
+// 标题栏（frame）只能在创建窗口时指定：按新配置在原位置打开新窗口，
+// 渲染完成后再显示并销毁旧窗口；应用进程与主进程中的状态都保持不变
+async function swapWindow(oldWindow) {
+  const started = Date.now();
+  const maximized = oldWindow.isMaximized();
+  const newWindow = await windowManager.open(oldWindow.getNormalBounds());
+  if (maximized && !newWindow.isDestroyed()) newWindow.maximize();
+  if (!oldWindow.isDestroyed()) oldWindow.destroy();
+  return Date.now() - started;
+}
+
+// 替换所有 frame 与当前配置不一致的窗口，并更新备用窗口
+function swapWindowsToConfig() {
+  windowSwap = windowSwap.then(async () => {
+    windowManager.refreshPool();
+    const frame = configService.get().menuBarVisible;
+    const stale = [...windowManager.windows.values()].filter((window) => windowFrames.get(window) !== frame);
+    if (stale.length === 0) return;
+    const times = await Promise.all(stale.map(swapWindow));
+    logApplyLatency('menuBarVisible', Math.max(...times));
+  }).catch((error) => console.error('替换窗口失败:', error));
+  return windowSwap;
+}
+
+{% if fast_startup %}
+// app://bundle/<路径> 映射到应用目录中的文件，不允许访问应用目录之外
+function serveAppFile(request) {
+  const file = path.join(__dirname, decodeURIComponent(new URL(request.url).pathname));
+  if (!file.startsWith(__dirname + path.sep)) {
+    return new Response('Not Found', { status: 404 });
+  }
+  return net.fetch(pathToFileURL(file).toString());
+}
+
+{% endif %}
+// 创建一个隐藏窗口并开始加载页面；由 windowManager 决定何时显示
+function createWindow () {
+{% if startup_trace %}
+  const started = trace.now();
+{% endif %}
+  const config = configService.get();
+
+  const window = new BrowserWindow({
+    width: 800,
+    height: 700,
+    show: false,
+    frame: config.menuBarVisible,
+    resizable: true,
+    autoHideMenuBar: false,
+    webPreferences: {
+      // 页面只能通过 preload.js 暴露的 window.electronAPI 与主进程通信
+      preload: path.join(__dirname, 'preload.js'),
+      additionalArguments: [
+        ipc.preloadArgument(),
+{% if fast_startup %}
+        // 创建时的配置直接传给 preload，页面首次渲染前即可使用，不必等待 getConfig
+        `--app-config=${JSON.stringify(config)}`
+{% endif %}
+      ],
+      nodeIntegration: false,
+      contextIsolation: true,
+      sandbox: true
+    }
+  });
+
+  windowFrames.set(window, config.menuBarVisible);
+  windowReady.set(window, new Promise((resolve) => window.once('ready-to-show', resolve)));
+{% if startup_trace %}
+  // ready-to-show 在页面首次绘制之后触发
+  const traceArgs = { args: { window: window.id } };
+  window.webContents.once('dom-ready', () => trace.mark('dom-ready', traceArgs));
+  window.once('ready-to-show', () => trace.mark('ready-to-show', traceArgs));
+{% endif %}
+
+{% if not fast_startup %}
+  const contentsId = window.webContents.id;
+  window.webContents.once('destroyed', () => {
+    scrollBarCssKeys.delete(contentsId);
+    scrollBarUpdates.delete(contentsId);
+  });
+
+  // 注入自定义菜单样式
+  window.webContents.on('dom-ready', () => {
+    const menuStyle = `
+      .menu-custom {
+        background: #ffffff !important;
+        border: 1px solid #e0e0e0 !important;
+        border-radius: 6px !important;
+        box-shadow: 0 2px 12px rgba(0, 0, 0, 0.1) !important;
+        padding: 5px 0 !important;
+      }
+      
+      .menuitem-custom {
+        padding: 6px 24px !important;
+        color: #333333 !important;
+        font-size: 13px !important;
+        font-family: system-ui, -apple-system, sans-serif !important;
+      }
+      
+      .menuitem-custom:hover {
+        background-color: #f5f5f5 !important;
+        color: #1a73e8 !important;
+      }
+      
+      .menuitem-custom:active {
+        background-color: #e8f0fe !important;
+      }
+      
+      .separator-custom {
+        margin: 5px 0 !important;
+        border-bottom: 1px solid #e0e0e0 !important;
+      }
+      
+      .accelerator-custom {
+        color: #666666 !important;
+        font-size: 12px !important;
+      }
+      
+      .submenu-custom {
+        background: #ffffff !important;
+        border: 1px solid #e0e0e0 !important;
+        border-radius: 6px !important;
+        box-shadow: 2px 2px 12px rgba(0, 0, 0, 0.1) !important;
+      }
+      
+      .menu-custom::-webkit-scrollbar {
+        width: 6px !important;
+        height: 6px !important;
+      }
+      
+      .menu-custom::-webkit-scrollbar-thumb {
+        background: #c1c1c1 !important;
+        border-radius: 3px !important;
+      }
+      
+      .menu-custom::-webkit-scrollbar-track {
+        background: transparent !important;
+      }
+    `;
+    
+    window.webContents.insertCSS(menuStyle);
+    
+    applyScrollBar(window.webContents, true);
+  });
+{% endif %}
+{% if startup_trace %}
+  trace.mark('loadFile', traceArgs);
+{% endif %}
+{% if fast_startup %}
+  // 菜单与滚动条样式都在 static/css/styles.css 中，隐藏滚动条由页面切换 class，不在运行时注入 CSS
+  window.loadURL('app://bundle/index.html');
+{% else %}
+  window.loadFile('index.html');
+{% endif %}
+  window.setMenuBarVisibility(config.menuBarVisible);
+{% if startup_trace %}
+  trace.span('createWindow', started, traceArgs);
+{% endif %}
+  return window;
+}
+
+function logApplyLatency(name, ms) {
+  const saved = coldStartMs === null ? '' : `，比重启应用（冷启动约 ${coldStartMs} ms）少 ${coldStartMs - ms} ms`;
+  console.log(`热应用 ${name} 用时 ${ms} ms${saved}`);
+}
+
+// IPC 处理函数，通道与参数的声明见 ipc-channels.js
+
+// 窗口控制：只作用于发出消息的窗口
+ipc.handle('windowAction', (event, action) => {
+  const win = windowManager.fromEvent(event);
+  if (!win) return;
+  switch (action) {
+    case 'minimize':
+      win.minimize();
+      break;
+    case 'maximize':
+      if (win.isMaximized()) {
+        win.unmaximize();
+      } else {
+        win.maximize();
+      }
+      break;
+    case 'close':
+      win.close();
+      break;
+  }
+});
+
+// 用户请求更改配置，立即生效：滚动条只需切换样式，标题栏变化时替换窗口；
+// 配置不合法时 updateConfig 在页面中以错误结束
+ipc.handle('updateConfig', async (event, changes) => {
+  const before = configService.get();
+  const config = configService.update(changes);
+
+{% if not fast_startup %}
+  if (config.hideScrollBar !== before.hideScrollBar) {
+    const started = Date.now();
+    await Promise.all(BrowserWindow.getAllWindows().map((window) => applyScrollBar(window.webContents)));
+    logApplyLatency('hideScrollBar', Date.now() - started);
+  }
+{% endif %}
+  // 通知所有窗口（包括备用窗口）更新界面
+  for (const window of BrowserWindow.getAllWindows()) {
+    ipc.emit(window.webContents, 'configChanged', config);
+  }
+  if (config.menuBarVisible !== before.menuBarVisible) {
+    // 发起请求的窗口也会被替换，不等待替换完成，新窗口加载后自行读取配置
+    swapWindowsToConfig();
+  }
+  return config;
+});
+
+// 提供给渲染进程获取当前配置的接口
+ipc.handle('getConfig', () => {
+  return configService.get();
+});
+
+ipc.handle('showAbout', (event) => showAboutDialog(windowManager.fromEvent(event)));
+{% if startup_trace %}
+
+// 页面进程中的启动时间点，按页面进程的 pid 放在同一条时间线上
+ipc.handle('traceMark', (event, mark) => {
+  if (typeof mark.name !== 'string' || !Number.isFinite(mark.time) || !Number.isInteger(mark.pid)) return;
+  trace.nameProcess(mark.pid, `renderer (webContents ${event.sender.id})`);
+  trace.mark(mark.name, { pid: mark.pid, time: mark.time });
+});
+{% endif %}
+{% if compute_pool %}
+
+// 计算线程池：耗时的解析、转换、过滤、聚合在工作线程中执行，结果分块返回（compute-pool.js）。
+// 工作线程在第一次提交任务时才创建
+const computePool = lazy(() => require('./compute-pool').createComputePool());
+// 超过这个长度的 JSON 响应交给计算线程池解析，主进程只需分批接收结果
+const COMPUTE_PARSE_MIN_LENGTH = 256 * 1024;
+// 每个页面执行中的计算任务
+const computeJobs = new WeakMap();
+
+// 页面提交到主进程的计算任务，结果的每一批记录通过 computeChunk 事件推送给该页面
+ipc.handle('runCompute', async (event, { jobId, job }) => {
+  const contents = event.sender;
+  const controller = new AbortController();
+  if (!computeJobs.has(contents)) computeJobs.set(contents, new Set());
+  computeJobs.get(contents).add(controller);
+  try {
+    const { total, result } = await computePool().run(job, {
+      signal: controller.signal,
+      onChunk: (records) => ipc.emit(contents, 'computeChunk', { jobId, records })
+    });
+    return { cancelled: false, total, result };
+  } catch (error) {
+    if (!controller.signal.aborted) throw error;
+    return { cancelled: true, total: null, result: null };
+  } finally {
+    computeJobs.get(contents).delete(controller);
+  }
+});
+
+ipc.handle('cancelCompute', (event) => {
+  for (const controller of computeJobs.get(event.sender) || []) controller.abort();
+});
+
+app.on('will-quit', () => {
+  if (computePool.peek()) computePool.peek().destroy();
+});
+{% endif %}
+{% if posts_demo %}
+
+// 网络请求在主进程中完成，页面只拿到数据。接口地址可用 API_BASE_URL 指向本地测试服务，
+// 缓存有效期可用 API_CACHE_TTL（毫秒）调整
+const httpClient = lazy(() => require('./http-client').createHttpClient({
+  baseURL: process.env.API_BASE_URL || 'https://jsonplaceholder.typicode.com',
+  ttl: Number(process.env.API_CACHE_TTL) || 60 * 1000,
+{% if compute_pool %}
+  parse: (text) => (text.length < COMPUTE_PARSE_MIN_LENGTH ? JSON.parse(text)
+    : computePool().run({ input: text, steps: [{ op: 'parse' }] }).then(({ records, result }) => result ?? records))
+{% endif %}
+}));
+
+// 帖子按页加载，每一页到达后立即通过 postsPage 事件推送给发起加载的窗口，首张卡片的出现时间与总数据量无关。
+// 同一窗口开始新的加载或调用 cancelPosts 时，进行中的请求被中止。第一页 POSTS_PAGE_SIZE 条，之后每页翻倍，
+// 最多 POSTS_MAX_PAGE_SIZE 条；页的划分每次都相同，再次启动时请求的 URL 不变，可以按 ETag 校验缓存
+const POSTS_PAGE_SIZE = 20;
+const POSTS_MAX_PAGE_SIZE = 1000;
+// 服务端不支持分页时会返回完整列表，按这个条数分多次推送，页面每次只需处理一小批
+const POSTS_CHUNK_SIZE = 500;
+const postLoads = new WeakMap();
+
+// 加载过的帖子保存在用户数据目录中，下次启动时页面先显示缓存，再在后台重新加载。
+// 缓存格式变化时增加 POSTS_CACHE_SCHEMA，旧文件会被丢弃
+const POSTS_CACHE_SCHEMA = 1;
+const postStore = lazy(() => {
+  const store = require('./record-store').createRecordStore({
+    file: path.join(app.getPath('userData'), 'posts-cache.json'),
+    schemaVersion: POSTS_CACHE_SCHEMA,
+    maxEntries: 10000,
+    maxBytes: 5 * 1024 * 1024
+  });
+  // 立即开始读取缓存文件
+  store.load();
+  return store;
+});
+
+ipc.handle('getCachedPosts', () => postStore().list());
+
+ipc.handle('loadPosts', async (event, { loadId, pageSize = POSTS_PAGE_SIZE, refresh = false }) => {
+  const contents = event.sender;
+  if (postLoads.has(contents)) postLoads.get(contents).abort();
+  const controller = new AbortController();
+  postLoads.set(contents, controller);
+  const fetchPage = (start, limit) => {
+    const pending = httpClient().getPage('/posts', { start, limit, refresh, signal: controller.signal });
+    // 预取的页可能在取消后才失败，不等它时也不产生未处理的 rejection
+    pending.catch(() => {});
+    return pending;
+  };
+  let loaded = 0;
+  let total = null;
+  let changed = 0;
+  const seen = [];
+  try {
+    let limit = pageSize;
+    let pending = fetchPage(0, limit);
+    for (;;) {
+      const page = await pending;
+      const first = loaded;
+      const end = first + page.items.length;
+      // 服务端不支持分页时会返回完整列表，发送完即结束
+      const last = page.items.length !== limit || (page.total !== null && end >= page.total);
+      if (!last) {
+        // 下一页的请求与这一页的合并、推送同时进行
+        limit = Math.min(limit * 2, POSTS_MAX_PAGE_SIZE);
+        pending = fetchPage(end, limit);
+      }
+      changed += (await postStore().merge(page.items, first)).length;
+      for (const post of page.items) seen.push(post.id);
+      if (controller.signal.aborted || contents.isDestroyed()) {
+        controller.abort();
+        break;
+      }
+      loaded = end;
+      total = last ? loaded : page.total;
+      let sent = 0;
+      do {
+        const posts = page.items.slice(sent, sent + POSTS_CHUNK_SIZE);
+        sent += posts.length;
+        ipc.emit(contents, 'postsPage', { loadId, posts, loaded: first + sent, total });
+      } while (sent < page.items.length);
+      if (last) {
+        // 完整加载一遍之后，服务端已经没有的帖子从缓存中删除
+        const removed = await postStore().retain(seen);
+        console.log(`帖子缓存: ${changed} 条新增或变化，${removed.length} 条删除，共 ${postStore().size} 条`);
+        return { cancelled: false, loaded, total };
+      }
+    }
+  } catch (error) {
+    if (!controller.signal.aborted) throw error;
+  } finally {
+    if (postLoads.get(contents) === controller) postLoads.delete(contents);
+  }
+  return { cancelled: true, loaded, total };
+});
+
+ipc.handle('cancelPosts', (event) => {
+  if (postLoads.has(event.sender)) postLoads.get(event.sender).abort();
+});
+
+app.on('will-quit', () => {
+  if (httpClient.peek()) httpClient.peek().destroy();
+});
+{% endif %}
+
+{% if ipc_bench %}
+// IPC 基准测试：IPC_BENCH=1 启动时注册测试通道，页面测完后输出结果并退出
+if (process.env.IPC_BENCH) require('./ipc-bench').register(ipc);
+{% endif %}
+
+for (const name of ipc.unhandled()) console.warn(`IPC 通道 ${name} 已声明但没有处理函数`);
+
+{% if startup_trace %}
+app.whenReady().then(() => trace.mark('app ready'));
+
+{% endif %}
+{% if fast_startup %}
+// 配置文件与 app ready 并行读取
+Promise.all([app.whenReady(), configService.load()]).then(() => {
+  protocol.handle('app', serveAppFile);
+{% if app_menu %}
+  // 菜单在首个窗口显示之后再构建，不占用首次绘制之前的时间
+  windowManager.open().then(() => createMenu());
+{% else %}
+  windowManager.open();
+{% endif %}
+{% else %}
+app.whenReady().then(() => {
+{% if app_menu %}
+  createMenu();
+{% endif %}
+  windowManager.open();
+{% endif %}
+
+  app.on('activate', function () {
+    if (windowManager.windows.size === 0) windowManager.open();
+  });
+});
+
+// 退出前等待延迟中的写入完成
+app.on('before-quit', (event) => {
+  const stores = [configService];
+{% if startup_trace %}
+  stores.push(trace);
+{% endif %}
+{% if posts_demo %}
+  if (postStore.peek()) stores.push(postStore.peek());
+{% endif %}
+  const dirty = stores.filter((store) => store.isDirty());
+  if (dirty.length === 0) return;
+  event.preventDefault();
+  Promise.all(dirty.map((store) => store.flush())).finally(() => app.quit());
+});
+
+app.on('window-all-closed', function () {
+  if (process.platform !== 'darwin') app.quit();
+});
@@ -0,0 +1,139 @@
+// preload.js
+// 通过 contextBridge 向页面暴露一组最小的异步 API（window.electronAPI），类型见 electron-api.d.ts。
+// 页面运行在隔离的上下文中，不能直接访问 Node 与 Electron 模块，也没有任何同步 IPC。
+// 方法按主进程传入的通道表（ipc-channels.js）生成，消息格式见 ipc-router.js
+const { contextBridge, ipcRenderer } = require('electron');
+
+const IPC_CHANNEL = 'ipc:message';
+// 与 ipc-router.js 中的 BATCH_DELAY 一致
+const BATCH_DELAY = 16;
+
+function argValue(prefix) {
+  const arg = process.argv.find((value) => value.startsWith(prefix));
+  return arg ? arg.slice(prefix.length) : null;
+}
+
+const channels = JSON.parse(argValue('--ipc-channels=') || '{}');
+{% if fast_startup %}
+// 主进程创建窗口时通过 additionalArguments 传入的配置
+const configArg = argValue('--app-config=');
+{% endif %}
+{% if posts_demo %}
+// 最近一次 loadPosts 的编号；旧加载在取消前已经发出的页面会被丢弃
+let postLoadSeq = 0;
+{% endif %}
+{% if compute_pool %}
+let nextComputeJobId = 1;
+{% endif %}
+
+// 等待结果的调用：id → { resolve, reject }
+const pendingCalls = new Map();
+// 事件名 → 监听函数集合
+const eventListeners = new Map();
+// 尚未发送的消息；batch 消息等待 BATCH_DELAY 毫秒，其他消息立即连同排队的消息一起发送
+const outbox = [];
+let outboxTimer = null;
+let nextCallId = 1;
+
+function flushOutbox() {
+  clearTimeout(outboxTimer);
+  outboxTimer = null;
+  if (outbox.length > 0) ipcRenderer.send(IPC_CHANNEL, outbox.splice(0));
+}
+
+function post(message, batch) {
+  outbox.push(message);
+  if (!batch) {
+    flushOutbox();
+  } else if (!outboxTimer) {
+    outboxTimer = setTimeout(flushOutbox, BATCH_DELAY);
+  }
+}
+
+ipcRenderer.on(IPC_CHANNEL, (event, messages) => {
+  for (const message of messages) {
+    if (message.event !== undefined) {
+      for (const listener of eventListeners.get(message.event) || []) listener(message.payload);
+      continue;
+    }
+    const call = pendingCalls.get(message.id);
+    if (!call) continue;
+    pendingCalls.delete(message.id);
+    if (message.error !== undefined) {
+      call.reject(new Error(message.error));
+    } else {
+      call.resolve(message.result);
+    }
+  }
+});
+
+// 按通道表生成的方法：invoke 返回 Promise，send 不返回，event 生成 on<Name>(callback) 并返回取消监听的函数。
+// ipc 中是全部方法，exposed 中是直接暴露给页面的部分
+const ipc = {};
+const exposed = {};
+for (const [name, spec] of Object.entries(channels)) {
+  let key = name;
+  if (spec.kind === 'invoke') {
+    ipc[key] = (...args) => new Promise((resolve, reject) => {
+      const id = nextCallId++;
+      pendingCalls.set(id, { resolve, reject });
+      post({ id, name, args }, spec.batch);
+    });
+  } else if (spec.kind === 'send') {
+    ipc[key] = (...args) => post({ name, args }, spec.batch);
+  } else {
+    key = `on${name[0].toUpperCase()}${name.slice(1)}`;
+    ipc[key] = (callback) => {
+      const listener = (payload) => callback(payload);
+      if (!eventListeners.has(name)) eventListeners.set(name, new Set());
+      eventListeners.get(name).add(listener);
+      return () => eventListeners.get(name).delete(listener);
+    };
+  }
+  if (spec.expose !== false) exposed[key] = ipc[key];
+}
+
+{% if startup_trace %}
+// 启动追踪：页面进程的时间点（Unix 纪元毫秒）发送给主进程，与主进程的时间点汇总到同一条时间线
+function traceMark(name, time = performance.timeOrigin + performance.now()) {
+  ipc.traceMark({ name, time, pid: process.pid });
+}
+
+traceMark('process start', process.getCreationTime());
+traceMark('preload');
+window.addEventListener('DOMContentLoaded', () => traceMark('DOMContentLoaded'));
+// first-paint 与 first-contentful-paint
+new PerformanceObserver((list) => {
+  for (const entry of list.getEntries()) traceMark(entry.name, performance.timeOrigin + entry.startTime);
+}).observe({ type: 'paint', buffered: true });
+
+{% endif %}
+contextBridge.exposeInMainWorld('electronAPI', {
+  ...exposed,
+{% if fast_startup %}
+  initialConfig: configArg ? JSON.parse(configArg) : null,
+{% endif %}
+{% if startup_trace %}
+  traceMark: (name) => traceMark(String(name)),
+{% endif %}
+{% if posts_demo %}
+  // 每收到一页调用一次 onPage；开始新的加载会取消旧的，旧加载的 Promise 以 cancelled: true 结束
+  loadPosts: (onPage, options = {}) => {
+    const loadId = ++postLoadSeq;
+    const unsubscribe = ipc.onPostsPage((page) => {
+      if (page.loadId === loadId && loadId === postLoadSeq) onPage(page);
+    });
+    return ipc.loadPosts({ ...options, loadId }).finally(unsubscribe);
+  },
+{% endif %}
+{% if compute_pool %}
+  // 在主进程的计算线程池中执行任务（格式见 static/js/compute-jobs.js），每批结果记录调用一次 onChunk
+  compute: (job, onChunk = () => {}) => {
+    const jobId = nextComputeJobId++;
+    const unsubscribe = ipc.onComputeChunk((chunk) => {
+      if (chunk.jobId === jobId) onChunk(chunk.records);
+    });
+    return ipc.runCompute({ jobId, job }).finally(unsubscribe);
+  },
+{% endif %}
+});
@@ -0,0 +1,148 @@
+{% if posts_demo %}
+// record-store.js
+// 持久化的记录缓存：按 key 保存记录及其在列表中的位置，存放在一个带 schema 版本号的 JSON 文件中。
+// 超出条数或字节上限时从列表末尾开始淘汰，保留启动时首先显示的前面部分；修改合并为一次延迟写入，先写临时文件再 rename。
+// 只依赖 Node 内置模块，可以直接在 Node 中测试
+const fs = require('fs');
+const path = require('path');
+
+function createRecordStore({ file, schemaVersion, keyOf = (record) => record.id, maxEntries = 10000, maxBytes = 5 * 1024 * 1024, writeDelay = 1000 }) {
+  // key → { record, position, bytes }
+  const entries = new Map();
+  let bytes = 0;
+  let loading = null;
+  let timer = null;
+  let writing = null;
+  let pending = false;
+
+  function remove(key) {
+    const entry = entries.get(key);
+    if (!entry) return;
+    entries.delete(key);
+    bytes -= entry.bytes;
+  }
+
+  function put(key, record, position) {
+    remove(key);
+    const entry = { record, position, bytes: Buffer.byteLength(JSON.stringify(record)) };
+    entries.set(key, entry);
+    bytes += entry.bytes;
+  }
+
+  function evict() {
+    if (entries.size <= maxEntries && bytes <= maxBytes) return;
+    const byPosition = [...entries].sort((a, b) => b[1].position - a[1].position);
+    for (const [key] of byPosition) {
+      if (entries.size <= maxEntries && bytes <= maxBytes) break;
+      remove(key);
+    }
+  }
+
+  // 文件不存在、损坏或 schema 版本不一致时从空缓存开始
+  function load() {
+    if (!loading) {
+      loading = fs.promises.readFile(file, 'utf-8')
+        .then((text) => {
+          const data = JSON.parse(text);
+          if (data.schemaVersion !== schemaVersion) {
+            console.log(`缓存版本 ${data.schemaVersion} 与当前版本 ${schemaVersion} 不一致，已丢弃: ${file}`);
+            return;
+          }
+          for (const [key, position, record] of data.entries) put(key, record, position);
+          evict();
+        })
+        .catch((error) => {
+          if (error.code !== 'ENOENT') console.error('读取缓存失败，已忽略:', error.message);
+        });
+    }
+    return loading;
+  }
+
+  // 按位置排序的全部记录
+  async function list() {
+    await load();
+    return [...entries.values()].sort((a, b) => a.position - b.position).map((entry) => entry.record);
+  }
+
+  // 写入从 position 开始的一批记录，返回其中新增或内容变化的记录
+  async function merge(records, position) {
+    await load();
+    const changed = [];
+    records.forEach((record, i) => {
+      const key = keyOf(record);
+      const entry = entries.get(key);
+      if (!entry || JSON.stringify(entry.record) !== JSON.stringify(record)) changed.push(record);
+      put(key, record, position + i);
+    });
+    evict();
+    scheduleWrite();
+    return changed;
+  }
+
+  // 完整加载一遍之后调用：keys 为服务端顺序的全部 key，按它重新编排位置并删除其他记录，返回被删除的 key。
+  // 加载期间服务端在前面插入的记录会让之前合并的位置错开，这里统一修正
+  async function retain(keys) {
+    await load();
+    const positions = new Map();
+    keys.forEach((key, i) => { if (!positions.has(key)) positions.set(key, i); });
+    const removed = [...entries.keys()].filter((key) => !positions.has(key));
+    removed.forEach(remove);
+    let moved = false;
+    for (const [key, entry] of entries) {
+      const position = positions.get(key);
+      if (entry.position !== position) {
+        entry.position = position;
+        moved = true;
+      }
+    }
+    if (removed.length > 0 || moved) scheduleWrite();
+    return removed;
+  }
+
+  function scheduleWrite() {
+    clearTimeout(timer);
+    timer = setTimeout(flush, writeDelay);
+  }
+
+  // 立即写入尚未保存的修改；同一时间只有一个写入，写入期间的新修改在其完成后再写一次
+  function flush() {
+    clearTimeout(timer);
+    timer = null;
+    if (writing) {
+      pending = true;
+    } else {
+      writing = write()
+        .catch((error) => console.error('保存缓存失败:', error))
+        .finally(() => { writing = null; });
+    }
+    return writing;
+  }
+
+  async function write() {
+    const tmpPath = `${file}.${process.pid}.tmp`;
+    await fs.promises.mkdir(path.dirname(file), { recursive: true });
+    do {
+      pending = false;
+      const data = {
+        schemaVersion,
+        entries: [...entries].map(([key, entry]) => [key, entry.position, entry.record])
+      };
+      await fs.promises.writeFile(tmpPath, JSON.stringify(data), 'utf-8');
+      await fs.promises.rename(tmpPath, file);
+    } while (pending);
+  }
+
+  return {
+    load,
+    list,
+    merge,
+    retain,
+    flush,
+    isDirty: () => timer !== null || writing !== null,
+    get size() { return entries.size; },
+    get bytes() { return bytes; }
+  };
+}
+
+module.exports = { createRecordStore };
+{% endif %}
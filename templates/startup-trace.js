@@ -0,0 +1,62 @@
+{% if startup_trace %}
+// startup-trace.js
+// 启动追踪：主进程与各页面进程的时间点汇总到同一条时间线，写成 Chrome trace event 格式的 JSON，
+// 可以在 chrome://tracing 或 https://ui.perfetto.dev 中打开。
+// 所有进程的时间都取 Unix 纪元毫秒（performance.timeOrigin + performance.now()），可以直接比较
+const fs = require('fs');
+const path = require('path');
+
+function createStartupTrace(file) {
+  const events = [];
+  // pid → 进程名，写入时生成 process_name 元数据
+  const processNames = new Map([[process.pid, 'main']]);
+  let written = 0;
+  let writing = Promise.resolve();
+
+  function now() {
+    return performance.timeOrigin + performance.now();
+  }
+
+  // 时间点（instant event），time 为 Unix 纪元毫秒
+  function mark(name, { pid = process.pid, time = now(), args } = {}) {
+    events.push({ name, cat: 'startup', ph: 'i', s: 'p', pid, tid: pid, ts: Math.round(time * 1000), args });
+  }
+
+  // 区间（complete event），从 start 到现在
+  function span(name, start, { pid = process.pid, args } = {}) {
+    const end = now();
+    events.push({
+      name, cat: 'startup', ph: 'X', pid, tid: pid,
+      ts: Math.round(start * 1000), dur: Math.round((end - start) * 1000), args
+    });
+  }
+
+  function nameProcess(pid, name) {
+    processNames.set(pid, name);
+  }
+
+  function isDirty() {
+    return events.length > written;
+  }
+
+  // 写入目前为止的全部事件；先写临时文件再 rename
+  function flush() {
+    writing = writing.then(async () => {
+      if (!isDirty()) return;
+      const count = events.length;
+      const metadata = [...processNames].map(([pid, name]) => ({ name: 'process_name', ph: 'M', pid, tid: pid, args: { name } }));
+      const tmpPath = `${file}.${process.pid}.tmp`;
+      await fs.promises.mkdir(path.dirname(file), { recursive: true });
+      await fs.promises.writeFile(tmpPath, JSON.stringify({ traceEvents: [...metadata, ...events.slice(0, count)] }), 'utf-8');
+      await fs.promises.rename(tmpPath, file);
+      if (written === 0) console.log(`启动追踪已写入: ${file}`);
+      written = count;
+    }).catch((error) => console.error('写入启动追踪失败:', error));
+    return writing;
+  }
+
+  return { file, now, mark, span, nameProcess, isDirty, flush };
+}
+
+module.exports = { createStartupTrace };
+{% endif %}
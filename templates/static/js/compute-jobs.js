@@ -0,0 +1,112 @@
+{% if compute_pool %}
+// compute-jobs.js
+// 后台计算任务的实现，页面的 Web Worker（compute-worker.js）与主进程的计算线程池（../../compute-worker.js）共用。
+// 任务为 { input, steps }：input 是 JSON 文本、Blob（例如用户选择的文件）或记录数组，steps 依次执行：
+//   { op: 'parse' }                          JSON 文本 → 记录数组；结果不是数组时作为整体返回，不能再有后续步骤
+//   { op: 'transform', fields, maxLength }   只保留 fields 中的字段，超过 maxLength 的字符串被截断
+//   { op: 'filter', query, fields }          保留 fields（默认全部字段）中任一字段包含 query 的记录，不区分大小写
+//   { op: 'aggregate', groupBy, sum }        按 groupBy 分组计数，指定 sum 时同时对该字段求和；只能是最后一步
+// 结果的记录每 CHUNK_SIZE 条发送一次，接收方不必等待全部完成，每条消息的反序列化也不会占用太久
+(function (root) {
+    const CHUNK_SIZE = 500;
+    const STEPS = ['parse', 'transform', 'filter', 'aggregate'];
+
+    function parse(input) {
+        if (typeof input !== 'string') throw new TypeError('parse 需要 JSON 文本');
+        return JSON.parse(input);
+    }
+
+    function* transform(records, { fields, maxLength = Infinity }) {
+        for (const record of records) {
+            const result = {};
+            for (const field of fields || Object.keys(record)) {
+                const value = record[field];
+                result[field] = typeof value === 'string' && value.length > maxLength ? value.slice(0, maxLength) : value;
+            }
+            yield result;
+        }
+    }
+
+    function* filter(records, { query = '', fields }) {
+        const needle = String(query).toLowerCase();
+        for (const record of records) {
+            const keys = fields || Object.keys(record);
+            if (keys.some((field) => String(record[field] ?? '').toLowerCase().includes(needle))) yield record;
+        }
+    }
+
+    function aggregate(records, { groupBy, sum }) {
+        const groups = new Map();
+        for (const record of records) {
+            const key = record[groupBy];
+            let group = groups.get(key);
+            if (!group) {
+                group = sum ? { key, count: 0, sum: 0 } : { key, count: 0 };
+                groups.set(key, group);
+            }
+            group.count++;
+            if (sum) group.sum += Number(record[sum]) || 0;
+        }
+        return [...groups.values()];
+    }
+
+    // 执行一个任务：每批记录调用一次 post({ chunk })，最后 post({ done: true, total, result })，
+    // result 是 aggregate 的分组或 parse 得到的非数组值，否则为 null；出错时 post({ error })
+    async function execute(job, post, chunkSize = CHUNK_SIZE) {
+        try {
+            let records = job.input;
+            if (typeof Blob !== 'undefined' && records instanceof Blob) records = await records.text();
+            let result = null;
+            for (const step of job.steps || []) {
+                if (!STEPS.includes(step.op)) throw new Error(`未知的计算步骤: ${step.op}`);
+                if (result !== null) throw new Error(`${step.op} 之前的步骤已经得到最终结果`);
+                if (step.op !== 'parse' && typeof records === 'string') throw new TypeError('输入是文本时第一步必须是 parse');
+                switch (step.op) {
+                    case 'parse':
+                        records = parse(records);
+                        if (!Array.isArray(records)) result = records;
+                        break;
+                    case 'transform':
+                        records = transform(records, step);
+                        break;
+                    case 'filter':
+                        records = filter(records, step);
+                        break;
+                    case 'aggregate':
+                        result = aggregate(records, step);
+                        break;
+                }
+            }
+            if (typeof records === 'string') throw new TypeError('输入是文本时第一步必须是 parse');
+            let total = 0;
+            if (result === null) {
+                let chunk = [];
+                for (const record of records) {
+                    chunk.push(record);
+                    if (chunk.length >= chunkSize) {
+                        post({ chunk });
+                        total += chunk.length;
+                        chunk = [];
+                    }
+                }
+                if (chunk.length > 0) {
+                    post({ chunk });
+                    total += chunk.length;
+                }
+            } else if (Array.isArray(result)) {
+                total = result.reduce((count, group) => count + group.count, 0);
+            }
+            post({ done: true, total, result });
+        } catch (error) {
+            post({ error: error.message });
+        }
+    }
+
+    const api = { execute, CHUNK_SIZE };
+    if (typeof module === 'object' && module.exports) {
+        module.exports = api;
+    } else {
+        root.computeJobs = api;
+    }
+})(typeof self !== 'undefined' ? self : this);
+{% endif %}
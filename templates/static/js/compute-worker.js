@@ -0,0 +1,9 @@
+{% if compute_pool %}
+// compute-worker.js
+// 页面的计算 Worker，由 renderer.js 中的 computeService 创建；任务格式见 compute-jobs.js
+importScripts('compute-jobs.js');
+
+self.onmessage = ({ data: { id, job } }) => {
+    self.computeJobs.execute(job, (message) => self.postMessage({ id, ...message }));
+};
+{% endif %}
@@ -0,0 +1,69 @@
+{% if ipc_bench %}
+// ipc-bench.js
+// IPC 基准测试的页面部分，只在主进程设置了 IPC_BENCH 时由 renderer.js 加载。
+// 对每种负载大小测量 invoke 的往返延迟，以及连续调用与 send 的每秒消息数（分别不合并与合并发送），
+// 结果交给主进程输出（见 ipc-bench.js）
+(async () => {
+    const api = window.electronAPI;
+    const PAYLOAD_SIZES = [64, 1024, 16 * 1024, 256 * 1024];
+    const LATENCY_ROUNDS = 200;
+    // 每种负载大小的消息数，数据总量约为 THROUGHPUT_BYTES，但不少于 100 条
+    const THROUGHPUT_MESSAGES = 5000;
+    const THROUGHPUT_BYTES = 64 * 1024 * 1024;
+
+    function percentile(sorted, p) {
+        return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+    }
+
+    // 逐个等待结果，测量单次往返
+    async function measureLatency(echo, payload) {
+        const samples = [];
+        for (let i = 0; i < LATENCY_ROUNDS; i++) {
+            const started = performance.now();
+            await echo(payload);
+            samples.push(performance.now() - started);
+        }
+        samples.sort((a, b) => a - b);
+        return {
+            p50: percentile(samples, 0.5),
+            p95: percentile(samples, 0.95),
+            mean: samples.reduce((sum, value) => sum + value, 0) / samples.length
+        };
+    }
+
+    // 一次发出 count 条消息，等到全部到达（send）或全部返回（invoke），返回每秒消息数
+    async function measureThroughput(send, payload, count, awaitAll) {
+        await api.benchCount();
+        const started = performance.now();
+        const calls = [];
+        for (let i = 0; i < count; i++) calls.push(send(payload));
+        if (awaitAll) await Promise.all(calls);
+        const received = await api.benchCount();
+        if (!awaitAll && received !== count) throw new Error(`只收到 ${received} / ${count} 条消息`);
+        return count / ((performance.now() - started) / 1000);
+    }
+
+    const results = [];
+    try {
+        for (const size of PAYLOAD_SIZES) {
+            const payload = 'x'.repeat(size);
+            const count = Math.max(100, Math.min(THROUGHPUT_MESSAGES, Math.floor(THROUGHPUT_BYTES / size)));
+            results.push({
+                size,
+                messages: count,
+                latency: await measureLatency(api.benchEcho, payload),
+                latencyBatched: await measureLatency(api.benchEchoBatched, payload),
+                perSecond: {
+                    invoke: await measureThroughput(api.benchEcho, payload, count, true),
+                    invokeBatched: await measureThroughput(api.benchEchoBatched, payload, count, true),
+                    send: await measureThroughput(api.benchSink, payload, count, false),
+                    sendBatched: await measureThroughput(api.benchSinkBatched, payload, count, false)
+                }
+            });
+        }
+        await api.benchReport({ results });
+    } catch (error) {
+        await api.benchReport({ results, error: error.message });
+    }
+})();
+{% endif %}
@@ -0,0 +1,492 @@
+// renderer.js
+// 页面运行在隔离的上下文中，所有主进程功能都通过 preload.js 暴露的 window.electronAPI 调用
+const api = window.electronAPI;
+
+let currentConfig = {};
+
+{% if compute_pool %}
+// 后台计算：任务（格式见 compute-jobs.js）默认在页面的 Web Worker 中执行；target 为 'main' 时交给主进程的
+// 计算线程池，适合输入是文本或记录数组、结果较小的任务（File/Blob 只能交给 Worker）。
+// 结果的记录分批传给 onChunk，页面线程只负责显示。两种方式都返回 { cancelled, total, result }
+const computeService = {
+    worker: null,
+    // 任务 id → { onChunk, resolve, reject }
+    jobs: new Map(),
+    nextId: 1,
+
+    run(job, { onChunk = () => {}, target = 'worker' } = {}) {
+        if (target === 'main') return api.compute(job, onChunk);
+        if (!this.worker) this.startWorker();
+        const id = this.nextId++;
+        return new Promise((resolve, reject) => {
+            this.jobs.set(id, { onChunk, resolve, reject });
+            this.worker.postMessage({ id, job });
+        });
+    },
+
+    startWorker() {
+        this.worker = new Worker('static/js/compute-worker.js');
+        this.worker.onmessage = ({ data }) => {
+            const job = this.jobs.get(data.id);
+            if (!job) return;
+            if (data.chunk) {
+                job.onChunk(data.chunk);
+                return;
+            }
+            this.jobs.delete(data.id);
+            if (data.error !== undefined) {
+                job.reject(new Error(data.error));
+            } else {
+                job.resolve({ cancelled: false, total: data.total, result: data.result });
+            }
+        };
+        this.worker.onerror = (event) => {
+            event.preventDefault();
+            this.stop(new Error(`计算 Worker 出错: ${event.message}`));
+        };
+    },
+
+    // 结束 Worker，其中所有的任务以 outcome 结束（Error 时 reject）；下次提交任务时重新创建
+    stop(outcome) {
+        if (this.worker) this.worker.terminate();
+        this.worker = null;
+        for (const job of this.jobs.values()) {
+            if (outcome instanceof Error) {
+                job.reject(outcome);
+            } else {
+                job.resolve(outcome);
+            }
+        }
+        this.jobs.clear();
+    },
+
+    // 取消 Worker 与主进程中进行中的任务，它们以 cancelled: true 结束
+    cancel() {
+        this.stop({ cancelled: true, total: null, result: null });
+        return api.cancelCompute();
+    }
+};
+
+{% endif %}
+{% if posts_demo %}
+// 创建一个 API 服务模块；请求由主进程发出
+const apiService = {
+    // 分页加载，每收到一页调用一次 onPage；开始新的加载会取消旧的
+    async loadPosts(onPage) {
+        try {
+            return await api.loadPosts(onPage);
+        } catch (error) {
+            console.error('获取数据时出错:', error);
+            throw error;
+        }
+    },
+
+    cancelPosts() {
+        return api.cancelPosts();
+    },
+
+    async getCachedPosts() {
+        try {
+            return await api.getCachedPosts();
+        } catch (error) {
+            console.error('读取缓存时出错:', error);
+            return [];
+        }
+    }
+};
+
+// 帖子列表：数量不多时每帧插入一批卡片；超过阈值时改为虚拟列表，只渲染可见区域内的卡片并复用节点。
+// 入场动画只用于渲染时位于可见区域内的卡片
+const POSTS_BATCH_SIZE = 50;
+const POSTS_VIRTUALIZE_THRESHOLD = 500;
+// 虚拟列表中每张卡片占用的高度（含间距），与 .posts-virtual .post-card 的样式一致
+const POST_ROW_HEIGHT = 140;
+const POSTS_OVERSCAN = 5;
+
+function createPostCard() {
+    const card = document.createElement('div');
+    card.className = 'post-card';
+    card.append(document.createElement('h3'), document.createElement('p'));
+    card.addEventListener('animationend', () => card.classList.remove('post-enter'));
+    return card;
+}
+
+function fillPostCard(card, post) {
+    // 使用 textContent，标题和正文中的 HTML 按原样显示，不会被解析
+    card.firstChild.textContent = post.title;
+    card.lastChild.textContent = post.body;
+}
+
+function playEntrance(card, order) {
+    card.style.animationDelay = `${Math.min(order, 10) * 30}ms`;
+    card.classList.add('post-enter');
+}
+
+const postList = {
+    container: null,
+    posts: [],
+    // 帖子 id → 在 posts 中的下标
+    index: new Map(),
+    // 批量模式下已插入的条数
+    rendered: 0,
+    // 批量模式下是否仍在可见区域内，决定新卡片是否播放入场动画
+    animate: true,
+    // 虚拟列表状态 { visible: Map<下标, 卡片>, fresh }；批量模式下为 null
+    virtual: null,
+    frame: null,
+    onScroll: null,
+
+    // 清空列表，之后用 append() 逐页加入数据
+    reset(container) {
+        this.clear();
+        this.container = container;
+        this.posts = [];
+        this.index = new Map();
+        this.rendered = 0;
+        this.animate = true;
+    },
+
+    append(posts) {
+        for (const post of posts) {
+            this.index.set(post.id, this.posts.length);
+            this.posts.push(post);
+        }
+        if (!this.virtual && this.posts.length > POSTS_VIRTUALIZE_THRESHOLD) this.startVirtual();
+        if (this.virtual) this.container.style.height = `${this.posts.length * POST_ROW_HEIGHT}px`;
+        this.schedule();
+    },
+
+    // 按 id 合并一批帖子：内容变化的只更新对应的卡片，新的追加到末尾
+    upsert(posts) {
+        const added = [];
+        for (const post of posts) {
+            const i = this.index.get(post.id);
+            if (i === undefined) {
+                added.push(post);
+            } else if (JSON.stringify(this.posts[i]) !== JSON.stringify(post)) {
+                this.posts[i] = post;
+                const card = this.virtual ? this.virtual.visible.get(i)
+                    : (i < this.rendered ? this.container.children[i] : null);
+                if (card) fillPostCard(card, post);
+            }
+        }
+        if (added.length > 0) this.append(added);
+    },
+
+    // 完整加载一遍之后调用：ids 为服务端顺序的全部 id，按它重新排列并删除其他帖子。
+    // upsert 把新帖子追加在末尾，服务端插在前面的帖子在这里回到正确位置；顺序有变化时不带动画重新渲染
+    retain(ids) {
+        const posts = [];
+        for (const id of new Set(ids)) {
+            const i = this.index.get(id);
+            if (i !== undefined) posts.push(this.posts[i]);
+        }
+        if (posts.length === this.posts.length && posts.every((post, i) => post === this.posts[i])) return;
+        this.reset(this.container);
+        this.animate = false;
+        this.append(posts);
+    },
+
+    clear() {
+        cancelAnimationFrame(this.frame);
+        this.frame = null;
+        this.virtual = null;
+        if (this.onScroll) {
+            window.removeEventListener('scroll', this.onScroll);
+            window.removeEventListener('resize', this.onScroll);
+            this.onScroll = null;
+        }
+        if (this.container) {
+            this.container.replaceChildren();
+            this.container.classList.remove('posts-virtual');
+            this.container.style.height = '';
+        }
+    },
+
+    schedule() {
+        if (this.frame !== null) return;
+        this.frame = requestAnimationFrame(() => {
+            this.frame = null;
+            if (this.virtual) {
+                this.updateVirtual();
+            } else {
+                this.renderBatch();
+            }
+        });
+    },
+
+    // 每帧用一个 DocumentFragment 插入一批卡片，收到数据时本身不触发布局
+    renderBatch() {
+        const fragment = document.createDocumentFragment();
+        const end = Math.min(this.rendered + POSTS_BATCH_SIZE, this.posts.length);
+        for (; this.rendered < end; this.rendered++) {
+            const card = createPostCard();
+            fillPostCard(card, this.posts[this.rendered]);
+            if (this.animate) playEntrance(card, this.rendered);
+            fragment.appendChild(card);
+        }
+        this.container.appendChild(fragment);
+        // 每批只读取一次布局：这一批已经超出可见区域，之后的卡片不再播放动画
+        if (this.animate && this.container.lastChild
+            && this.container.lastChild.getBoundingClientRect().top > window.innerHeight) {
+            this.animate = false;
+        }
+        if (this.rendered < this.posts.length) this.schedule();
+    },
+
+    // 容器高度按总数撑开，卡片绝对定位；滚动时回收离开可见区域的卡片，填入新进入的数据。
+    // 已经以批量模式显示过卡片时，切换后不再重复播放动画
+    startVirtual() {
+        this.virtual = { visible: new Map(), fresh: true };
+        this.onScroll = () => this.schedule();
+        window.addEventListener('scroll', this.onScroll, { passive: true });
+        window.addEventListener('resize', this.onScroll);
+    },
+
+    updateVirtual() {
+        const { container, posts, virtual } = this;
+        if (virtual.fresh) {
+            // 在同一帧内替换批量模式插入的卡片，避免闪烁
+            container.replaceChildren();
+            container.classList.add('posts-virtual');
+        }
+        const top = container.getBoundingClientRect().top;
+        const firstVisible = Math.max(0, Math.floor(-top / POST_ROW_HEIGHT));
+        const lastVisible = Math.min(posts.length, Math.ceil((window.innerHeight - top) / POST_ROW_HEIGHT));
+        const first = Math.max(0, firstVisible - POSTS_OVERSCAN);
+        const last = Math.min(posts.length, lastVisible + POSTS_OVERSCAN);
+        const animate = virtual.fresh && this.animate && this.rendered === 0;
+
+        const free = [];
+        for (const [i, card] of virtual.visible) {
+            if (i < first || i >= last) {
+                virtual.visible.delete(i);
+                free.push(card);
+            }
+        }
+        const fragment = document.createDocumentFragment();
+        for (let i = first; i < last; i++) {
+            if (virtual.visible.has(i)) continue;
+            let card = free.pop();
+            if (card) {
+                card.classList.remove('post-enter');
+            } else {
+                card = createPostCard();
+                fragment.appendChild(card);
+            }
+            fillPostCard(card, posts[i]);
+            card.style.top = `${i * POST_ROW_HEIGHT}px`;
+            if (animate && i >= firstVisible && i < lastVisible) playEntrance(card, i - firstVisible);
+            virtual.visible.set(i, card);
+        }
+        for (const card of free) card.remove();
+        container.appendChild(fragment);
+        virtual.fresh = false;
+    }
+};
+{% endif %}
+
+// 初始化时获取配置并根据配置更新页面
+async function loadConfig() {
+    currentConfig = await api.getConfig();
+    updateUIFromConfig();
+{% if startup_trace %}
+    api.traceMark('loadConfig');
+{% endif %}
+}
+
+function updateUIFromConfig() {
+    const body = document.body;
+    const titleBar = document.querySelector('.title-bar');
+    
+    // 控制自定义标题栏显示
+    if (currentConfig.menuBarVisible) {
+        titleBar.style.display = 'none';  // 系统标题栏显示时，隐藏自定义标题栏
+        body.style.paddingTop = '0';
+        document.getElementById('btn-toggle-menu-bar').textContent = '显示自定义标题栏';
+    } else {
+        titleBar.style.display = 'flex';  // 系统标题栏隐藏时，显示自定义标题栏
+        body.style.paddingTop = '32px';
+        document.getElementById('btn-toggle-menu-bar').textContent = '显示系统标题栏';
+    }
+
+    // hideScrollBar
+    if (currentConfig.hideScrollBar) {
+        body.classList.add('no-scrollbar');
+        document.getElementById('btn-toggle-scrollbar').textContent = '显示滚动条';
+    } else {
+        body.classList.remove('no-scrollbar');
+        document.getElementById('btn-toggle-scrollbar').textContent = '隐藏滚动条';
+    }
+}
+
+// 事件监听
+document.getElementById('btn-minimize').addEventListener('click', () => {
+    api.windowAction('minimize');
+});
+document.getElementById('btn-maximize').addEventListener('click', () => {
+    api.windowAction('maximize');
+});
+document.getElementById('btn-close').addEventListener('click', () => {
+    api.windowAction('close');
+});
+
+// 切换 menuBarVisible 设置
+document.getElementById('btn-toggle-menu-bar').addEventListener('click', () => {
+    currentConfig.menuBarVisible = !currentConfig.menuBarVisible;
+    requestConfigUpdate();
+});
+
+// 切换 hideScrollBar 设置
+document.getElementById('btn-toggle-scrollbar').addEventListener('click', () => {
+    currentConfig.hideScrollBar = !currentConfig.hideScrollBar;
+    requestConfigUpdate();
+});
+
+// 其他窗口修改配置后，主进程会通知所有窗口
+api.onConfigChanged((config) => {
+    currentConfig = config;
+    updateUIFromConfig();
+});
+
+async function requestConfigUpdate() {
+    // 更新配置并立即生效；主进程校验后返回实际保存的配置
+    try {
+        currentConfig = await api.updateConfig(currentConfig);
+    } catch (error) {
+        console.error('更新配置失败:', error);
+        currentConfig = await api.getConfig();
+    }
+    updateUIFromConfig();
+}
+
+document.getElementById('nav-about').addEventListener('click', async (e) => {
+    e.preventDefault();
+    await api.showAbout();
+});
+
+{% if posts_demo %}
+// 在当前列表上重新加载：每一页到达后立即合并，只有变化的卡片会更新；再次调用会取消进行中的加载
+let postsLoadSeq = 0;
+async function refreshPosts() {
+    const load = ++postsLoadSeq;
+    const progress = document.getElementById('posts-progress');
+    const cancelButton = document.getElementById('btn-cancel-fetch');
+    const cached = postList.posts.length;
+    progress.textContent = cached > 0 ? `正在更新 ${cached} 条帖子…` : '正在加载…';
+    cancelButton.disabled = false;
+    const seen = [];
+    try {
+        const result = await apiService.loadPosts(({ posts, loaded, total }) => {
+            // 加载被导入等操作取代之后，取消前已在途的页面不再合并
+            if (load !== postsLoadSeq) return;
+            for (const post of posts) seen.push(post.id);
+            postList.upsert(posts);
+            progress.textContent = total === null ? `已加载 ${loaded} 条` : `已加载 ${loaded} / ${total} 条`;
+        });
+        // 被新的加载取消时，进度和按钮状态由新的加载负责
+        if (load !== postsLoadSeq) return;
+        // 完整加载一遍之后，按服务端顺序重新排列，并删除服务端已经没有的帖子
+        if (!result.cancelled) postList.retain(seen);
+        progress.textContent = result.cancelled ? `已取消，共加载 ${result.loaded} 条` : `共 ${result.loaded} 条`;
+    } catch (error) {
+        if (load !== postsLoadSeq) return;
+        if (cached > 0) {
+            // 离线或服务不可用时继续显示缓存
+            progress.textContent = `无法连接服务器，显示的是缓存的 ${cached} 条帖子`;
+        } else {
+            // 处理错误
+            progress.textContent = '';
+            alert('无法获取数据，请稍后再试。');
+        }
+    }
+    cancelButton.disabled = true;
+}
+
+// 启动时先显示上次缓存的帖子，不等待网络，再在后台重新加载
+async function initPosts() {
+    postList.reset(document.getElementById('posts-container'));
+    postList.append(await apiService.getCachedPosts());
+    refreshPosts();
+}
+
+document.getElementById('btn-fetch-data').addEventListener('click', refreshPosts);
+
+document.getElementById('btn-cancel-fetch').addEventListener('click', () => {
+    apiService.cancelPosts();
+{% if compute_pool %}
+    computeService.cancel();
+{% endif %}
+});
+{% if compute_pool %}
+
+// 从本地 JSON 文件导入帖子，替换当前列表：文件交给 Worker 读取、解析并整理字段，
+// 页面线程只接收分批的结果，几十 MB 的文件也不会卡住界面。导入的帖子不写入缓存
+async function importPosts(file) {
+    const load = ++postsLoadSeq;
+    apiService.cancelPosts();
+    const progress = document.getElementById('posts-progress');
+    const cancelButton = document.getElementById('btn-cancel-fetch');
+    progress.textContent = `正在导入 ${file.name}…`;
+    cancelButton.disabled = false;
+    postList.reset(postList.container);
+    const authors = new Set();
+    try {
+        const result = await computeService.run({
+            input: file,
+            steps: [{ op: 'parse' }, { op: 'transform', fields: ['userId', 'id', 'title', 'body'] }]
+        }, {
+            onChunk: (posts) => {
+                if (load !== postsLoadSeq) return;
+                for (const post of posts) authors.add(post.userId);
+                postList.append(posts);
+                progress.textContent = `已导入 ${postList.posts.length} 条`;
+            }
+        });
+        if (load !== postsLoadSeq) return;
+        progress.textContent = result.cancelled ? `已取消，共导入 ${postList.posts.length} 条`
+            : `共导入 ${result.total} 条，来自 ${authors.size} 位作者`;
+    } catch (error) {
+        if (load !== postsLoadSeq) return;
+        progress.textContent = `导入失败: ${error.message}`;
+    }
+    cancelButton.disabled = true;
+}
+
+document.getElementById('btn-import-posts').addEventListener('click', () => {
+    document.getElementById('posts-import').click();
+});
+
+document.getElementById('posts-import').addEventListener('change', (event) => {
+    const [file] = event.target.files;
+    // 清空选择，再次选择同一个文件时也会触发 change
+    event.target.value = '';
+    if (file) importPosts(file);
+});
+{% endif %}
+{% endif %}
+
+// 初始化配置
+{% if fast_startup %}
+// 先按创建窗口时的配置更新界面，不等待 IPC；再读取一次，以防页面重新加载后配置已变化
+if (api.initialConfig) {
+    currentConfig = api.initialConfig;
+    updateUIFromConfig();
+{% if startup_trace %}
+    api.traceMark('initialConfig');
+{% endif %}
+}
+{% endif %}
+loadConfig();
+{% if posts_demo %}
+initPosts();
+{% endif %}
+
+{% if ipc_bench %}
+// IPC 基准测试模式（主进程设置了 IPC_BENCH，见 ipc-bench.js）
+if (api.benchEcho) {
+    const script = document.createElement('script');
+    script.src = 'static/js/ipc-bench.js';
+    document.head.appendChild(script);
+}
+{% endif %}
@@ -0,0 +1,173 @@
+# http-client.js 测试：渲染模板后用 node 运行，请求本地的 http.server 桩服务
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import create_electron_project as scaffold  # noqa: E402
+
+# 依次运行各个场景，把客户端的统计与结果以 JSON 输出，由 Python 端断言
+SCENARIOS_JS = r'''
+const { createHttpClient } = require(process.argv[2]);
+const baseURL = process.argv[3];
+
+async function settle(promise) {
+  try {
+    return { value: await promise };
+  } catch (error) {
+    return { error: error.name };
+  }
+}
+
+async function main() {
+  const out = {};
+
+  let client = createHttpClient({ baseURL });
+  await client.get('/items/ttl');
+  await client.get('/items/ttl');
+  out.ttl = { ...client.stats };
+  client.destroy();
+
+  // ttl 为 0 时每次都过期，第二次请求带 If-None-Match，服务端返回 304
+  client = createHttpClient({ baseURL, ttl: 0 });
+  const first = await client.get('/items/etag');
+  const second = await client.get('/items/etag');
+  out.revalidate = { stats: { ...client.stats }, same: JSON.stringify(first) === JSON.stringify(second) };
+  client.destroy();
+
+  // 填满 200 项后再次使用第 0 项，第 200 项加入时淘汰最久未使用的第 1 项
+  client = createHttpClient({ baseURL });
+  for (let i = 0; i < 200; i++) await client.get(`/items/lru-${i}`);
+  await client.get('/items/lru-0');
+  await client.get('/items/lru-200');
+  const evicted = client.stats.evicted;
+  const requests = client.stats.requests;
+  await client.get('/items/lru-0');
+  const keptIsCached = client.stats.requests === requests;
+  await client.get('/items/lru-1');
+  out.eviction = { evicted, keptIsCached, evictedIsFetched: client.stats.requests === requests + 1 };
+  client.destroy();
+
+  client = createHttpClient({ baseURL });
+  const shared = await Promise.all([client.get('/slow/shared'), client.get('/slow/shared')]);
+  out.dedupe = { stats: { ...client.stats }, same: shared[0] === shared[1] };
+  client.destroy();
+
+  // 两个调用方共享一次请求，其中一个取消后另一个仍能拿到响应
+  client = createHttpClient({ baseURL });
+  const aborting = new AbortController();
+  const staying = new AbortController();
+  const results = Promise.all([
+    settle(client.get('/slow/abort', { signal: aborting.signal })),
+    settle(client.get('/slow/abort', { signal: staying.signal }))
+  ]);
+  setTimeout(() => aborting.abort(), 50);
+  const [aborted, completed] = await results;
+  out.abort = { aborted, completed, stats: { ...client.stats } };
+  client.destroy();
+
+  process.stdout.write(JSON.stringify(out));
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
+'''
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 才能保持连接；/slow/ 下的路径延迟响应，用于测试并发合并与取消
+    protocol_version = 'HTTP/1.1'
+    # 响应头与响应体分开写出，保持连接时不关闭 Nagle 算法每个请求会多等一次延迟 ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        etag = f'"{self.path}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.server.log.append((self.path, 304))
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        if self.path.startswith('/slow/'):
+            time.sleep(0.3)
+        body = json.dumps({"path": self.path}).encode('utf-8')
+        self.server.log.append((self.path, 200))
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@unittest.skipUnless(shutil.which('node'), "需要 node")
+class HttpClientTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = Path(tempfile.mkdtemp(prefix='http-client-test-'))
+        source = scaffold.load_templates()['http-client.js'](scaffold.template_context())
+        (cls.tmp / 'http-client.js').write_text(source, encoding='utf-8')
+        (cls.tmp / 'scenarios.js').write_text(SCENARIOS_JS, encoding='utf-8')
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        server.daemon_threads = True
+        server.log = []
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            result = subprocess.run(['node', str(cls.tmp / 'scenarios.js'), str(cls.tmp / 'http-client.js'),
+                                     f"http://127.0.0.1:{server.server_port}"],
+                                    capture_output=True, text=True, timeout=60)
+        finally:
+            server.shutdown()
+            server.server_close()
+            shutil.rmtree(cls.tmp, ignore_errors=True)
+        if result.returncode != 0:
+            raise AssertionError(f"node 运行失败:\n{result.stderr}")
+        cls.out = json.loads(result.stdout)
+        cls.log = server.log
+
+    def requests_for(self, path):
+        return [status for logged, status in self.log if logged == path]
+
+    def test_fresh_entry_is_served_from_cache(self):
+        self.assertEqual(self.out['ttl']['requests'], 1)
+        self.assertEqual(self.out['ttl']['cacheHits'], 1)
+        self.assertEqual(self.requests_for('/items/ttl'), [200])
+
+    def test_expired_entry_is_revalidated_with_etag(self):
+        self.assertEqual(self.out['revalidate']['stats']['revalidated'], 1)
+        self.assertTrue(self.out['revalidate']['same'])
+        self.assertEqual(self.requests_for('/items/etag'), [200, 304])
+
+    def test_least_recently_used_entry_is_evicted_at_limit(self):
+        self.assertEqual(self.out['eviction'], {"evicted": 1, "keptIsCached": True, "evictedIsFetched": True})
+        self.assertEqual(self.requests_for('/items/lru-1'), [200, 200])
+
+    def test_concurrent_callers_share_one_request(self):
+        self.assertEqual(self.out['dedupe']['stats']['requests'], 1)
+        self.assertEqual(self.out['dedupe']['stats']['deduped'], 1)
+        self.assertTrue(self.out['dedupe']['same'])
+        self.assertEqual(self.requests_for('/slow/shared'), [200])
+
+    def test_aborting_one_caller_keeps_shared_request(self):
+        self.assertEqual(self.out['abort']['aborted'], {"error": "AbortError"})
+        self.assertEqual(self.out['abort']['completed'], {"value": {"path": "/slow/abort"}})
+        self.assertEqual(self.out['abort']['stats']['requests'], 1)
+        self.assertEqual(self.requests_for('/slow/abort'), [200])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+# 离线仓库测试：用本地的假 registry 与假 Electron 镜像填充仓库，再在禁止联网的情况下用真实的 npm 安装
+import hashlib
+import io
+import json
+import os
+import shutil
+import socket
+import sys
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import create_electron_project as scaffold  # noqa: E402
+
+ELECTRON_VERSION = '1.0.0'
+PLAN = {"dependencies": {}, "devDependencies": {"electron": ELECTRON_VERSION}}
+
+# 假的 electron 包：postinstall 与真实的 install.js 一样，按 @electron/get 的缓存布局查找二进制 zip，找不到即失败
+INSTALL_JS = r'''
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+const { version } = require('./package.json');
+const mirror = process.env.ELECTRON_MIRROR;
+const dir = crypto.createHash('sha256').update(`${mirror}v${version}`).digest('hex');
+const zip = path.join(process.env.electron_config_cache, dir, `electron-v${version}-${process.platform}-${process.env.TEST_ELECTRON_ARCH}.zip`);
+fs.copyFileSync(zip, path.join(__dirname, 'dist.zip'));
+'''
+
+
+def add_file(tar, name, content):
+    data = content.encode('utf-8')
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    tar.addfile(info, io.BytesIO(data))
+
+
+def disabled_connect(*args, **kwargs):
+    raise OSError("测试中禁止联网")
+
+
+@unittest.skipUnless(shutil.which('npm'), "需要 npm")
+class OfflineStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp(prefix='store-test-'))
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+        # 假 registry 中的 electron tarball 与对应的 lockfile
+        registry = self.tmp / 'registry'
+        registry.mkdir()
+        tarball = registry / f"electron-{ELECTRON_VERSION}.tgz"
+        with tarfile.open(tarball, 'w:gz') as tar:
+            add_file(tar, 'package/package.json', json.dumps({
+                "name": "electron", "version": ELECTRON_VERSION, "scripts": {"postinstall": "node install.js"}
+            }))
+            add_file(tar, 'package/install.js', INSTALL_JS)
+        self.lock = {
+            "name": "electron-lock-plan",
+            "lockfileVersion": 3,
+            "requires": True,
+            "packages": {
+                "": {"name": "electron-lock-plan", "devDependencies": PLAN['devDependencies']},
+                "node_modules/electron": {
+                    "version": ELECTRON_VERSION,
+                    "resolved": tarball.as_uri(),
+                    "integrity": scaffold.compute_integrity(tarball),
+                    "dev": True,
+                    "hasInstallScript": True
+                }
+            }
+        }
+
+        # 假 Electron 镜像：v<版本>/ 下的二进制 zip 与 SHASUMS256.txt
+        self.mirror = self.tmp / 'mirror'
+        release = self.mirror / f"v{ELECTRON_VERSION}"
+        release.mkdir(parents=True)
+        zip_name = scaffold.electron_zip_name(ELECTRON_VERSION)
+        with zipfile.ZipFile(release / zip_name, 'w') as archive:
+            archive.writestr('electron', 'binary')
+        digest = hashlib.sha256((release / zip_name).read_bytes()).hexdigest()
+        (release / 'SHASUMS256.txt').write_text(f"{digest} *{zip_name}\n", encoding='utf-8')
+
+    def test_install_from_prepopulated_store_without_network(self):
+        store = self.tmp / 'store'
+        mirror = self.mirror.as_uri() + '/'
+        with mock.patch.object(scaffold, 'ELECTRON_MIRROR', mirror), \
+                mock.patch.object(scaffold, 'resolve_lock', return_value=self.lock):
+            scaffold.fill_package_store(store, PLAN)
+            cached = scaffold.electron_cache_dir(store, ELECTRON_VERSION)[0]
+            self.assertTrue((cached / scaffold.electron_zip_name(ELECTRON_VERSION)).exists())
+            self.assertTrue((cached / 'SHASUMS256.txt').exists())
+
+            # 删除假 registry 与镜像，并让 Python 与 npm 都无法联网
+            shutil.rmtree(self.tmp / 'registry')
+            shutil.rmtree(self.mirror)
+            project = self.tmp / 'app'
+            project.mkdir()
+            (project / 'package.json').write_text(json.dumps({
+                "name": "offline-app", "version": "1.0.0", **PLAN
+            }), encoding='utf-8')
+            with mock.patch.object(socket.socket, 'connect', disabled_connect):
+                command, env = scaffold.prepare_store_install(project, store, 'offline-app', PLAN)
+                arch = scaffold.electron_zip_name(ELECTRON_VERSION).rsplit('-', 1)[1][:-len('.zip')]
+                scaffold.run_command(command, cwd=project, env={
+                    **env,
+                    'TEST_ELECTRON_ARCH': arch,
+                    'npm_config_registry': 'http://127.0.0.1:9/',
+                    'npm_config_cache': str(self.tmp / 'npm-cache'),
+                    'npm_config_fetch_retries': '0'
+                })
+
+        self.assertTrue((project / 'node_modules' / 'electron' / 'dist.zip').exists())
+
+    def test_store_without_electron_binary_is_incomplete(self):
+        store = self.tmp / 'store'
+        with mock.patch.object(scaffold, 'ELECTRON_MIRROR', self.mirror.as_uri() + '/'), \
+                mock.patch.object(scaffold, 'resolve_lock', return_value=self.lock):
+            scaffold.fill_package_store(store, PLAN)
+            shutil.rmtree(store / 'electron')
+            with self.assertRaises(scaffold.ScaffoldError):
+                scaffold.prepare_store_install(self.tmp, store, 'offline-app', PLAN)
+
+    def test_refilled_tarball_replaces_stale_index_entry(self):
+        # 同一版本重新发布后 integrity 变化，再次填充时索引必须指向新的 tarball
+        store = self.tmp / 'store'
+        tarball = self.tmp / 'registry' / f"electron-{ELECTRON_VERSION}.tgz"
+        with mock.patch.object(scaffold, 'ELECTRON_MIRROR', self.mirror.as_uri() + '/'), \
+                mock.patch.object(scaffold, 'resolve_lock', return_value=self.lock):
+            scaffold.fill_package_store(store, PLAN)
+            with tarfile.open(tarball, 'w:gz') as tar:
+                add_file(tar, 'package/package.json', json.dumps({"name": "electron", "version": ELECTRON_VERSION}))
+            integrity = scaffold.compute_integrity(tarball)
+            self.lock['packages']['node_modules/electron']['integrity'] = integrity
+            scaffold.fill_package_store(store, PLAN)
+
+            index = scaffold.load_store_index(store)
+            self.assertEqual(index[f"electron@{ELECTRON_VERSION}"], integrity)
+            lock = scaffold.resolve_from_store(store, 'offline-app', PLAN)
+            resolved = lock['packages']['node_modules/electron']['resolved']
+            self.assertEqual(resolved, 'file:' + scaffold.store_tarball_path(store, integrity).resolve().as_posix())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+# --update 测试：在假的 node/npm 工具链（benchmarks/fake_toolchain）下创建并更新项目
+import contextlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+FAKE_TOOLCHAIN = REPO_DIR / 'benchmarks' / 'fake_toolchain'
+
+sys.path.insert(0, str(REPO_DIR))
+import create_electron_project as scaffold  # noqa: E402
+
+
+class UpdateProjectTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp(prefix='update-test-'))
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        env = mock.patch.dict(os.environ, {
+            'PATH': f"{FAKE_TOOLCHAIN}{os.pathsep}{os.environ.get('PATH', '')}",
+            'FAKE_NPM_LATENCY': '0',
+            'FAKE_NPM_PACKAGES': '5'
+        })
+        env.start()
+        self.addCleanup(env.stop)
+
+    def run_main(self, *argv):
+        # 工具链、lockfile、快照、离线仓库与图标缓存都放在临时目录中，不读写用户自己的 ~/.electron-scaffold
+        argv = list(argv) + ['--toolchain-cache', str(self.tmp / 'toolchain.json'), '--lock-cache', str(self.tmp / 'locks'),
+                             '--snapshots', str(self.tmp / 'snapshots'), '--store', str(self.tmp / 'store'),
+                             '--icon-cache', str(self.tmp / 'icons')]
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            scaffold.main(argv)
+
+    def test_user_dependency_survives_dependency_plan_change(self):
+        self.run_main('--output-dir', str(self.tmp / 'out'), '--name', 'app')
+        project = self.tmp / 'out' / 'app'
+        # 第一次安装已经保存了依赖计划的快照，更新时不能用它覆盖用户添加的依赖
+        self.assertTrue(any((self.tmp / 'snapshots').iterdir()))
+
+        package_json = project / 'package.json'
+        package = json.loads(package_json.read_text(encoding='utf-8'))
+        package['dependencies']['left-pad'] = '1.3.0'
+        package_json.write_text(json.dumps(package, indent=2), encoding='utf-8')
+        # 模拟项目由旧的依赖计划生成
+        manifest_path = project / scaffold.MANIFEST_NAME
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        manifest['dependency_plan'] = 'older-plan'
+        manifest_path.write_text(json.dumps(manifest), encoding='utf-8')
+
+        self.run_main('--update', str(project))
+
+        package = json.loads(package_json.read_text(encoding='utf-8'))
+        self.assertEqual(package['dependencies']['left-pad'], '1.3.0')
+        self.assertTrue((project / 'node_modules' / 'left-pad' / 'package.json').exists())
+        self.assertTrue((project / 'node_modules' / 'electron').is_dir())
+
+    def test_modified_main_keeps_feature_files_it_loads(self):
+        self.run_main('--output-dir', str(self.tmp / 'out'), '--name', 'app')
+        project = self.tmp / 'out' / 'app'
+        main_js = project / 'main.js'
+        main_js.write_text(main_js.read_text(encoding='utf-8') + '\n// 用户修改\n', encoding='utf-8')
+        channels = (project / 'ipc-channels.js').read_text(encoding='utf-8')
+
+        self.run_main('--update', str(project), '--no-compute-pool')
+
+        # 修改过的 main.js 仍会加载计算线程池，它依赖的文件与旧的通道表都必须保留
+        for rel_path in ('compute-pool.js', 'compute-worker.js', 'static/js/compute-jobs.js'):
+            self.assertTrue((project / rel_path).exists(), rel_path)
+        self.assertEqual((project / 'ipc-channels.js').read_text(encoding='utf-8'), channels)
+        self.assertIn('// 用户修改', main_js.read_text(encoding='utf-8'))
+        # 冲突解决前保留旧哈希，下次更新仍会报告
+        manifest = json.loads((project / scaffold.MANIFEST_NAME).read_text(encoding='utf-8'))
+        self.assertIn('compute-pool.js', manifest['files'])
+
+
+if __name__ == '__main__':
+    unittest.main()